@@ -0,0 +1,100 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Tests for the TU Graz MRI operators."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.contrib.datasets.mri.tugraz import MultiCoilFourierOperator
+from odl.util.testutils import (
+    all_almost_equal, noise_array, noise_element, simple_fixture)
+
+
+# --- pytest fixtures --- #
+
+
+dtype = simple_fixture('dtype', ['float64', 'complex128'])
+use_mask = simple_fixture('use_mask', [False, True])
+
+
+# --- helper functions --- #
+
+
+def _coil_data(space, num_coils=3):
+    """Return complex sensitivities and a random mask for ``space``."""
+    sens_space = odl.cn((num_coils,) + space.shape)
+    sens = noise_array(sens_space)
+    mask = noise_array(odl.rn(space.shape)) > 0
+    return sens, mask
+
+
+# --- MultiCoilFourierOperator --- #
+
+
+def test_multi_coil_fourier_call(dtype, use_mask):
+    """Compare with the Fourier transform of each coil image."""
+    space = odl.uniform_discr([-1, -2], [1, 2], (6, 8), dtype=dtype)
+    sens, mask = _coil_data(space)
+    if not use_mask:
+        mask = None
+    op = MultiCoilFourierOperator(space, sens, mask)
+    assert op.num_coils == len(sens)
+
+    ft = odl.trafos.FourierTransform(space.complex_space)
+    x = noise_element(space)
+    y = op(x)
+    for c in range(op.num_coils):
+        expected = ft(ft.domain.element(sens[c] * x.asarray()))
+        if mask is not None:
+            expected *= mask
+        assert all_almost_equal(y[c], expected)
+
+
+def test_multi_coil_fourier_adjoint(dtype, use_mask):
+    """Verify ``<A x, y> = <x, A^* y>`` and compare with the matrix."""
+    space = odl.uniform_discr([-1, -2], [1, 2], (6, 8), dtype=dtype)
+    sens, mask = _coil_data(space)
+    if not use_mask:
+        mask = None
+    op = MultiCoilFourierOperator(space, sens, mask)
+
+    x = noise_element(space)
+    y = noise_element(op.range)
+    inner_range = op(x).inner(y)
+    if space.is_real:
+        # The domain is real, hence only the real part is preserved
+        inner_range = inner_range.real
+    assert inner_range == pytest.approx(x.inner(op.adjoint(y)))
+    assert op.adjoint.adjoint is op
+
+    # Weighted conjugate transpose of the matrix of `op`
+    basis = np.eye(space.size).reshape((space.size,) + space.shape)
+    matrix = np.array([op(b).asarray().ravel() for b in basis]).T
+    scaling = op.range[0].weighting.const / space.weighting.const
+    expected = scaling * matrix.conj().T.dot(y.asarray().ravel())
+    if space.is_real:
+        expected = expected.real
+    assert all_almost_equal(op.adjoint(y), expected.reshape(space.shape))
+
+
+def test_multi_coil_fourier_bad_input():
+    space = odl.uniform_discr([-1, -1], [1, 1], (4, 4), dtype=complex)
+    with pytest.raises(TypeError):
+        MultiCoilFourierOperator(odl.cn((4, 4)), np.ones((2, 4, 4)))
+    with pytest.raises(ValueError):
+        MultiCoilFourierOperator(space, np.ones((2, 4, 5)))
+    with pytest.raises(ValueError):
+        MultiCoilFourierOperator(space, np.ones((2, 4, 4)),
+                                 mask=np.ones((3, 4, 4)))
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
@@ -19,7 +19,8 @@ from odl.util.testutils import simple_fixture, noise_element
 
 fft_impl = simple_fixture('fft_impl',
                           [odl.util.testutils.never_skip('numpy'),
-                           odl.util.testutils.skip_if_no_pyfftw('pyfftw')])
+                           odl.util.testutils.skip_if_no_pyfftw('pyfftw'),
+                           odl.util.testutils.skip_if_no_scipy_fft('scipy')])
 
 space = simple_fixture('space',
                        [odl.rn(3),
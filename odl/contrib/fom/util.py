@@ -11,11 +11,21 @@
 import numpy as np
 
 from odl.discr import uniform_discr
-from odl.trafos.backends import PYFFTW_AVAILABLE
+from odl.trafos.backends import PYFFTW_AVAILABLE, SCIPY_FFT_AVAILABLE
 
 __all__ = ()
 
 
+def _default_fft_impl():
+    """Return the fastest available FFT backend."""
+    if SCIPY_FFT_AVAILABLE:
+        return 'scipy'
+    elif PYFFTW_AVAILABLE:
+        return 'pyfftw'
+    else:
+        return 'numpy'
+
+
 def filter_image_sep2d(image, fh, fv, impl='numpy', padding=None):
     """Filter an image with a separable filter.
 
@@ -26,10 +36,11 @@ def filter_image_sep2d(image, fh, fv, impl='numpy', padding=None):
     fh, fv : 1D array-like
         Horizontal (axis 0) and vertical (axis 1) filters. Their sizes
         can be at most the image sizes in the respective axes.
-    impl : {'numpy', 'pyfftw'}, optional
+    impl : {'numpy', 'pyfftw', 'scipy'}, optional
         FFT backend to use. The ``pyfftw`` backend requires the
-        ``pyfftw`` package to be installed. It is usually significantly
-        faster than the NumPy backend.
+        ``pyfftw`` package to be installed, and the ``scipy`` backend
+        requires SciPy 1.6 or later. Both are multithreaded and usually
+        significantly faster than the NumPy backend.
     padding : positive int, optional
         Amount of zeros added to the left and right of the image in all
         axes before FFT. This helps avoiding wraparound artifacts due to
@@ -118,6 +129,28 @@ def filter_image_sep2d(image, fh, fv, impl='numpy', padding=None):
         if conv.dtype != image.dtype:
             conv = conv.astype(image.dtype)
 
+    elif impl == 'scipy':
+        if not SCIPY_FFT_AVAILABLE:
+            raise ValueError(
+                '`scipy.fft` is not available; you need SciPy 1.6 or later '
+                'to use the scipy backend')
+
+        import scipy.fft
+
+        # The padded image is a copy if `padding != 0`, and the image is
+        # not needed after the forward transform otherwise, either
+        image_ft = scipy.fft.rfftn(image_padded, workers=-1,
+                                   overwrite_x=padding != 0)
+        fh_ft = scipy.fft.fft(fh, overwrite_x=True)
+        fv_ft = scipy.fft.rfft(fv, overwrite_x=True)
+
+        image_ft *= fh_ft[:, None]
+        image_ft *= fv_ft[None, :]
+        conv = scipy.fft.irfftn(image_ft, s=image_padded.shape, workers=-1,
+                                overwrite_x=True)
+        if conv.dtype != image.dtype:
+            conv = conv.astype(image.dtype)
+
     elif impl == 'pyfftw':
         if not PYFFTW_AVAILABLE:
             raise ValueError(
@@ -262,7 +295,7 @@ def haarpsi_similarity_map(img1, img2, axis, c, a):
     """
     # TODO: generalize for nD
     import scipy.special
-    impl = 'pyfftw' if PYFFTW_AVAILABLE else 'numpy'
+    impl = _default_fft_impl()
 
     # Haar wavelet filters for levels 1 and 2
     dec_lo_lvl1 = np.array([np.sqrt(2), np.sqrt(2)])
@@ -370,7 +403,7 @@ def haarpsi_weight_map(img1, img2, axis):
     Assessment*. arXiv:1607.06140 [cs], Jul. 2016.
     """
     # TODO: generalize for nD
-    impl = 'pyfftw' if PYFFTW_AVAILABLE else 'numpy'
+    impl = _default_fft_impl()
 
     # Haar wavelet filters for level 3
     dec_lo_lvl3 = np.repeat([np.sqrt(2), np.sqrt(2)], 4)
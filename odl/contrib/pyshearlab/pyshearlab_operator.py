@@ -8,14 +8,233 @@
 
 """ODL integration with pyshearlab."""
 
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import os
+import tempfile
+from threading import Lock
 
 import odl
 import numpy as np
 import pyshearlab
-from threading import Lock
+from odl.trafos.backends import SCIPY_FFT_AVAILABLE
+
+if SCIPY_FFT_AVAILABLE:
+    from scipy.fft import fft2, ifft2, fftshift, ifftshift
+else:
+    from numpy.fft import fft2, ifft2, fftshift, ifftshift
+
+
+__all__ = ('PyShearlabOperator', 'shearlet_system', 'shearlet_cache_dir',
+           'clear_shearlet_cache')
+
+
+# In-memory cache of shearlet systems, shared by all operators
+_SHEARLET_CACHE = {}
+_SHEARLET_CACHE_LOCK = Lock()
+
+_THREAD_POOL = None
+_THREAD_POOL_LOCK = Lock()
+
+
+def _thread_pool():
+    """Return a thread pool shared by all shearlet operators."""
+    global _THREAD_POOL
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None:
+            _THREAD_POOL = ThreadPool(cpu_count())
+    return _THREAD_POOL
+
+
+def shearlet_cache_dir():
+    """Return the directory for cached shearlet systems.
+
+    The directory is ``shearlets`` in the ODL home directory, given by
+    the ``ODL_HOME`` environment variable and defaulting to ``~/.odl``.
+    """
+    base_odl_dir = os.environ.get('ODL_HOME',
+                                  os.path.expanduser(os.path.join('~',
+                                                                  '.odl')))
+    return os.path.join(base_odl_dir, 'shearlets')
+
+
+def clear_shearlet_cache():
+    """Remove all shearlet systems from the in-memory cache.
+
+    Files in `shearlet_cache_dir` are not affected.
+    """
+    with _SHEARLET_CACHE_LOCK:
+        _SHEARLET_CACHE.clear()
+
+
+def _save_array(arr, fname):
+    """Save ``arr`` atomically to the ``.npy`` file ``fname``."""
+    fd, tmp_fname = tempfile.mkstemp(dir=os.path.dirname(fname),
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, arr)
+        os.rename(tmp_fname, fname)
+    except Exception:
+        os.remove(tmp_fname)
+        raise
+
+
+def _load_system(filt_fname, meta_fname):
+    """Load a cached system, return ``None`` if that is not possible."""
+    try:
+        shearlets = np.load(filt_fname, mmap_mode='r')
+        with np.load(meta_fname) as meta_file:
+            meta = {key: meta_file[key][()] for key in meta_file.files}
+    except (IOError, OSError, ValueError):
+        return None
+    return _finalize_system(shearlets, meta)
+
+
+def _save_system(shearlets, meta, filt_fname, meta_fname):
+    """Store a system, silently skipping the cache if that fails."""
+    try:
+        cache_dir = os.path.dirname(filt_fname)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        _save_array(shearlets, filt_fname)
+        # Written last since its presence marks the entry as complete
+        fd, tmp_fname = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **meta)
+        os.rename(tmp_fname, meta_fname)
+    except (IOError, OSError):
+        pass
+
+
+def _finalize_system(shearlets, meta):
+    """Return a pyshearlab system dictionary from its stored parts.
+
+    ``shearlets`` has the shearlet index in the first axis. The dual
+    frame weights are recomputed from ``shearlets`` such that the
+    inverse is exact also for the single precision filters.
+    """
+    system = dict(meta)
+    system['shearlets'] = np.moveaxis(shearlets, 0, -1)
+    system['dualFrameWeights'] = np.sum(
+        np.abs(shearlets.astype('complex128')) ** 2, axis=0)
+    return system
+
+
+def shearlet_system(shape, num_scales, disk_cache=True):
+    """Return the pyshearlab shearlet system, using caches if possible.
+
+    Systems are kept in memory for the lifetime of the process and, if
+    ``disk_cache`` is ``True``, in `shearlet_cache_dir`. The filters are
+    stored in single precision and memory-mapped when loaded from disk.
+
+    Parameters
+    ----------
+    shape : sequence of 2 ints
+        Shape of the images to be transformed.
+    num_scales : nonnegative int
+        Number of scales of the shearlet system.
+    disk_cache : bool, optional
+        If ``True``, load the system from and store it in
+        `shearlet_cache_dir`.
+
+    Returns
+    -------
+    system : dict
+        Shearlet system in the format of
+        ``pyshearlab.SLgetShearletSystem2D``, with the filters in
+        ``system['shearlets']`` of shape ``shape + (nShearlets,)``.
+    """
+    rows, cols = (int(n) for n in shape)
+    num_scales = int(num_scales)
+    key = (rows, cols, num_scales)
+
+    with _SHEARLET_CACHE_LOCK:
+        if key in _SHEARLET_CACHE:
+            return _SHEARLET_CACHE[key]
 
+        name = 'shearlets_{}x{}_{}'.format(*key)
+        filt_fname = os.path.join(shearlet_cache_dir(), name + '.npy')
+        meta_fname = os.path.join(shearlet_cache_dir(), name + '_meta.npz')
 
-__all__ = ('PyShearlabOperator',)
+        system = None
+        if disk_cache and os.path.exists(meta_fname):
+            system = _load_system(filt_fname, meta_fname)
+
+        if system is None:
+            meta = pyshearlab.SLgetShearletSystem2D(0, rows, cols, num_scales)
+            shearlets = np.moveaxis(meta.pop('shearlets'), -1, 0)
+            meta.pop('dualFrameWeights')
+            if np.any(np.iscomplex(shearlets)):
+                shearlets = shearlets.astype('complex64')
+            else:
+                shearlets = shearlets.real.astype('float32')
+            shearlets = np.ascontiguousarray(shearlets)
+            if disk_cache:
+                _save_system(shearlets, meta, filt_fname, meta_fname)
+            system = _finalize_system(shearlets, meta)
+
+        _SHEARLET_CACHE[key] = system
+        return system
+
+
+def _centered_fft2(x):
+    """Return the FFT of ``x`` with the origin in the array center."""
+    return fftshift(fft2(ifftshift(x)))
+
+
+def _centered_ifft2(x_freq):
+    """Return the inverse of `_centered_fft2`."""
+    return fftshift(ifft2(ifftshift(x_freq)))
+
+
+def _shearlet_analysis(x, system, invert_weights=False):
+    """Return all shearlet coefficients of ``x``.
+
+    This uses one FFT of ``x`` and one multiplication and inverse FFT
+    per shearlet, distributed over a thread pool. The result has the
+    shearlet index in the first axis.
+
+    With ``invert_weights=True``, the input is divided by the dual frame
+    weights in frequency space, which gives the adjoint of the inverse.
+    """
+    filters = np.moveaxis(system['shearlets'], -1, 0)
+    x_freq = _centered_fft2(x)
+    if invert_weights:
+        x_freq /= system['dualFrameWeights']
+    result = np.empty(filters.shape, dtype=x_freq.real.dtype)
+
+    def analyze(j):
+        result[j] = _centered_ifft2(x_freq * np.conj(filters[j])).real
+
+    _thread_pool().map(analyze, range(len(filters)))
+    return result
+
+
+def _shearlet_synthesis(coeffs, system, invert_weights=False):
+    """Return the image synthesized from shearlet coefficients.
+
+    ``coeffs`` has the shearlet index in the first axis. The shearlets
+    are split into one chunk per thread, and the partial sums in
+    frequency space are added up before a single inverse FFT.
+
+    With ``invert_weights=False``, this is the adjoint of
+    `_shearlet_analysis`, otherwise it is the inverse.
+    """
+    filters = np.moveaxis(system['shearlets'], -1, 0)
+    chunks = np.array_split(np.arange(len(filters)),
+                            min(cpu_count(), len(filters)))
+
+    def synthesize(idcs):
+        partial = np.zeros(filters.shape[1:], dtype=complex)
+        for j in idcs:
+            partial += _centered_fft2(coeffs[j]) * filters[j]
+        return partial
+
+    x_freq = sum(_thread_pool().map(synthesize, chunks))
+    if invert_weights:
+        x_freq /= system['dualFrameWeights']
+    return _centered_ifft2(x_freq).real
 
 
 class PyShearlabOperator(odl.Operator):
@@ -24,9 +243,12 @@ class PyShearlabOperator(odl.Operator):
 
     This is the non-compact shearlet transform implemented using the fourier
     transform.
+
+    The shearlet system is only computed once per image shape and number
+    of scales and then taken from a cache, see `shearlet_system`.
     """
 
-    def __init__(self, space, num_scales):
+    def __init__(self, space, num_scales, disk_cache=True):
         """Initialize a new instance.
 
         Parameters
@@ -37,6 +259,10 @@ class PyShearlabOperator(odl.Operator):
         num_scales : nonnegative `int`
             The number of scales for the shearlet transform, higher numbers
             mean better edge resolution but more computational burden.
+        disk_cache : bool, optional
+            If ``True``, the shearlet system is also cached on disk in
+            `shearlet_cache_dir`, which speeds up the creation of
+            operators in new processes.
 
         Examples
         --------
@@ -45,17 +271,14 @@ class PyShearlabOperator(odl.Operator):
         >>> space = odl.uniform_discr([-1, -1], [1, 1], [128, 128])
         >>> shearlet_transform = PyShearlabOperator(space, num_scales=2)
         """
-        self.shearlet_system = pyshearlab.SLgetShearletSystem2D(
-            0, space.shape[0], space.shape[1], num_scales)
-        range = space ** self.shearlet_system['nShearlets']
-        self.mutex = Lock()
+        self.shearlet_system = shearlet_system(space.shape, num_scales,
+                                               disk_cache=disk_cache)
+        range = space ** int(self.shearlet_system['nShearlets'])
         super(PyShearlabOperator, self).__init__(space, range, True)
 
     def _call(self, x):
         """Return ``self(x)``."""
-        with self.mutex:
-            result = pyshearlab.SLsheardec2D(x, self.shearlet_system)
-            return np.moveaxis(result, -1, 0)
+        return _shearlet_analysis(x.asarray(), self.shearlet_system)
 
     @property
     def adjoint(self):
@@ -93,9 +316,7 @@ class PyShearlabOperatorAdjoint(odl.Operator):
 
     def _call(self, x):
         """Return ``self(x)``."""
-        with self.op.mutex:
-            x = np.moveaxis(x, 0, -1)
-            return pyshearlab.SLshearadjoint2D(x, self.op.shearlet_system)
+        return _shearlet_synthesis(x.asarray(), self.op.shearlet_system)
 
     @property
     def adjoint(self):
@@ -133,9 +354,8 @@ class PyShearlabOperatorInverse(odl.Operator):
 
     def _call(self, x):
         """Return ``self(x)``."""
-        with self.op.mutex:
-            x = np.moveaxis(x, 0, -1)
-            return pyshearlab.SLshearrec2D(x, self.op.shearlet_system)
+        return _shearlet_synthesis(x.asarray(), self.op.shearlet_system,
+                                   invert_weights=True)
 
     @property
     def adjoint(self):
@@ -173,9 +393,8 @@ class PyShearlabOperatorAdjointInverse(odl.Operator):
 
     def _call(self, x):
         """Return ``self(x)``."""
-        with self.op.mutex:
-            result = pyshearlab.SLshearrecadjoint2D(x, self.op.shearlet_system)
-            return np.moveaxis(result, -1, 0)
+        return _shearlet_analysis(x.asarray(), self.op.shearlet_system,
+                                  invert_weights=True)
 
     @property
     def adjoint(self):
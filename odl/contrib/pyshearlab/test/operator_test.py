@@ -53,5 +53,26 @@ def test_operator(dtype, shape):
     assert all_almost_equal(adjadjinv, phantom, places=5)
 
 
+def test_shearlet_system_cache(monkeypatch, tmpdir):
+    """Test in-memory and on-disk caching of shearlet systems."""
+    monkeypatch.setenv('ODL_HOME', str(tmpdir))
+    odl.contrib.pyshearlab.clear_shearlet_cache()
+
+    space = odl.uniform_discr([-1, -1], [1, 1], (64, 64))
+    op = odl.contrib.pyshearlab.PyShearlabOperator(space, num_scales=2)
+    op2 = odl.contrib.pyshearlab.PyShearlabOperator(space, num_scales=2)
+    assert op2.shearlet_system is op.shearlet_system
+    assert tmpdir.join('shearlets').listdir()
+
+    # Reload from disk
+    odl.contrib.pyshearlab.clear_shearlet_cache()
+    op3 = odl.contrib.pyshearlab.PyShearlabOperator(space, num_scales=2)
+    assert op3.shearlet_system is not op.shearlet_system
+
+    phantom = odl.phantom.shepp_logan(space, True)
+    assert all_almost_equal(op3(phantom), op(phantom))
+    assert all_almost_equal(op3.inverse(op(phantom)), op.inverse(op(phantom)))
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
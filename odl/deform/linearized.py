@@ -11,16 +11,17 @@
 from __future__ import print_function, division, absolute_import
 import numpy as np
 
-from odl.discr import DiscreteLp, Gradient, Divergence
-from odl.operator import Operator, PointwiseInner
+from odl.discr import DiscreteLp, Gradient, Divergence, InterpolationPlan
+from odl.operator import Operator, OpRangeError, PointwiseInner
 from odl.space import ProductSpace
-from odl.util import signature_string, indent
+from odl.util import signature_string, indent, writable_array
 
 
 __all__ = ('LinDeformFixedTempl', 'LinDeformFixedDisp', 'linear_deform')
 
 
-def linear_deform(template, displacement, out=None):
+def linear_deform(template, displacement, out=None, tile_size=None,
+                  threads=1):
     """Linearized deformation of a template with a displacement field.
 
     The function maps a given template ``I`` and a given displacement
@@ -37,6 +38,13 @@ def linear_deform(template, displacement, out=None):
         Array to which the function values of the deformed template
         are written. It must have the same shape as ``template`` and
         a data type compatible with ``template.dtype``.
+    tile_size : positive int, optional
+        Maximum number of points that are deformed at once. The
+        evaluation is done in slabs along the first axis, such that
+        no temporary array is larger than ``tile_size`` points.
+        Default: ``2 ** 18``
+    threads : positive int, optional
+        Number of threads used to process the slabs.
 
     Returns
     -------
@@ -70,11 +78,136 @@ def linear_deform(template, displacement, out=None):
     >>> linear_deform(template, displacement_field)
     array([ 0. ,  0. ,  1. ,  0.5,  0. ])
     """
-    image_pts = template.space.points()
-    for i, vi in enumerate(displacement):
-        image_pts[:, i] += vi.asarray().ravel()
-    values = template.interpolation(image_pts.T, out=out, bounds_check=False)
-    return values.reshape(template.space.shape)
+    if out is None:
+        out = np.empty(template.space.shape, dtype=template.dtype)
+    engine = _LinDeformEngine(template.space, displacement,
+                              tile_size=tile_size, threads=threads)
+    engine([template], [out])
+    return out
+
+
+class _LinDeformEngine(object):
+
+    """Tile-wise evaluation of linearized deformations.
+
+    The grid of the template space is split into slabs along the first
+    axis. For each slab, the displaced points are computed from the
+    coordinate vectors of the grid and the corresponding part of the
+    displacement, and an `InterpolationPlan` for these points is used
+    to write the deformed values directly into the output.
+
+    This way, the full ``(N, ndim)`` array of grid points is never
+    created, and the interpolation weights of a slab can be shared by
+    several arrays that are deformed with the same displacement.
+    """
+
+    def __init__(self, space, displacement, tile_size=None, threads=1,
+                 cache_plan=False):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `DiscreteLp`
+            Template space whose elements are deformed.
+        displacement : sequence of `array-like`
+            Components of the displacement field, each with shape
+            ``space.shape``.
+        tile_size : positive int, optional
+            Maximum number of points per slab. The slabs contain at
+            least one index along the first axis.
+            Default: ``2 ** 18``
+        threads : positive int, optional
+            Number of threads used to process the slabs.
+        cache_plan : bool, optional
+            If ``True``, keep the interpolation plans of all slabs for
+            reuse in subsequent calls. This trades the memory for one
+            sparse interpolation matrix for faster repeated evaluation.
+        """
+        if tile_size is None:
+            tile_size = 2 ** 18
+        tile_size, tile_size_in = int(tile_size), tile_size
+        if tile_size <= 0:
+            raise ValueError('`tile_size` must be positive, got {}'
+                             ''.format(tile_size_in))
+        threads, threads_in = int(threads), threads
+        if threads <= 0:
+            raise ValueError('`threads` must be positive, got {}'
+                             ''.format(threads_in))
+
+        self.space = space
+        self.displacement = [np.asarray(vi) for vi in displacement]
+        if len(self.displacement) != space.ndim:
+            raise ValueError('`displacement` must have {} components, got {}'
+                             ''.format(space.ndim, len(self.displacement)))
+        self.threads = threads
+        self.cache_plan = bool(cache_plan)
+
+        # Slabs along the first axis with at most `tile_size` points
+        slab_len = max(tile_size // int(np.prod(space.shape[1:])), 1)
+        self.slabs = [slice(i, min(i + slab_len, space.shape[0]))
+                      for i in range(0, space.shape[0], slab_len)]
+        self.plans = [None] * len(self.slabs)
+
+    def _plan(self, i):
+        """Return the interpolation plan for the ``i``-th slab."""
+        if self.plans[i] is not None:
+            return self.plans[i]
+
+        slab = self.slabs[i]
+        slab_shape = (slab.stop - slab.start,) + self.space.shape[1:]
+        coord_vecs = self.space.grid.coord_vectors
+        points = np.empty((self.space.ndim,) + slab_shape,
+                          dtype=self.space.real_dtype)
+        for j, (cvec, vj) in enumerate(zip(coord_vecs, self.displacement)):
+            # Broadcast the coordinate vector along all other axes
+            bcast = [None] * self.space.ndim
+            bcast[j] = slab if j == 0 else slice(None)
+            np.add(vj[slab], cvec[tuple(bcast)], out=points[j])
+
+        plan = InterpolationPlan(self.space, points)
+        if self.cache_plan:
+            self.plans[i] = plan
+        return plan
+
+    def __call__(self, values, out):
+        """Deform all ``values`` and write the results to ``out``.
+
+        Parameters
+        ----------
+        values : sequence of `array-like`
+            Arrays of shape ``space.shape`` that are deformed.
+        out : sequence of `array-like`
+            Arrays of shape ``space.shape`` to which the deformed values
+            are written, one for each array in ``values``.
+        """
+        values = [np.asarray(v) for v in values]
+        # Equivalent to nested ``with writable_array(o) as arr`` blocks for
+        # all ``o`` in ``out``, such that the results are written back
+        writers = [writable_array(o) for o in out]
+        out_arrs = [w.__enter__() for w in writers]
+
+        def deform_slab(i):
+            plan = self._plan(i)
+            slab = self.slabs[i]
+            for val, arr in zip(values, out_arrs):
+                plan(val, out=arr[slab])
+
+        try:
+            if self.threads == 1 or len(self.slabs) == 1:
+                for i in range(len(self.slabs)):
+                    deform_slab(i)
+            else:
+                # The slabs are disjoint, so the threads never write to the
+                # same memory
+                from multiprocessing.pool import ThreadPool
+                pool = ThreadPool(self.threads)
+                try:
+                    pool.map(deform_slab, range(len(self.slabs)))
+                finally:
+                    pool.close()
+        finally:
+            for w in writers:
+                w.__exit__(None, None, None)
 
 
 class LinDeformFixedTempl(Operator):
@@ -120,7 +253,7 @@ class LinDeformFixedTempl(Operator):
     i.e., :math:`W_I'(v)^*(J)(x) = J(x) \, \\nabla I(x + v(x))`.
     """
 
-    def __init__(self, template, domain=None):
+    def __init__(self, template, domain=None, **kwargs):
         """Initialize a new instance.
 
         Parameters
@@ -136,6 +269,23 @@ class LinDeformFixedTempl(Operator):
             in displacement and template.
             Default: ``template.space.real_space.tangent_bundle``
 
+        Other Parameters
+        ----------------
+        tile_size : positive int, optional
+            Maximum number of points that are deformed at once, see
+            `linear_deform`.
+        threads : positive int, optional
+            Number of threads used in the evaluation, see `linear_deform`.
+        cache_plan : bool, optional
+            If ``True``, the interpolation indices and weights for the
+            most recently used displacement element are kept, such that
+            evaluation and derivative at the same element share them.
+            This requires a sparse interpolation matrix with up to
+            ``2 ** ndim`` entries per grid point. The cache is keyed on
+            the identity of the element, hence `clear_plan_cache` must
+            be called after modifying it in place.
+            Default: ``False``
+
         Examples
         --------
         Create a simple 1D template to initialize the operator and
@@ -188,17 +338,118 @@ class LinDeformFixedTempl(Operator):
                     'partiton ({!r} != {!r})'
                     ''.format(template.space.partition, domain[0].partition))
 
+        self.__engine_kwargs = {
+            'tile_size': kwargs.pop('tile_size', None),
+            'threads': kwargs.pop('threads', 1),
+            'cache_plan': kwargs.pop('cache_plan', False)}
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments {}'
+                            ''.format(kwargs))
+
         super(LinDeformFixedTempl, self).__init__(
             domain=domain, range=self.template.space, linear=False)
 
+        self.__template_grad = None
+        self.__cached_disp = None
+        self.__cached_engine = None
+
     @property
     def template(self):
         """Fixed template of this deformation operator."""
         return self.__template
 
-    def _call(self, displacement, out=None):
-        """Implementation of ``self(displacement[, out])``."""
-        return linear_deform(self.template, displacement, out)
+    @property
+    def template_grad(self):
+        """Gradient of the template, computed once when first needed."""
+        if self.__template_grad is None:
+            # TODO: allow users to select what method to use here.
+            grad = Gradient(domain=self.range, method='central',
+                            pad_mode='symmetric')
+            self.__template_grad = grad(self.template)
+        return self.__template_grad
+
+    def _engine(self, displacement):
+        """Return the deformation engine for ``displacement``.
+
+        With ``cache_plan=True``, the engine of the last displacement is
+        reused as long as the same element is passed, see
+        `clear_plan_cache`.
+        """
+        if displacement is self.__cached_disp:
+            return self.__cached_engine
+
+        engine = _LinDeformEngine(self.range, displacement,
+                                  **self.__engine_kwargs)
+        if self.__engine_kwargs['cache_plan']:
+            self.__cached_disp = displacement
+            self.__cached_engine = engine
+        return engine
+
+    def clear_plan_cache(self):
+        """Discard the cached interpolation plan.
+
+        With ``cache_plan=True``, the plan is keyed on the identity of the
+        displacement element. This method must therefore be called after
+        the displacement of the last evaluation is modified in place.
+        """
+        self.__cached_disp = None
+        self.__cached_engine = None
+
+    def _call(self, displacement, out):
+        """Implementation of ``self(displacement, out)``."""
+        self._engine(displacement)([self.template], [out])
+
+    def call_and_derivative(self, displacement, out=None):
+        """Return ``self(displacement)`` and the derivative in one pass.
+
+        Both the deformed template and the deformed template gradient,
+        which defines the derivative, are interpolated at the same
+        displaced points. Here this is done in a single pass over the
+        grid, computing the interpolation weights only once.
+
+        Parameters
+        ----------
+        displacement : `domain` `element-like`
+            Point at which the operator and its derivative are evaluated.
+        out : `range` element, optional
+            Element to which the deformed template is written.
+
+        Returns
+        -------
+        deformed_template : `range` element
+            Result of ``self(displacement)``. If ``out`` was given, the
+            returned object is a reference to it.
+        derivative : `PointwiseInner`
+            Result of ``self.derivative(displacement)``.
+
+        Examples
+        --------
+        >>> space = odl.uniform_discr(0, 1, 5, interp='linear')
+        >>> template = space.element([0, 0, 1, 0, 0])
+        >>> op = LinDeformFixedTempl(template)
+        >>> disp_field = [[0, 0, 0, -0.1, 0]]
+        >>> deformed, deriv = op.call_and_derivative(disp_field)
+        >>> print(deformed)
+        [ 0. ,  0. ,  1. ,  0.5,  0. ]
+        >>> print(deriv([[1, 1, 1, 1, 1]]))
+        [ 0.  ,  2.5 ,  0.  , -1.25,  0.  ]
+        """
+        if not self.range.is_real:
+            raise NotImplementedError('derivative not implemented for complex '
+                                      'spaces.')
+
+        displacement = self.domain.element(displacement)
+        if out is None:
+            out = self.range.element()
+        elif out not in self.range:
+            raise OpRangeError('`out` {!r} not an element of the range '
+                               '{!r} of {!r}'.format(out, self.range, self))
+
+        def_grad = self.domain.element()
+        self._engine(displacement)(
+            [self.template] + list(self.template_grad),
+            [out] + list(def_grad))
+        return out, PointwiseInner(self.domain, def_grad)
 
     def derivative(self, displacement):
         """Derivative of the operator at ``displacement``.
@@ -220,14 +471,8 @@ class LinDeformFixedTempl(Operator):
                                       'spaces.')
 
         displacement = self.domain.element(displacement)
-
-        # TODO: allow users to select what method to use here.
-        grad = Gradient(domain=self.range, method='central',
-                        pad_mode='symmetric')
-        grad_templ = grad(self.template)
-        def_grad = self.domain.element(
-            [linear_deform(gf, displacement) for gf in grad_templ])
-
+        def_grad = self.domain.element()
+        self._engine(displacement)(self.template_grad, def_grad)
         return PointwiseInner(self.domain, def_grad)
 
     def __repr__(self):
@@ -271,7 +516,7 @@ class LinDeformFixedDisp(Operator):
     i.e., :math:`W_v^*(I)(x) \\approx \exp(-\mathrm{div}\,v(x))\, I(x - v(x))`.
     """
 
-    def __init__(self, displacement, templ_space=None):
+    def __init__(self, displacement, templ_space=None, **kwargs):
         """Initialize a new instance.
 
         Parameters
@@ -287,6 +532,21 @@ class LinDeformFixedDisp(Operator):
             template.
             Default: ``displacement.space[0]``
 
+        Other Parameters
+        ----------------
+        tile_size : positive int, optional
+            Maximum number of points that are deformed at once, see
+            `linear_deform`.
+        threads : positive int, optional
+            Number of threads used in the evaluation, see `linear_deform`.
+        cache_plan : bool, optional
+            If ``True``, the interpolation indices and weights for the
+            fixed displacement are computed in the first evaluation and
+            reused afterwards. This makes repeated evaluation faster at
+            the cost of storing a sparse interpolation matrix with up to
+            ``2 ** ndim`` entries per grid point.
+            Default: ``False``
+
         Examples
         --------
         Create a simple 1D template to initialize the operator and
@@ -339,15 +599,24 @@ class LinDeformFixedDisp(Operator):
         super(LinDeformFixedDisp, self).__init__(
             domain=templ_space, range=templ_space, linear=True)
         self.__displacement = displacement
+        self.__engine_kwargs = {
+            'tile_size': kwargs.pop('tile_size', None),
+            'threads': kwargs.pop('threads', 1),
+            'cache_plan': kwargs.pop('cache_plan', False)}
+        if kwargs:
+            raise TypeError('got unexpected keyword arguments {}'
+                            ''.format(kwargs))
+        self.__engine = _LinDeformEngine(templ_space, displacement,
+                                         **self.__engine_kwargs)
 
     @property
     def displacement(self):
         """Fixed displacement field of this deformation operator."""
         return self.__displacement
 
-    def _call(self, template, out=None):
-        """Implementation of ``self(template[, out])``."""
-        return linear_deform(template, self.displacement, out)
+    def _call(self, template, out):
+        """Implementation of ``self(template, out)``."""
+        self.__engine([template], [out])
 
     @property
     def inverse(self):
@@ -356,7 +625,8 @@ class LinDeformFixedDisp(Operator):
         Note that this implementation uses an approximation that is only
         valid for small displacements.
         """
-        return LinDeformFixedDisp(-self.displacement, templ_space=self.domain)
+        return LinDeformFixedDisp(-self.displacement, templ_space=self.domain,
+                                  **self.__engine_kwargs)
 
     @property
     def adjoint(self):
@@ -29,7 +29,7 @@ from odl.util import (
 
 __all__ = ('FunctionSpaceMapping',
            'PointCollocation', 'NearestInterpolation', 'LinearInterpolation',
-           'PerAxisInterpolation')
+           'PerAxisInterpolation', 'InterpolationPlan')
 
 _SUPPORTED_INTERP_SCHEMES = ['nearest', 'linear']
 
@@ -619,6 +619,229 @@ class PerAxisInterpolation(FunctionSpaceMapping):
         return '{}(\n{}\n)'.format(self.__class__.__name__, indent(inner_str))
 
 
+class InterpolationPlan(object):
+
+    """Precomputed interpolation of grid values at a fixed set of points.
+
+    The interpolation of values on a grid at given points is a linear
+    mapping, whose matrix has at most ``2 ** ndim`` nonzero entries per
+    point. This class computes the indices and weights of these entries
+    once and stores them as a sparse matrix. Applying the plan to an
+    array of grid values is then a single gather-and-multiply pass,
+    and the adjoint is the corresponding scatter-add.
+
+    This is useful if the same points are used for many interpolations,
+    e.g., when deforming many templates with the same displacement
+    field, or when resampling between fixed grids.
+    """
+
+    def __init__(self, space, points, weight_dtype='float32'):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        space : `DiscreteLp`
+            Space whose elements should be interpolated. Its grid and
+            `DiscreteLp.interp_byaxis` determine the interpolation.
+        points : `array-like` or `meshgrid`
+            Points at which to interpolate. An array must have shape
+            ``(space.ndim, ...)``, where the first axis runs over the
+            coordinates, and the interpolated values have shape
+            ``points.shape[1:]``. For a ``meshgrid``, the values have
+            the broadcast shape of the meshgrid arrays.
+            For 1-dimensional spaces, a 1-dimensional array of points
+            is also accepted.
+        weight_dtype : optional
+            Real floating point data type of the stored interpolation
+            weights. The default ``'float32'`` keeps the plan compact,
+            use ``space.real_dtype`` for full precision.
+
+        Examples
+        --------
+        A plan for linear interpolation between grid points:
+
+        >>> space = odl.uniform_discr(0, 1, 4, interp='linear')
+        >>> space.grid.coord_vectors
+        (array([ 0.125,  0.375,  0.625,  0.875]),)
+        >>> plan = InterpolationPlan(space, [0.25, 0.5, 0.75])
+        >>> plan([1, 2, 4, 8])
+        array([ 1.5,  3. ,  6. ])
+
+        The adjoint distributes values to the grid points:
+
+        >>> plan.adjoint([1, 1, 1])
+        array([ 0.5,  1. ,  1. ,  0.5])
+
+        With nearest neighbor interpolation, only one value is taken
+        per point:
+
+        >>> space = odl.uniform_discr(0, 1, 4, interp='nearest')
+        >>> plan = InterpolationPlan(space, [0.25, 0.5, 0.75])
+        >>> plan([1, 2, 4, 8])
+        array([ 1.,  2.,  4.])
+        """
+        import scipy.sparse
+        from odl.discr.lp_discr import DiscreteLp
+
+        if not isinstance(space, DiscreteLp):
+            raise TypeError('`space` must be a `DiscreteLp` instance, got '
+                            '{!r}'.format(space))
+        self.__weight_dtype = np.dtype(weight_dtype)
+        if not np.issubdtype(self.weight_dtype, np.floating):
+            raise ValueError('`weight_dtype` must be a real floating point '
+                             'data type, got {}'.format(self.weight_dtype))
+
+        ndim = space.ndim
+        if is_valid_input_meshgrid(points, ndim):
+            points = np.broadcast_arrays(*points)
+            out_shape = points[0].shape
+            points = [np.ravel(pts) for pts in points]
+        else:
+            points = np.asarray(points, dtype=float)
+            if ndim == 1 and points.ndim == 1:
+                points = points[None, :]
+            if points.ndim == 0 or len(points) != ndim:
+                raise ValueError('`points` must have shape ({}, ...), got '
+                                 'array with shape {}'
+                                 ''.format(ndim, points.shape))
+            out_shape = points.shape[1:]
+            points = points.reshape([ndim, -1])
+
+        self.__space = space
+        self.__out_shape = out_shape
+
+        coord_vecs = space.grid.coord_vectors
+        indices, norm_distances = _find_indices(coord_vecs, points)
+        npoints = int(np.prod(out_shape))
+
+        if all(interp == 'nearest' for interp in space.interp_byaxis):
+            # Same rules as in `_NearestInterpolator`, one entry per point
+            idcs = tuple(np.where(ndist <= 0.5, idx, idx + 1)
+                         for idx, ndist in zip(indices, norm_distances))
+            cols = np.ravel_multi_index(idcs, space.shape)
+            weights = np.ones(npoints, dtype=self.weight_dtype)
+            nentries = 1
+        else:
+            low_weights, high_weights, edge_indices = (
+                _create_weight_edge_lists(
+                    indices, norm_distances, space.interp_byaxis,
+                    ['left' if interp == 'nearest' else None
+                     for interp in space.interp_byaxis]))
+
+            # One entry per corner of the cell containing the point
+            nentries = 2 ** ndim
+            cols = np.empty((npoints, nentries), dtype=int)
+            weights = np.empty((npoints, nentries), dtype=self.weight_dtype)
+            for j, (lo_hi, edge) in enumerate(
+                    zip(product(*([['l', 'h']] * ndim)),
+                        product(*edge_indices))):
+                weight = 1.0
+                for lh, w_lo, w_hi in zip(lo_hi, low_weights, high_weights):
+                    weight = weight * (w_lo if lh == 'l' else w_hi)
+                weights[:, j] = weight
+                # Edge indices can be -1, wrap them around
+                cols[:, j] = np.ravel_multi_index(edge, space.shape,
+                                                  mode='wrap')
+
+        indptr = np.arange(0, npoints * nentries + 1, nentries)
+        self.__matrix = scipy.sparse.csr_matrix(
+            (weights.ravel(), cols.ravel(), indptr),
+            shape=(npoints, space.size))
+        if nentries > 1:
+            # Drop zero weights from nearest neighbor and boundary cases
+            self.__matrix.eliminate_zeros()
+
+    @property
+    def space(self):
+        """Space whose elements are interpolated by this plan."""
+        return self.__space
+
+    @property
+    def out_shape(self):
+        """Shape of the interpolated values."""
+        return self.__out_shape
+
+    @property
+    def weight_dtype(self):
+        """Data type of the interpolation weights."""
+        return self.__weight_dtype
+
+    @property
+    def matrix(self):
+        """Sparse interpolation matrix of shape ``(npoints, space.size)``.
+        """
+        return self.__matrix
+
+    def __call__(self, values, out=None):
+        """Interpolate ``values`` at the points of this plan.
+
+        Parameters
+        ----------
+        values : `array-like`
+            Values on the grid, must have shape ``space.shape``.
+        out : `numpy.ndarray`, optional
+            Array to which the result should be written. It must have
+            shape `out_shape`.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Interpolated values. If ``out`` was given, the returned
+            object is a reference to it.
+        """
+        values = np.asarray(values)
+        if values.shape != self.space.shape:
+            raise ValueError('`values` must have shape {}, got {}'
+                             ''.format(self.space.shape, values.shape))
+        result = self.matrix.dot(values.ravel()).reshape(self.out_shape)
+        if out is None:
+            return result
+        else:
+            out[:] = result
+            return out
+
+    def adjoint(self, values, out=None):
+        """Apply the adjoint of this plan to ``values``.
+
+        This distributes the values given at the points of this plan
+        to the grid points, using the same weights as the interpolation.
+
+        Parameters
+        ----------
+        values : `array-like`
+            Values at the interpolation points, must have shape
+            `out_shape`.
+        out : `numpy.ndarray`, optional
+            Array to which the result should be written. It must have
+            shape ``space.shape``.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Values on the grid. If ``out`` was given, the returned
+            object is a reference to it.
+        """
+        values = np.asarray(values)
+        if values.shape != self.out_shape:
+            raise ValueError('`values` must have shape {}, got {}'
+                             ''.format(self.out_shape, values.shape))
+        result = self.matrix.T.dot(values.ravel()).reshape(self.space.shape)
+        if out is None:
+            return result
+        else:
+            out[:] = result
+            return out
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.space]
+        optargs = [('weight_dtype', dtype_repr(self.weight_dtype),
+                    "'float32'")]
+        inner_str = signature_string(posargs, optargs, mod=['!r', ''])
+        return '{}({}, <{} points>)'.format(
+            self.__class__.__name__, inner_str, self.matrix.shape[0])
+
+
 class _Interpolator(object):
 
     """Abstract interpolator class.
@@ -716,29 +939,79 @@ scipy.interpolate.RegularGridInterpolator.html>`_ class.
 
         Can be overridden by subclasses to improve efficiency.
         """
-        # find relevant edges between which xi are situated
-        index_vecs = []
-        # compute distance to lower edge in unity units
-        norm_distances = []
-
-        # iterate through dimensions
-        for xi, cvec in zip(x, self.coord_vecs):
-            idcs = np.searchsorted(cvec, xi) - 1
-
-            idcs[idcs < 0] = 0
-            idcs[idcs > cvec.size - 2] = cvec.size - 2
-            index_vecs.append(idcs)
-
-            norm_distances.append((xi - cvec[idcs]) /
-                                  (cvec[idcs + 1] - cvec[idcs]))
-
-        return index_vecs, norm_distances
+        return _find_indices(self.coord_vecs, x)
 
     def _evaluate(self, indices, norm_distances, out=None):
         """Evaluation method, needs to be overridden."""
         raise NotImplementedError('abstract method')
 
 
+def _interp_matrix_1d(coord_vec, points, scheme, variant='left',
+                      dtype='float64'):
+    """Return the sparse matrix of 1d interpolation at ``points``.
+
+    Parameters
+    ----------
+    coord_vec : `numpy.ndarray`
+        Sorted 1d coordinate vector of the interpolation grid.
+    points : `numpy.ndarray`
+        1d array of points at which to interpolate.
+    scheme : {'nearest', 'linear'}
+        Interpolation scheme.
+    variant : {'left', 'right'}, optional
+        Variant of nearest neighbor interpolation.
+    dtype : optional
+        Data type of the matrix entries. Types not supported by
+        `scipy.sparse`, e.g. ``float16``, are promoted to ``float32``.
+
+    Returns
+    -------
+    matrix : `scipy.sparse.csr_matrix`
+        Matrix of shape ``(len(points), len(coord_vec))`` such that
+        ``matrix.dot(values)`` interpolates ``values`` at ``points``.
+        Out-of-bounds points are treated as in `_PerAxisInterpolator`.
+    """
+    import scipy.sparse
+
+    coord_vec = np.asarray(coord_vec)
+    points = np.asarray(points, dtype=float)
+    dtype = np.promote_types(dtype, 'float32')
+    indices, norm_distances = _find_indices([coord_vec], [points])
+    low_weights, high_weights, edge_indices = _create_weight_edge_lists(
+        indices, norm_distances, [scheme], [variant])
+
+    # Two entries per row, negative edge indices refer to the last node
+    cols = np.stack(edge_indices[0], axis=1) % coord_vec.size
+    weights = np.stack([low_weights[0], high_weights[0]], axis=1)
+    indptr = np.arange(0, 2 * points.size + 1, 2)
+    matrix = scipy.sparse.csr_matrix(
+        (weights.astype(dtype).ravel(), cols.ravel(), indptr),
+        shape=(points.size, coord_vec.size))
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def _find_indices(coord_vecs, x):
+    """Find indices and normalized distances of points ``x`` in a grid."""
+    # find relevant edges between which xi are situated
+    index_vecs = []
+    # compute distance to lower edge in unity units
+    norm_distances = []
+
+    # iterate through dimensions
+    for xi, cvec in zip(x, coord_vecs):
+        idcs = np.searchsorted(cvec, xi) - 1
+
+        idcs[idcs < 0] = 0
+        idcs[idcs > cvec.size - 2] = cvec.size - 2
+        index_vecs.append(idcs)
+
+        norm_distances.append((xi - cvec[idcs]) /
+                              (cvec[idcs + 1] - cvec[idcs]))
+
+    return index_vecs, norm_distances
+
+
 class _NearestInterpolator(_Interpolator):
 
     """Nearest neighbor interpolator.
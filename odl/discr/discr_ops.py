@@ -12,11 +12,14 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.discr import DiscreteLp, uniform_partition
+from odl.discr.discr_mappings import _interp_matrix_1d
 from odl.operator import Operator
 from odl.set import IntervalProd
 from odl.space import FunctionSpace, tensor_space
+from odl.space.weighting import ConstWeighting
 from odl.util import (
-    normalized_scalar_param_list, safe_int_conv, writable_array, resize_array)
+    normalized_scalar_param_list, safe_int_conv, writable_array, resize_array,
+    moveaxis)
 from odl.util.numerics import _SUPPORTED_RESIZE_PAD_MODES
 
 
@@ -34,6 +37,12 @@ class Resampling(Operator):
     for this to work. The tensor space implementations may be different,
     although performance may suffer drastically due to translation
     steps.
+
+    For `DiscreteLp` spaces with floating point data type, interpolation
+    followed by sampling is separable, i.e., it is the Kronecker product
+    of one interpolation matrix per axis. In this case, the resampling
+    is done by applying these (small, sparse) matrices axis by axis,
+    and the adjoint is computed exactly with their transposes.
     """
 
     def __init__(self, domain, range):
@@ -79,17 +88,43 @@ class Resampling(Operator):
 
         super(Resampling, self).__init__(
             domain=domain, range=range, linear=True)
+        self.__interp_matrices = None
+
+    @property
+    def interp_matrices(self):
+        """Per-axis interpolation matrices, built when first needed.
 
-    def _call(self, x, out=None):
+        The ``i``-th matrix maps the values along axis ``i`` of the domain
+        grid to the values along axis ``i`` of the range grid. This is
+        ``None`` if domain or range are not `DiscreteLp` spaces with
+        floating point data type.
+        """
+        if (self.__interp_matrices is None and
+                isinstance(self.domain, DiscreteLp) and
+                isinstance(self.range, DiscreteLp) and
+                (self.domain.is_real or self.domain.is_complex)):
+            self.__interp_matrices = tuple(
+                _interp_matrix_1d(cvec_in, cvec_out, scheme,
+                                  dtype=self.domain.real_dtype)
+                for cvec_in, cvec_out, scheme in zip(
+                    self.domain.grid.coord_vectors,
+                    self.range.grid.coord_vectors,
+                    self.domain.interp_byaxis))
+        return self.__interp_matrices
+
+    def _call(self, x, out):
         """Apply resampling operator.
 
         The element ``x`` is resampled using the sampling and interpolation
-        operators of the underlying spaces.
+        operators of the underlying spaces, or with the equivalent
+        `interp_matrices` if available.
         """
-        if out is None:
-            return x.interpolation
-        else:
+        matrices = self.interp_matrices
+        if matrices is None:
             out.sampling(x.interpolation)
+        else:
+            with writable_array(out) as out_arr:
+                _apply_per_axis(matrices, x.asarray(), out=out_arr)
 
     @property
     def inverse(self):
@@ -98,24 +133,6 @@ class Resampling(Operator):
         The returned operator is resampling defined in the opposite
         direction.
 
-        See Also
-        --------
-        adjoint : resampling is unitary, so the adjoint is the inverse.
-        """
-        return Resampling(self.range, self.domain)
-
-    @property
-    def adjoint(self):
-        """Return an (approximate) adjoint.
-
-        The result is only exact if the interpolation and sampling
-        operators of the underlying spaces match exactly.
-
-        Returns
-        -------
-        adjoint : Resampling
-            Resampling operator defined in the opposite direction.
-
         Examples
         --------
         Create resampling operator and inverse:
@@ -138,7 +155,90 @@ class Resampling(Operator):
         >>> print(resampling(resampling_inv(y)))
         [ 0.,  0.,  0.,  0.,  0.,  0.]
         """
-        return self.inverse
+        return Resampling(self.range, self.domain)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this resampling operator.
+
+        If `interp_matrices` are available and both spaces use constant
+        weighting, the adjoint is exact, given by the transposed
+        interpolation matrices and the ratio of the weighting constants.
+        Otherwise, the approximate adjoint `inverse` is returned, which
+        is only exact if the interpolation and sampling operators of the
+        underlying spaces match exactly.
+
+        Examples
+        --------
+        >>> coarse_discr = odl.uniform_discr(0, 1, 3)
+        >>> fine_discr = odl.uniform_discr(0, 1, 6)
+        >>> resampling = odl.Resampling(coarse_discr, fine_discr)
+        >>> print(resampling.adjoint([1, 2, 3, 4, 5, 6]))
+        [  1.5,   3.5,   5.5]
+
+        The adjoint satisfies ``<A x, y> = <x, A^* y>``:
+
+        >>> x = coarse_discr.element([1, 2, 3])
+        >>> y = fine_discr.element([1, 2, 3, 4, 5, 6])
+        >>> round(resampling(x).inner(y), 10)
+        8.3333333333
+        >>> round(x.inner(resampling.adjoint(y)), 10)
+        8.3333333333
+        """
+        matrices = self.interp_matrices
+        if (matrices is None or
+                not isinstance(self.domain.weighting, ConstWeighting) or
+                not isinstance(self.range.weighting, ConstWeighting)):
+            return self.inverse
+
+        forward_op = self
+        scaling = self.range.weighting.const / self.domain.weighting.const
+        adj_matrices = tuple(mat.T for mat in matrices)
+
+        class ResamplingAdjoint(Operator):
+
+            """Exact adjoint of `Resampling`."""
+
+            def _call(self, x, out):
+                """Implement ``self(x, out)``."""
+                with writable_array(out) as out_arr:
+                    _apply_per_axis(adj_matrices, x.asarray(), out=out_arr)
+                    if scaling != 1:
+                        out_arr *= scaling
+
+            @property
+            def adjoint(self):
+                """Adjoint of the adjoint, i.e. the original operator."""
+                return forward_op
+
+        return ResamplingAdjoint(domain=self.range, range=self.domain,
+                                 linear=True)
+
+
+def _apply_per_axis(matrices, arr, out=None):
+    """Apply one matrix along each axis of ``arr``.
+
+    This computes the product of the Kronecker product of ``matrices``
+    with the flattened ``arr``, without forming the Kronecker product.
+    The axes are processed in the order that shrinks the intermediate
+    arrays the most first.
+    """
+    # Reduce the size as early as possible, i.e., start with the axes
+    # with the largest size reduction
+    order = sorted(range(arr.ndim),
+                   key=lambda i: matrices[i].shape[0] / matrices[i].shape[1])
+    for axis in order:
+        mat = matrices[axis]
+        arr = moveaxis(arr, axis, 0)
+        other_shape = arr.shape[1:]
+        arr = mat.dot(arr.reshape((arr.shape[0], -1)))
+        arr = moveaxis(arr.reshape((mat.shape[0],) + other_shape), 0, axis)
+
+    if out is None:
+        return arr
+    else:
+        out[:] = arr
+        return out
 
 
 class ResizingOperatorBase(Operator):
@@ -1718,6 +1718,10 @@ def uniform_discr_fromdiscr(discr, min_pt=None, max_pt=None,
 
         Default: ``False``.
 
+    interp : string or sequence of strings, optional
+        Interpolation type of the new space, see `uniform_discr`.
+        Default: ``discr.interp``
+
     kwargs :
         Additional keyword parameters passed to the `DiscreteLp`
         initializer.
@@ -1785,6 +1789,9 @@ def uniform_discr_fromdiscr(discr, min_pt=None, max_pt=None,
     uniform_discr([ 0.,  0.], [ 1.,  2.], (5, 5))
     >>> odl.uniform_discr_fromdiscr(discr, shape=[5, 5]).cell_sides
     array([ 0.2,  0.4])
+    >>> odl.uniform_discr_fromdiscr(discr, shape=[5, 5],
+    ...                             interp='linear').interp
+    'linear'
 
     The cases with 2 or more additional arguments and the syntax
     for specifying quantities per axis is illustrated in the following:
@@ -1832,6 +1839,7 @@ def uniform_discr_fromdiscr(discr, min_pt=None, max_pt=None,
 
     nodes_on_bdry = kwargs.pop('nodes_on_bdry', False)
     nodes_on_bdry = normalized_nodes_on_bdry(nodes_on_bdry, discr.ndim)
+    interp = kwargs.pop('interp', discr.interp)
 
     new_min_pt = []
     new_max_pt = []
@@ -1886,7 +1894,7 @@ def uniform_discr_fromdiscr(discr, min_pt=None, max_pt=None,
                                  nodes_on_bdry=nodes_on_bdry)
 
     return uniform_discr_frompartition(new_part, exponent=discr.exponent,
-                                       interp=discr.interp, impl=discr.impl,
+                                       interp=interp, impl=discr.impl,
                                        **kwargs)
 
 
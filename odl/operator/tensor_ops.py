@@ -28,6 +28,55 @@ __all__ = ('PointwiseNorm', 'PointwiseInner', 'PointwiseSum', 'MatrixOperator',
 
 _SUPPORTED_DIFF_METHODS = ('central', 'forward', 'backward')
 
+# Number of entries processed at once in the fused point-wise kernels.
+# A block and its scratch space fit into the CPU cache, such that
+# successive passes over the same block do not touch the main memory.
+_POINTWISE_BLOCK_SIZE = 2 ** 14
+
+
+def _is_numpy_based(space):
+    """Return ``True`` if elements of ``space`` are backed by Numpy arrays.
+    """
+    return getattr(space, 'impl', None) == 'numpy'
+
+
+def _pointwise_blocks(arrays):
+    """Yield tuples of corresponding blocks of ``arrays``.
+
+    If all arrays are C-contiguous, the blocks are consecutive views of
+    at most `_POINTWISE_BLOCK_SIZE` entries of the flattened arrays.
+    Otherwise, the full arrays are yielded as a single block.
+    """
+    if not all(arr.flags.c_contiguous for arr in arrays):
+        yield tuple(arrays)
+        return
+
+    flat = [arr.reshape(-1) for arr in arrays]
+    size = flat[0].size
+    for start in range(0, size, _POINTWISE_BLOCK_SIZE):
+        slc = slice(start, min(start + _POINTWISE_BLOCK_SIZE, size))
+        yield tuple(arr[slc] for arr in flat)
+
+
+def _scratch_block(scratch, block):
+    """Return ``scratch`` if it can hold ``block``, else a new array.
+
+    The scratch array is allocated in each call of a kernel, since
+    sharing it between calls is not thread-safe.
+    """
+    if scratch is None or scratch.size < block.size:
+        scratch = np.empty(block.size, dtype=block.dtype)
+    return scratch
+
+
+def _common_weight(weights):
+    """Return the single value of ``weights`` if all are equal, else None.
+    """
+    if np.all(weights == weights[0]):
+        return float(weights[0])
+    else:
+        return None
+
 
 class PointwiseTensorFieldOperator(Operator):
 
@@ -225,13 +274,65 @@ class PointwiseNorm(PointwiseTensorFieldOperator):
 
     def _call(self, f, out):
         """Implement ``self(f, out)``."""
-        if self.exponent == 1.0:
+        if _is_numpy_based(self.base_space):
+            self._call_blockwise(f, out)
+        elif self.exponent == 1.0:
             self._call_vecfield_1(f, out)
         elif self.exponent == float('inf'):
             self._call_vecfield_inf(f, out)
         else:
             self._call_vecfield_p(f, out)
 
+    def _call_blockwise(self, vf, out):
+        """Implement ``self(vf, out)`` with fused kernels on Numpy arrays.
+
+        All components are processed block by block, such that the
+        accumulation of ``w_j * |F_j|^p`` and the final root are computed
+        while the block is in cache, using one scratch block per call.
+        Equal weights are applied only once at the end.
+        """
+        p = self.exponent
+        weights = self.weights
+        common_weight = _common_weight(weights)
+
+        if common_weight is None:
+            final_weight = 1.0
+        elif p in (1, float('inf')):
+            final_weight = common_weight
+        else:
+            final_weight = common_weight ** (1 / p)
+
+        arrays = [fi.asarray() for fi in vf]
+        # Numpy-based elements return their data without copying
+        out_arr = out.asarray()
+        scratch = None
+        for blocks in _pointwise_blocks([out_arr] + arrays):
+            out_blk, comp_blks = blocks[0], blocks[1:]
+            scratch = _scratch_block(scratch, out_blk)
+            tmp = scratch[:out_blk.size].reshape(out_blk.shape)
+            for j, comp_blk in enumerate(comp_blks):
+                dest = out_blk if j == 0 else tmp
+                np.abs(comp_blk, out=dest)
+                if p == 2:
+                    dest *= dest
+                elif p not in (1, float('inf')):
+                    np.power(dest, p, out=dest)
+                if common_weight is None:
+                    dest *= weights[j]
+                if j == 0:
+                    continue
+                elif p == float('inf'):
+                    np.maximum(out_blk, tmp, out=out_blk)
+                else:
+                    out_blk += tmp
+
+            if p == 2:
+                np.sqrt(out_blk, out=out_blk)
+            elif p not in (1, float('inf')):
+                np.power(out_blk, 1 / p, out=out_blk)
+            if final_weight != 1:
+                out_blk *= final_weight
+
     def _call_vecfield_1(self, vf, out):
         """Implement ``self(vf, out)`` for exponent 1."""
         vf[0].ufuncs.absolute(out=out)
@@ -520,6 +621,10 @@ class PointwiseInner(PointwiseInnerBase):
 
     def _call(self, vf, out):
         """Implement ``self(vf, out)``."""
+        if _is_numpy_based(self.base_space):
+            self._call_blockwise(vf, out)
+            return
+
         if self.domain.field == ComplexNumbers():
             vf[0].multiply(self._vecfield[0].conj(), out=out)
         else:
@@ -544,6 +649,46 @@ class PointwiseInner(PointwiseInnerBase):
                 tmp *= wi
             out += tmp
 
+    def _call_blockwise(self, vf, out):
+        """Implement ``self(vf, out)`` with fused kernels on Numpy arrays.
+
+        The products ``w_j * F_j * conj(G_j)`` are accumulated block by
+        block using one scratch block per call, without temporary copies
+        of the conjugated vector field. Equal weights are applied only once
+        at the end.
+        """
+        weights = self.weights
+        common_weight = _common_weight(weights)
+        is_complex = self.domain.field == ComplexNumbers()
+
+        arrays = [fi.asarray() for fi in vf]
+        vf_arrays = [gi.asarray() for gi in self.vecfield]
+        num_comp = len(arrays)
+        # Numpy-based elements return their data without copying
+        out_arr = out.asarray()
+        scratch = None
+        for blocks in _pointwise_blocks([out_arr] + arrays + vf_arrays):
+            out_blk = blocks[0]
+            comp_blks = blocks[1:1 + num_comp]
+            vf_blks = blocks[1 + num_comp:]
+            scratch = _scratch_block(scratch, out_blk)
+            tmp = scratch[:out_blk.size].reshape(out_blk.shape)
+            for j, (comp_blk, vf_blk) in enumerate(zip(comp_blks,
+                                                       vf_blks)):
+                dest = out_blk if j == 0 else tmp
+                if is_complex:
+                    np.conj(vf_blk, out=tmp)
+                    np.multiply(comp_blk, tmp, out=dest)
+                else:
+                    np.multiply(comp_blk, vf_blk, out=dest)
+                if common_weight is None:
+                    dest *= weights[j]
+                if j > 0:
+                    out_blk += tmp
+
+            if common_weight is not None and common_weight != 1:
+                out_blk *= common_weight
+
     @property
     def adjoint(self):
         """Adjoint of this operator.
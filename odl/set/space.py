@@ -15,7 +15,7 @@ import numpy as np
 from odl.set.sets import Field, Set, UniversalSet
 
 
-__all__ = ('LinearSpace', 'UniversalSpace')
+__all__ = ('LinearSpace', 'UniversalSpace', 'trusted')
 
 
 class LinearSpace(Set):
@@ -148,8 +148,29 @@ class LinearSpace(Set):
         -----
         This is the strict default where spaces must be equal.
         Subclasses may choose to implement a less strict check.
+
+        Inside a `trusted` context, a positive result of the space
+        comparison is remembered, and subsequent checks with the same
+        pair of space objects are answered without comparing again.
         """
-        return getattr(other, 'space', None) == self
+        space = getattr(other, 'space', None)
+        if space is self:
+            return True
+        elif space is None:
+            return False
+        elif not _TRUSTED_SPACE_PAIRS:
+            return space == self
+
+        verified = _TRUSTED_SPACE_PAIRS[-1]
+        key = (id(space), id(self))
+        if key in verified:
+            return True
+        elif space == self:
+            # Store the spaces to keep them alive, so the ids stay valid
+            verified[key] = (space, self)
+            return True
+        else:
+            return False
 
     # Error checking variant of methods
     def lincomb(self, a, x1, b=None, x2=None, out=None):
@@ -1051,6 +1072,68 @@ class UniversalSpace(LinearSpace):
         return isinstance(other, LinearSpaceElement)
 
 
+# Stack of dictionaries of space pairs that have been checked for equality
+# inside a `trusted` context, the innermost context is the last entry
+_TRUSTED_SPACE_PAIRS = []
+
+
+class trusted(object):
+
+    """Context manager to skip redundant space membership checks.
+
+    Checking ``x in space`` for an element whose space is equal to, but
+    not identical with ``space`` requires a full comparison of the
+    spaces. For discretized spaces this recurses through partitions,
+    grids, tensor spaces and weightings, which can dominate the cost
+    of cheap operator evaluations in iterative solvers.
+
+    Inside this context, the outcome of a successful space comparison
+    is cached by the identity of the compared space objects, such that
+    each pair is only compared once. Since spaces are immutable, the
+    checks in `Operator.__call__`, `LinearSpace.lincomb` and the solvers
+    become essentially free after the first iteration. The cache is
+    discarded when the context exits.
+
+    Examples
+    --------
+    Spaces that are equal but not identical are compared in full on
+    every membership test:
+
+    >>> space = odl.uniform_discr(0, 1, 10)
+    >>> same_space = odl.uniform_discr(0, 1, 10)
+    >>> op = odl.IdentityOperator(space)
+    >>> x = same_space.one()
+
+    Within the context, only the first evaluation does that comparison:
+
+    >>> with odl.trusted():
+    ...     for _ in range(3):
+    ...         y = op(x)
+    >>> y in space
+    True
+
+    Membership is still checked, of course:
+
+    >>> with odl.trusted():
+    ...     odl.rn(10).one() in space
+    False
+    """
+
+    def __init__(self):
+        """Initialize a new instance."""
+        self.verified = {}
+
+    def __enter__(self):
+        """Start caching verified space pairs."""
+        _TRUSTED_SPACE_PAIRS.append(self.verified)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Stop caching and release the cached spaces."""
+        _TRUSTED_SPACE_PAIRS.pop()
+        self.verified.clear()
+
+
 class LinearSpaceTypeError(TypeError):
     """Exception for type errors in `LinearSpace`'s.
 
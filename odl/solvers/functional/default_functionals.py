@@ -2292,13 +2292,7 @@ class IndicatorSimplex(Functional):
         diameter = self.diameter
 
         class ProximalSimplex(Operator):
-            """Proximal operator implemented by the algorithm of [D+2008].
-
-            [D+2008] Duchi, J., Shalev-Shwartz, S., Singer, Y., and Chandra, T.
-            *Efficient Projections onto the L1-ball for Learning in High
-            dimensions*. ICML 2008, pp. 272-279.
-            http://doi.org/10.1145/1390156.1390191
-            """
+            """Proximal operator implemented by `proj_simplex`."""
 
             def __init__(self, sigma):
                 self.sigma = sigma
@@ -17,3 +17,9 @@ __all__ += iterative.__all__
 
 from .statistical import *
 __all__ += statistical.__all__
+
+from .krylov import *
+__all__ += krylov.__all__
+
+from .geometric_multigrid import *
+__all__ += geometric_multigrid.__all__
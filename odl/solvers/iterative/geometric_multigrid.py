@@ -0,0 +1,477 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Geometric multigrid methods for elliptic operator equations."""
+
+from __future__ import print_function, division, absolute_import
+from builtins import range
+import numpy as np
+
+from odl.discr import DiscreteLp, Resampling, uniform_discr_fromdiscr
+from odl.operator import (
+    Operator, MultiplyOperator, matrix_representation, power_method_opnorm)
+from odl.util import signature_string
+
+
+__all__ = ('MultigridPreconditioner', 'multigrid')
+
+
+def _coarse_shape(shape):
+    """Return the shape of the next coarser grid.
+
+    Axes with more than 2 cells are coarsened by a factor of 2, the
+    other axes are kept.
+    """
+    return tuple((n + 1) // 2 if n > 2 else n for n in shape)
+
+
+def _probe_diagonal(op):
+    """Return the diagonal of ``op`` computed by probing.
+
+    The operator is applied to ``3 ** ndim`` sums of unit vectors whose
+    nonzero entries are at least 3 indices apart in some axis. This gives
+    the exact diagonal for operators that only couple nearest neighbors
+    in each axis, like `Laplacian`, at the cost of a few evaluations.
+    """
+    space = op.domain
+    colors = np.ravel_multi_index(tuple(np.indices(space.shape) % 3),
+                                  (3,) * space.ndim)
+    diag = np.zeros(space.shape, dtype=space.dtype)
+    result = op.range.element()
+    for color in range(3 ** space.ndim):
+        mask = (colors == color)
+        if not np.any(mask):
+            continue
+        op(space.element(mask), out=result)
+        diag[mask] = result.asarray()[mask]
+    return space.element(diag)
+
+
+class MultigridPreconditioner(Operator):
+
+    """Approximate inverse of an elliptic operator by multigrid cycles.
+
+    The equation ``A(x) = rhs`` is discretized on a hierarchy of
+    successively coarser uniform grids created with
+    `uniform_discr_fromdiscr`, where each grid has half the number of
+    cells per axis of the previous one. The prolongation from a coarse to
+    the next finer grid is linear interpolation with `Resampling`,
+    extended as constant towards the boundary, and the restriction is its
+    adjoint (full weighting).
+
+    The coarse operators are either obtained by re-discretizing ``A`` on
+    the coarse grids, or as the Galerkin products ``R A P`` of restriction
+    ``R``, operator ``A`` and prolongation ``P``. Re-discretization is
+    cheaper, but requires discretizations that are consistent across the
+    grids, e.g., `Laplacian` with ``pad_mode='symmetric'``. Galerkin
+    products work for any operator, but each application of a coarse
+    operator includes an application of ``A``.
+
+    Evaluating this operator at ``rhs`` runs ``num_cycles`` V- or
+    W-cycles for ``A(x) = rhs``, starting from ``x = 0``:
+
+    - ``num_smooth`` steps of damped Jacobi or Chebyshev smoothing,
+    - restriction of the residual to the coarser grid,
+    - (recursive) solution of the coarse residual equation, once for
+      a V-cycle and twice for a W-cycle,
+    - prolongation and addition of the coarse correction,
+    - ``num_smooth`` steps of post-smoothing.
+
+    On the coarsest grid, the equation is solved exactly with the
+    pseudo-inverse of the matrix representation.
+
+    All these steps are linear, hence the operator is linear. If ``A``
+    is self-adjoint and positive definite, so is this operator, which
+    makes it a preconditioner for `conjugate_gradient` and `minres`
+    whose number of iterations does not grow with the grid size.
+
+    See [TOS2001] for an introduction to multigrid methods and [Saa2003]
+    for the Chebyshev iteration.
+
+    References
+    ----------
+    [TOS2001] Trottenberg, U, Oosterlee, C W, and Schuller, A.
+    *Multigrid*. Academic Press, 2001.
+
+    [Saa2003] Saad, Y. *Iterative Methods for Sparse Linear Systems*.
+    2nd edition, SIAM, 2003.
+    """
+
+    def __init__(self, op, space=None, cycle='V', smoother='jacobi',
+                 num_smooth=2, num_cycles=1, omega=2.0 / 3.0,
+                 coarse_size=64, max_levels=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        op : `Operator` or callable
+            Linear, self-adjoint and positive (semi-)definite operator
+            ``A`` of the equation. If an `Operator` is given, the coarse
+            operators are Galerkin products. Otherwise, ``op`` must be a
+            function returning the operator when called with a space of
+            the hierarchy, e.g., ``lambda s: -odl.Laplacian(s)``, and the
+            coarse operators are re-discretizations.
+        space : uniform `DiscreteLp`, optional
+            Finest space of the hierarchy, the domain and range of this
+            operator. Required if ``op`` is not an `Operator`.
+            Default: ``op.domain``
+        cycle : {'V', 'W'}, optional
+            Type of the multigrid cycle.
+        smoother : {'jacobi', 'chebyshev'}, optional
+            Smoothing method. ``'jacobi'`` uses the damped Jacobi method
+            ``x <- x + omega * (rhs - A(x)) / diagonal``, where the
+            diagonal of ``A`` is computed by probing, which is exact for
+            operators coupling only nearest neighbors in each axis.
+            ``'chebyshev'`` uses the Chebyshev iteration on the upper part
+            ``[0.1, 1.1] * lambda_max`` of the spectrum of ``A``, where
+            ``lambda_max`` is estimated by `power_method_opnorm`. It is
+            the better choice for operators with larger stencils.
+        num_smooth : positive int, optional
+            Number of pre- and post-smoothing steps on each level. For
+            Chebyshev smoothing, this is the degree of the polynomial.
+        num_cycles : positive int, optional
+            Number of cycles per evaluation.
+        omega : positive float, optional
+            Damping factor of the Jacobi smoother.
+        coarse_size : positive int, optional
+            The coarsening stops at the first grid with at most this
+            many points.
+        max_levels : positive int, optional
+            Maximum number of grids, including the finest.
+            Default: no limit
+
+        Examples
+        --------
+        Solve the Helmholtz-type equation ``-Laplacian(x) + x = rhs``
+        with conjugate gradients preconditioned by one V-cycle:
+
+        >>> space = odl.uniform_discr([0, 0], [1, 1], (64, 64))
+        >>> op = -odl.Laplacian(space) + odl.IdentityOperator(space)
+        >>> mg = MultigridPreconditioner(op)
+        >>> [s.shape for s in mg.spaces]
+        [(64, 64), (32, 32), (16, 16), (8, 8)]
+        >>> rhs = space.one()
+        >>> x = space.zero()
+        >>> odl.solvers.conjugate_gradient(op, x, rhs, niter=8, precond=mg)
+        >>> (op(x) - rhs).norm() < 1e-6 * rhs.norm()
+        True
+
+        With Neumann boundary conditions, the operator can be
+        re-discretized on the coarse grids:
+
+        >>> op_factory = lambda s: (-odl.Laplacian(s, pad_mode='symmetric') +
+        ...                         odl.IdentityOperator(s))
+        >>> mg = MultigridPreconditioner(op_factory, space)
+        >>> op = mg.operators[0]
+        >>> x = space.zero()
+        >>> odl.solvers.conjugate_gradient(op, x, rhs, niter=8, precond=mg)
+        >>> (op(x) - rhs).norm() < 1e-6 * rhs.norm()
+        True
+        """
+        if isinstance(op, Operator):
+            if space is None:
+                space = op.domain
+            if not (op.domain == space and op.range == space):
+                raise ValueError('`op` {!r} must have `space` {!r} as domain '
+                                 'and range'.format(op, space))
+        elif not callable(op):
+            raise TypeError('`op` {!r} is neither an `Operator` nor callable'
+                            ''.format(op))
+        elif space is None:
+            raise ValueError('`space` must be given if `op` is not an '
+                             '`Operator`')
+        if not isinstance(space, DiscreteLp) or not space.is_uniform:
+            raise TypeError('`space` {!r} is not a uniform `DiscreteLp`'
+                            ''.format(space))
+        super(MultigridPreconditioner, self).__init__(
+            domain=space, range=space, linear=True)
+
+        self.__cycle = str(cycle).upper()
+        if self.cycle not in ('V', 'W'):
+            raise ValueError('`cycle` {!r} not understood'.format(cycle))
+        self.__smoother = str(smoother).lower()
+        if self.smoother not in ('jacobi', 'chebyshev'):
+            raise ValueError('`smoother` {!r} not understood'
+                             ''.format(smoother))
+
+        self.__num_smooth, num_smooth_in = int(num_smooth), num_smooth
+        if self.num_smooth <= 0 or self.num_smooth != num_smooth_in:
+            raise ValueError('`num_smooth` must be a positive integer, got '
+                             '{}'.format(num_smooth_in))
+        self.__num_cycles, num_cycles_in = int(num_cycles), num_cycles
+        if self.num_cycles <= 0 or self.num_cycles != num_cycles_in:
+            raise ValueError('`num_cycles` must be a positive integer, got '
+                             '{}'.format(num_cycles_in))
+        self.__omega = float(omega)
+        if self.omega <= 0:
+            raise ValueError('`omega` must be positive, got {}'.format(omega))
+        coarse_size, coarse_size_in = int(coarse_size), coarse_size
+        if coarse_size <= 0:
+            raise ValueError('`coarse_size` must be positive, got {}'
+                             ''.format(coarse_size_in))
+        if max_levels is not None and int(max_levels) <= 0:
+            raise ValueError('`max_levels` must be positive, got {}'
+                             ''.format(max_levels))
+
+        self.__op = op
+
+        # Build the grid hierarchy
+        spaces = [space]
+        while (spaces[-1].size > coarse_size and
+               (max_levels is None or len(spaces) < int(max_levels))):
+            shape = _coarse_shape(spaces[-1].shape)
+            if shape == spaces[-1].shape:
+                break
+            spaces.append(uniform_discr_fromdiscr(
+                spaces[-1], shape=shape, interp='linear',
+                dtype=space.dtype))
+        self.__spaces = tuple(spaces)
+
+        # Linear interpolation puts less weight on fine points outside
+        # the coarse grid; normalizing the weights preserves constants
+        prolongations = []
+        for fine, coarse in zip(self.spaces[:-1], self.spaces[1:]):
+            resampling = Resampling(coarse, fine)
+            weights = 1 / resampling(coarse.one())
+            prolongations.append(MultiplyOperator(weights) * resampling)
+        self.__prolongations = tuple(prolongations)
+        self.__restrictions = tuple(prolong.adjoint
+                                    for prolong in self.__prolongations)
+
+        if isinstance(op, Operator):
+            ops = [op]
+            for prolong, restrict in zip(self.__prolongations,
+                                         self.__restrictions):
+                ops.append(restrict * ops[-1] * prolong)
+        else:
+            ops = []
+            for spc in self.spaces:
+                spc_op = op(spc)
+                if not (spc_op.domain == spc and spc_op.range == spc):
+                    raise ValueError('`op` returned an operator {!r} whose '
+                                     'domain and range are not {!r}'
+                                     ''.format(spc_op, spc))
+                ops.append(spc_op)
+        self.__operators = tuple(ops)
+
+        # Smoother parameters for all but the coarsest level
+        self.__smoother_params = []
+        for level_op in self.operators[:-1]:
+            if self.smoother == 'jacobi':
+                diag = _probe_diagonal(level_op)
+                if np.any(diag.asarray() == 0):
+                    raise ValueError('the diagonal of {!r} has zero entries'
+                                     ''.format(level_op))
+                self.__smoother_params.append(self.omega / diag)
+            else:
+                lam_max = power_method_opnorm(level_op, maxiter=50)
+                self.__smoother_params.append((0.1 * lam_max, 1.1 * lam_max))
+
+        # Exact solver on the coarsest level
+        coarse_op = self.operators[-1]
+        matrix = matrix_representation(coarse_op).reshape(
+            (coarse_op.domain.size, coarse_op.domain.size))
+        self.__coarse_inverse = np.linalg.pinv(matrix)
+
+        # Temporaries: residuals and second temporary per level, and
+        # right-hand sides and iterates of the coarse residual equations
+        self.__res = [spc.element() for spc in self.spaces]
+        self.__tmp = [spc.element() for spc in self.spaces]
+        self.__coarse_rhs = [None] + [spc.element() for spc in self.spaces[1:]]
+        self.__coarse_x = [None] + [spc.element() for spc in self.spaces[1:]]
+
+    @property
+    def op(self):
+        """Operator, or function creating the operator on each level."""
+        return self.__op
+
+    @property
+    def spaces(self):
+        """Tuple of the spaces of the hierarchy, from fine to coarse."""
+        return self.__spaces
+
+    @property
+    def operators(self):
+        """Tuple of the operators on `spaces`."""
+        return self.__operators
+
+    @property
+    def cycle(self):
+        """Type of the multigrid cycle, ``'V'`` or ``'W'``."""
+        return self.__cycle
+
+    @property
+    def smoother(self):
+        """Smoothing method, ``'jacobi'`` or ``'chebyshev'``."""
+        return self.__smoother
+
+    @property
+    def num_smooth(self):
+        """Number of pre- and post-smoothing steps."""
+        return self.__num_smooth
+
+    @property
+    def num_cycles(self):
+        """Number of cycles per evaluation."""
+        return self.__num_cycles
+
+    @property
+    def omega(self):
+        """Damping factor of the Jacobi smoother."""
+        return self.__omega
+
+    def _smooth(self, level, x, rhs):
+        """Apply the smoother on ``level`` to ``x`` in-place."""
+        op = self.operators[level]
+        res = self.__res[level]
+        if self.smoother == 'jacobi':
+            scaled_inv_diag = self.__smoother_params[level]
+            for _ in range(self.num_smooth):
+                op(x, out=res)
+                res.lincomb(1, rhs, -1, res)
+                res *= scaled_inv_diag
+                x += res
+        else:
+            # Chebyshev iteration, see Algorithm 12.1 in [Saa2003]
+            lower, upper = self.__smoother_params[level]
+            theta = (upper + lower) / 2
+            delta = (upper - lower) / 2
+            rho = delta / theta
+            step = self.__tmp[level]
+            op(x, out=res)
+            res.lincomb(1, rhs, -1, res)
+            step.lincomb(1 / theta, res)
+            for i in range(self.num_smooth):
+                x += step
+                if i == self.num_smooth - 1:
+                    break
+                op(x, out=res)
+                res.lincomb(1, rhs, -1, res)
+                rho_new = 1 / (2 * theta / delta - rho)
+                step.lincomb(rho_new * rho, step, 2 * rho_new / delta, res)
+                rho = rho_new
+
+    def _cycle(self, level, x, rhs):
+        """Improve ``x`` in-place by one cycle on ``level``."""
+        if level == len(self.spaces) - 1:
+            sol = self.__coarse_inverse.dot(rhs.asarray().ravel())
+            x[:] = sol.reshape(x.shape)
+            return
+
+        self._smooth(level, x, rhs)
+
+        res = self.__res[level]
+        self.operators[level](x, out=res)
+        res.lincomb(1, rhs, -1, res)
+        coarse_rhs = self.__coarse_rhs[level + 1]
+        coarse_x = self.__coarse_x[level + 1]
+        self.__restrictions[level](res, out=coarse_rhs)
+
+        coarse_x.set_zero()
+        if self.cycle == 'W' and level + 1 < len(self.spaces) - 1:
+            num_coarse_cycles = 2
+        else:
+            num_coarse_cycles = 1
+        for _ in range(num_coarse_cycles):
+            self._cycle(level + 1, coarse_x, coarse_rhs)
+
+        self.__prolongations[level](coarse_x, out=res)
+        x += res
+
+        self._smooth(level, x, rhs)
+
+    def _call(self, rhs, out):
+        """Run `num_cycles` cycles starting from zero, write to ``out``."""
+        out.set_zero()
+        for _ in range(self.num_cycles):
+            self._cycle(0, out, rhs)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator, assuming a self-adjoint ``A``."""
+        return self
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.op]
+        optargs = [('space', self.domain,
+                    getattr(self.op, 'domain', None)),
+                   ('cycle', self.cycle, 'V'),
+                   ('smoother', self.smoother, 'jacobi'),
+                   ('num_smooth', self.num_smooth, 2),
+                   ('num_cycles', self.num_cycles, 1),
+                   ('omega', self.omega, 2.0 / 3.0)]
+        inner_str = signature_string(posargs, optargs)
+        return '{}({})'.format(self.__class__.__name__, inner_str)
+
+
+def multigrid(op, x, rhs, niter, callback=None, **kwargs):
+    """Solve an elliptic operator equation with multigrid cycles.
+
+    This method solves the equation ::
+
+        A(x) = rhs
+
+    for a linear, self-adjoint and positive definite operator ``A`` by
+    running ``niter`` cycles of `MultigridPreconditioner`. For elliptic
+    operators, e.g., ``A = B^* B + lam * (-Laplacian)`` with a smoothing
+    operator ``B``, each cycle reduces the error by a factor that is
+    independent of the grid size.
+
+    Parameters
+    ----------
+    op : `Operator` or callable
+        Operator ``A``, or function returning ``A`` on a given space,
+        see `MultigridPreconditioner`.
+    x : uniform `DiscreteLp` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``x.space`` element
+        Right-hand side of the equation.
+    niter : int
+        Number of iterations.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+    kwargs :
+        Further keyword arguments passed to `MultigridPreconditioner`.
+        With ``num_cycles > 1``, each iteration consists of several
+        cycles.
+
+    See Also
+    --------
+    MultigridPreconditioner : Multigrid cycles as linear operator.
+    odl.solvers.iterative.iterative.conjugate_gradient :
+        Krylov method that can use multigrid as preconditioner.
+
+    Examples
+    --------
+    >>> space = odl.uniform_discr([0, 0], [1, 1], (64, 64))
+    >>> op = -odl.Laplacian(space) + odl.IdentityOperator(space)
+    >>> rhs = space.one()
+    >>> x = space.zero()
+    >>> multigrid(op, x, rhs, niter=15)
+    >>> (op(x) - rhs).norm() < 1e-6 * rhs.norm()
+    True
+    """
+    mg = MultigridPreconditioner(op, x.space, **kwargs)
+    if rhs not in mg.range:
+        raise TypeError('`rhs` {!r} is not in the range {!r} of the operator'
+                        ''.format(rhs, mg.range))
+
+    for _ in range(niter):
+        for _ in range(mg.num_cycles):
+            mg._cycle(0, x, rhs)
+
+        if callback is not None:
+            callback(x)
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -12,11 +12,15 @@ from __future__ import print_function, division, absolute_import
 from builtins import next
 import numpy as np
 
-from odl.operator import IdentityOperator, OperatorComp, OperatorSum
+from odl.operator import (
+    IdentityOperator, OperatorComp, OperatorSum, DiagonalOperator)
+from odl.set import ComplexNumbers
+from odl.space import ProductSpace
 from odl.util import normalized_scalar_param_list
 
 
 __all__ = ('landweber', 'conjugate_gradient', 'conjugate_gradient_normal',
+           'block_conjugate_gradient', 'block_conjugate_gradient_normal',
            'gauss_newton', 'kaczmarz')
 
 
@@ -120,7 +124,7 @@ def landweber(op, x, rhs, niter, omega=None, projection=None, callback=None):
             callback(x)
 
 
-def conjugate_gradient(op, x, rhs, niter, callback=None):
+def conjugate_gradient(op, x, rhs, niter, callback=None, precond=None):
     """Optimized implementation of CG for self-adjoint operators.
 
     This method solves the inverse problem (of the first kind)::
@@ -152,6 +156,11 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         Number of iterations.
     callback : callable, optional
         Object executing code per iteration, e.g. plotting each iterate.
+    precond : linear `Operator`, optional
+        Self-adjoint and positive definite preconditioner approximating
+        the inverse of ``op``, e.g., a `MultigridPreconditioner`. It must
+        have ``op.domain`` as domain and range.
+        Default: no preconditioning
 
     See Also
     --------
@@ -167,13 +176,23 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
                         ''.format(x, op.domain))
 
+    if precond is not None and not (precond.domain == op.domain and
+                                    precond.range == op.domain):
+        raise ValueError('`precond` {!r} must have domain and range equal '
+                         'to `op.domain` {!r}'.format(precond, op.domain))
+
     r = op(x)
     r.lincomb(1, rhs, -1, r)       # r = rhs - A x
-    p = r.copy()
+    if precond is None:
+        z = r
+        sqnorm_r_old = r.norm() ** 2  # Only recalculate norm after update
+    else:
+        # Preconditioned residual, the squared norm becomes <r, z>
+        z = precond(r)
+        sqnorm_r_old = r.inner(z).real
+    p = z.copy()
     d = op.domain.element()  # Extra storage for storing A x
 
-    sqnorm_r_old = r.norm() ** 2  # Only recalculate norm after update
-
     if sqnorm_r_old == 0:  # Return if no step forward
         return
 
@@ -190,12 +209,16 @@ def conjugate_gradient(op, x, rhs, niter, callback=None):
         x.lincomb(1, x, alpha, p)            # x = x + alpha*p
         r.lincomb(1, r, -alpha, d)           # r = r - alpha*d
 
-        sqnorm_r_new = r.norm() ** 2
+        if precond is None:
+            sqnorm_r_new = r.norm() ** 2
+        else:
+            precond(r, out=z)
+            sqnorm_r_new = r.inner(z).real
 
         beta = sqnorm_r_new / sqnorm_r_old
         sqnorm_r_old = sqnorm_r_new
 
-        p.lincomb(1, r, beta, p)                       # p = s + b * p
+        p.lincomb(1, z, beta, p)                       # p = s + b * p
 
         if callback is not None:
             callback(x)
@@ -279,6 +302,223 @@ Conjugate_gradient_on_the_normal_equations>`_.
             callback(x)
 
 
+def _block_operator(op, x):
+    """Return the operator acting on all columns of the block ``x``.
+
+    If ``op`` is batched, i.e., its domain is a power space containing
+    ``x``, it is returned as-is. If ``x`` lies in a power space of
+    ``op.domain``, the operator is applied column by column.
+    """
+    if (x in op.domain and isinstance(op.domain, ProductSpace) and
+            op.domain.is_power_space):
+        return op
+    elif (isinstance(x.space, ProductSpace) and x.space.is_power_space and
+            x.space[0] == op.domain):
+        return DiagonalOperator(op, len(x.space))
+    else:
+        raise TypeError('`x` {!r} is neither in the power space domain of '
+                        '`op` nor in a power space of `op.domain` {!r}'
+                        ''.format(x, op.domain))
+
+
+def _gram_matrix(left, right):
+    """Return the matrix ``left^* right`` of inner products of columns."""
+    dtype = complex if left.space.field == ComplexNumbers() else float
+    gram = np.empty((len(left), len(right)), dtype=dtype)
+    for i, left_i in enumerate(left):
+        for j, right_j in enumerate(right):
+            gram[i, j] = right_j.inner(left_i)
+    return gram
+
+
+def _block_lincomb(out, x, coeffs, y):
+    """Compute ``out = x + y * coeffs`` for blocks of columns.
+
+    ``out`` may be aliased with ``x``, but not with ``y``.
+    """
+    for j, (out_j, x_j) in enumerate(zip(out, x)):
+        out_j.lincomb(1, x_j, coeffs[0, j], y[0])
+        for i in range(1, len(y)):
+            out_j.lincomb(1, out_j, coeffs[i, j], y[i])
+
+
+def block_conjugate_gradient(op, x, rhs, niter, callback=None):
+    """Block CG for self-adjoint operators and several right-hand sides.
+
+    This method solves the inverse problems (of the first kind) ::
+
+        A(x[j]) = rhs[j],  j = 0, ..., s - 1
+
+    for a linear and self-adjoint `Operator` ``A`` simultaneously. All
+    columns share the Krylov subspace, which is coupled through small
+    ``s x s`` Gram matrices, such that the method usually needs fewer
+    iterations than running `conjugate_gradient` for each column, see
+    [OLe1980].
+
+    If ``op`` is batched, i.e., its domain is a power space, e.g.,
+    ``odl.trafos.NonUniformFourierTransform`` of a power space, the columns
+    are the components of ``op.domain`` and each iteration evaluates
+    ``op`` once for all columns. Otherwise, ``x`` and ``rhs`` must lie in
+    a power space of ``op.domain`` and ``op`` is applied column by
+    column.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. It must be linear and
+        self-adjoint. This implies in particular that its domain and
+        range are equal.
+    x : `ProductSpaceElement`
+        Block of columns to which the result is written. Its initial
+        value is used as starting point of the iteration, and its values
+        are updated in each iteration step.
+    rhs : `ProductSpaceElement`
+        Block of right-hand sides, in the same space as ``x``.
+    niter : int
+        Number of iterations.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    conjugate_gradient : Solver for a single right-hand side
+    block_conjugate_gradient_normal : Block solver for the normal equations
+
+    Notes
+    -----
+    The small linear systems are solved with a pseudo-inverse, such that
+    columns that converge or become linearly dependent do not lead to a
+    breakdown.
+
+    References
+    ----------
+    [OLe1980] O'Leary, D P. *The block conjugate gradient algorithm and
+    related methods*. Linear Algebra and its Applications, 29 (1980),
+    pp 293-322.
+    """
+    if op.domain != op.range:
+        raise ValueError('operator needs to be self-adjoint')
+
+    block_op = _block_operator(op, x)
+    if rhs not in block_op.range:
+        raise TypeError('`rhs` {!r} is not in the same space as `x` {!r}'
+                        ''.format(rhs, x.space))
+
+    r = block_op(x)
+    r.lincomb(1, rhs, -1, r)  # r = rhs - A x
+    p = r.copy()
+    d = block_op.range.element()  # Extra storage for storing A p
+
+    gram_r_old = _gram_matrix(r, r)
+    if np.all(np.diag(gram_r_old) == 0):  # Return if no step forward
+        return
+
+    for _ in range(niter):
+        block_op(p, out=d)  # d = A p
+
+        # alpha = (p^* d)^+ (r^* r)
+        alpha = np.linalg.pinv(_gram_matrix(p, d)).dot(gram_r_old)
+
+        _block_lincomb(x, x, alpha, p)  # x = x + p * alpha
+        _block_lincomb(r, r, -alpha, d)  # r = r - d * alpha
+
+        gram_r_new = _gram_matrix(r, r)
+        if np.all(np.diag(gram_r_new) == 0):
+            if callback is not None:
+                callback(x)
+            return
+
+        beta = np.linalg.pinv(gram_r_old).dot(gram_r_new)
+        gram_r_old = gram_r_new
+
+        # p = r + p * beta, using `d` as temporary
+        _block_lincomb(d, r, beta, p)
+        p, d = d, p
+
+        if callback is not None:
+            callback(x)
+
+
+def block_conjugate_gradient_normal(op, x, rhs, niter, callback=None):
+    """Block CG on the normal equations for several right-hand sides.
+
+    This method solves the inverse problems (of the first kind) ::
+
+        A(x[j]) = rhs[j],  j = 0, ..., s - 1
+
+    with a linear `Operator` ``A`` simultaneously by looking at the normal
+    equations ::
+
+        A.adjoint(A(x[j])) = A.adjoint(rhs[j])
+
+    This is the block version of `conjugate_gradient_normal` (CGLS), see
+    `block_conjugate_gradient` for details on the block structure and
+    batched operators.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. ``op.adjoint`` must be
+        well-defined.
+    x : `ProductSpaceElement`
+        Block of columns to which the result is written. Its initial
+        value is used as starting point of the iteration, and its values
+        are updated in each iteration step.
+    rhs : `ProductSpaceElement`
+        Block of right-hand sides in the range of the block operator.
+    niter : int
+        Number of iterations.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    conjugate_gradient_normal : Solver for a single right-hand side
+    block_conjugate_gradient : Block solver for self-adjoint operators
+    """
+    block_op = _block_operator(op, x)
+    if rhs not in block_op.range:
+        raise TypeError('`rhs` {!r} is not in the range of the block '
+                        'operator {!r}'.format(rhs, block_op.range))
+
+    d = block_op(x)
+    d.lincomb(1, rhs, -1, d)  # d = rhs - A x
+    s = block_op.adjoint(d)
+    p = s.copy()
+    q = block_op.range.element()
+    tmp = block_op.domain.element()
+
+    gram_s_old = _gram_matrix(s, s)
+    if np.all(np.diag(gram_s_old) == 0):  # Return if no step forward
+        return
+
+    for _ in range(niter):
+        block_op(p, out=q)  # q = A p
+
+        # a = (q^* q)^+ (s^* s)
+        a = np.linalg.pinv(_gram_matrix(q, q)).dot(gram_s_old)
+
+        _block_lincomb(x, x, a, p)  # x = x + p * a
+        _block_lincomb(d, d, -a, q)  # d = d - q * a
+        block_op.adjoint(d, out=s)  # s = A^* d
+
+        gram_s_new = _gram_matrix(s, s)
+        if np.all(np.diag(gram_s_new) == 0):
+            if callback is not None:
+                callback(x)
+            return
+
+        b = np.linalg.pinv(gram_s_old).dot(gram_s_new)
+        gram_s_old = gram_s_new
+
+        # p = s + p * b, using `tmp` as temporary
+        _block_lincomb(tmp, s, b, p)
+        p, tmp = tmp, p
+
+        if callback is not None:
+            callback(x)
+
+
 def exp_zero_seq(base):
     """Default exponential zero sequence.
 
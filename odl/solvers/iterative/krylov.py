@@ -0,0 +1,579 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Krylov subspace methods for linear operator equations.
+
+All methods work directly on `LinearSpaceElement`'s, use preallocated
+temporaries and in-place evaluation, and optionally take a preconditioner
+given as a linear `Operator`.
+"""
+
+from __future__ import print_function, division, absolute_import
+from builtins import range
+import numpy as np
+
+from odl.set import ComplexNumbers
+
+
+__all__ = ('lsqr', 'lsmr', 'minres', 'gmres')
+
+
+def _sym_ortho(a, b):
+    """Return ``(c, s, r)`` of a stable Givens rotation of real ``a, b``.
+
+    The rotation satisfies ``c * a + s * b = r`` and ``-s * a + c * b = 0``,
+    see [FS2011] in `lsmr`.
+    """
+    if b == 0:
+        return np.sign(a), 0.0, abs(a)
+    elif a == 0:
+        return 0.0, np.sign(b), abs(b)
+    elif abs(b) > abs(a):
+        tau = a / b
+        s = np.sign(b) / np.sqrt(1 + tau * tau)
+        c = s * tau
+        r = b / s
+    else:
+        tau = b / a
+        c = np.sign(a) / np.sqrt(1 + tau * tau)
+        s = c * tau
+        r = a / c
+    return c, s, r
+
+
+def _check_krylov_args(op, x, rhs, precond, square):
+    """Check the common arguments of the Krylov methods."""
+    if square and op.domain != op.range:
+        raise ValueError('`op` {!r} must have equal domain and range'
+                         ''.format(op))
+    if x not in op.domain:
+        raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
+                        ''.format(x, op.domain))
+    if rhs not in op.range:
+        raise TypeError('`rhs` {!r} is not in the range of `op` {!r}'
+                        ''.format(rhs, op.range))
+    if precond is not None and not (precond.domain == op.domain and
+                                    precond.range == op.domain):
+        raise ValueError('`precond` {!r} must have domain and range equal '
+                         'to `op.domain` {!r}'.format(precond, op.domain))
+
+
+def lsqr(op, x, rhs, niter, damp=0.0, precond=None, callback=None):
+    """Solve a linear least-squares problem with LSQR.
+
+    This method solves the (damped) least-squares problem ::
+
+        min_x ||op(x) - rhs||^2 + damp^2 * ||x - x0||^2
+
+    for a linear `Operator` ``op``, where ``x0`` is the initial value of
+    ``x``. It is mathematically equivalent to `conjugate_gradient_normal`
+    but numerically more stable, see [PS1982].
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. ``op.adjoint`` must be
+        well-defined.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Number of iterations.
+    damp : nonnegative float, optional
+        Tikhonov damping parameter.
+    precond : linear `Operator`, optional
+        Right preconditioner ``P`` with ``op.domain`` as domain and range.
+        LSQR is then applied to ``op * P``, and the damping acts on the
+        preconditioned variable ``z``, where ``x = x0 + P(z)``.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    lsmr : Similar method with monotonically decreasing normal residual
+    conjugate_gradient_normal : CG on the normal equations
+
+    References
+    ----------
+    [PS1982] Paige, C C, and Saunders, M A. *LSQR: An algorithm for sparse
+    linear equations and sparse least squares*. ACM Transactions on
+    Mathematical Software, 8.1 (1982), pp 43-71.
+    """
+    _check_krylov_args(op, x, rhs, precond, square=False)
+    damp = float(damp)
+    if damp < 0:
+        raise ValueError('`damp` must be nonnegative, got {}'.format(damp))
+
+    # Golub-Kahan bidiagonalization, u = rhs - op(x) / beta
+    u = op(x)
+    u.lincomb(1, rhs, -1, u)
+    beta = u.norm()
+    if beta == 0:
+        return
+    u /= beta
+
+    # v = P^* op^*(u) / alpha, `pv` holds P(v), i.e., is `v` without
+    # preconditioner
+    v = op.adjoint(u)
+    if precond is None:
+        pv = v
+    else:
+        pv = op.domain.element()
+        precond.adjoint(v, out=pv)
+        v.assign(pv)
+    alpha = v.norm()
+    if alpha == 0:
+        return
+    v /= alpha
+    if precond is not None:
+        precond(v, out=pv)
+
+    # Search direction, only needed as P(w)
+    pw = pv.copy()
+    tmp_dom = op.domain.element()
+    tmp_ran = op.range.element()
+
+    phibar = beta
+    rhobar = alpha
+
+    for _ in range(niter):
+        # Continue the bidiagonalization
+        op(pv, out=tmp_ran)
+        u.lincomb(1, tmp_ran, -alpha, u)
+        beta = u.norm()
+        if beta > 0:
+            u /= beta
+            op.adjoint(u, out=tmp_dom)
+            if precond is not None:
+                precond.adjoint(tmp_dom, out=pv)
+                tmp_dom, pv = pv, tmp_dom
+            v.lincomb(1, tmp_dom, -beta, v)
+            alpha = v.norm()
+            if alpha > 0:
+                v /= alpha
+            if precond is not None:
+                precond(v, out=pv)
+
+        # Eliminate the damping parameter
+        if damp > 0:
+            rhobar1 = np.hypot(rhobar, damp)
+            phibar *= rhobar / rhobar1
+        else:
+            rhobar1 = rhobar
+
+        # Eliminate the subdiagonal element beta
+        c, s, rho = _sym_ortho(rhobar1, beta)
+        theta = s * alpha
+        rhobar = -c * alpha
+        phi = c * phibar
+        phibar = s * phibar
+
+        # Update x and the search direction
+        x.lincomb(1, x, phi / rho, pw)
+        pw.lincomb(1, pv, -theta / rho, pw)
+
+        if callback is not None:
+            callback(x)
+
+        if beta == 0 or alpha == 0:
+            return
+
+
+def lsmr(op, x, rhs, niter, damp=0.0, precond=None, callback=None):
+    """Solve a linear least-squares problem with LSMR.
+
+    This method solves the (damped) least-squares problem ::
+
+        min_x ||op(x) - rhs||^2 + damp^2 * ||x - x0||^2
+
+    for a linear `Operator` ``op``, where ``x0`` is the initial value of
+    ``x``. It is mathematically equivalent to MINRES on the normal
+    equations, hence the norm of the normal residual
+    ``op.adjoint(op(x) - rhs)`` decreases monotonically, which makes
+    early termination safer than with `lsqr`, see [FS2011].
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. ``op.adjoint`` must be
+        well-defined.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Number of iterations.
+    damp : nonnegative float, optional
+        Tikhonov damping parameter.
+    precond : linear `Operator`, optional
+        Right preconditioner ``P`` with ``op.domain`` as domain and range.
+        LSMR is then applied to ``op * P``, and the damping acts on the
+        preconditioned variable ``z``, where ``x = x0 + P(z)``.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    lsqr : Similar method with monotonically decreasing residual
+
+    References
+    ----------
+    [FS2011] Fong, D C-L, and Saunders, M A. *LSMR: An iterative algorithm
+    for sparse least-squares problems*. SIAM Journal on Scientific
+    Computing, 33.5 (2011), pp 2950-2971.
+    """
+    _check_krylov_args(op, x, rhs, precond, square=False)
+    damp = float(damp)
+    if damp < 0:
+        raise ValueError('`damp` must be nonnegative, got {}'.format(damp))
+
+    # Golub-Kahan bidiagonalization as in `lsqr`
+    u = op(x)
+    u.lincomb(1, rhs, -1, u)
+    beta = u.norm()
+    if beta == 0:
+        return
+    u /= beta
+
+    v = op.adjoint(u)
+    if precond is None:
+        pv = v
+    else:
+        pv = op.domain.element()
+        precond.adjoint(v, out=pv)
+        v.assign(pv)
+    alpha = v.norm()
+    if alpha == 0:
+        return
+    v /= alpha
+    if precond is not None:
+        precond(v, out=pv)
+
+    # Search directions, only needed as P(h) and P(hbar)
+    ph = pv.copy()
+    phbar = op.domain.zero()
+    tmp_dom = op.domain.element()
+    tmp_ran = op.range.element()
+
+    zetabar = alpha * beta
+    alphabar = alpha
+    rho = 1.0
+    rhobar = 1.0
+    cbar = 1.0
+    sbar = 0.0
+
+    for _ in range(niter):
+        # Continue the bidiagonalization
+        op(pv, out=tmp_ran)
+        u.lincomb(1, tmp_ran, -alpha, u)
+        beta = u.norm()
+        if beta > 0:
+            u /= beta
+            op.adjoint(u, out=tmp_dom)
+            if precond is not None:
+                precond.adjoint(tmp_dom, out=pv)
+                tmp_dom, pv = pv, tmp_dom
+            v.lincomb(1, tmp_dom, -beta, v)
+            alpha = v.norm()
+            if alpha > 0:
+                v /= alpha
+            if precond is not None:
+                precond(v, out=pv)
+
+        # Rotation eliminating the damping parameter
+        _, _, alphahat = _sym_ortho(alphabar, damp)
+
+        # Rotation turning B_k into R_k
+        rhoold = rho
+        c, s, rho = _sym_ortho(alphahat, beta)
+        thetanew = s * alpha
+        alphabar = c * alpha
+
+        # Rotation turning R_k^T into Rbar_k
+        rhobarold = rhobar
+        thetabar = sbar * rho
+        cbar, sbar, rhobar = _sym_ortho(cbar * rho, thetanew)
+        zeta = cbar * zetabar
+        zetabar = -sbar * zetabar
+
+        # Update the search directions and x
+        phbar.lincomb(1, ph, -thetabar * rho / (rhoold * rhobarold), phbar)
+        x.lincomb(1, x, zeta / (rho * rhobar), phbar)
+        ph.lincomb(1, pv, -thetanew / rho, ph)
+
+        if callback is not None:
+            callback(x)
+
+        if beta == 0 or alpha == 0:
+            return
+
+
+def minres(op, x, rhs, niter, precond=None, callback=None):
+    """Solve a self-adjoint linear system with MINRES.
+
+    This method solves the problem ::
+
+        op(x) = rhs
+
+    for a linear and self-adjoint, but possibly indefinite `Operator`
+    ``op`` by minimizing the residual over Krylov subspaces, see
+    [PS1975]. For positive definite operators, `conjugate_gradient` is
+    usually preferable.
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. It must be linear and
+        self-adjoint. This implies in particular that its domain and
+        range are equal.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated in each iteration step.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Number of iterations.
+    precond : linear `Operator`, optional
+        Self-adjoint and positive definite preconditioner approximating
+        the inverse of ``op``.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    conjugate_gradient : Solver for positive definite operators
+    gmres : Solver for general square operators
+
+    References
+    ----------
+    [PS1975] Paige, C C, and Saunders, M A. *Solution of sparse indefinite
+    systems of linear equations*. SIAM Journal on Numerical Analysis, 12.4
+    (1975), pp 617-629.
+    """
+    _check_krylov_args(op, x, rhs, precond, square=True)
+
+    # Lanczos vectors r1, r2 and y = precond(r2)
+    r1 = op(x)
+    r1.lincomb(1, rhs, -1, r1)
+    y = r1.copy() if precond is None else precond(r1)
+    beta1 = r1.inner(y).real
+    if beta1 < 0:
+        raise ValueError('`precond` is not positive definite')
+    if beta1 == 0:
+        return
+    beta1 = np.sqrt(beta1)
+    r2 = r1.copy()
+    v = op.domain.element()
+
+    # Search directions
+    w = op.domain.zero()
+    w1 = op.domain.element()
+    w2 = op.domain.zero()
+
+    oldb = 0.0
+    beta = beta1
+    dbar = 0.0
+    epsln = 0.0
+    phibar = beta1
+    cs = -1.0
+    sn = 0.0
+    eps = np.finfo(float).eps
+
+    for i in range(niter):
+        # Lanczos step
+        v.lincomb(1 / beta, y)
+        op(v, out=y)
+        if i > 0:
+            y.lincomb(1, y, -beta / oldb, r1)
+        alfa = v.inner(y).real
+        y.lincomb(1, y, -alfa / beta, r2)
+        r1, r2 = r2, r1
+        r2.assign(y)
+        if precond is not None:
+            precond(r2, out=y)
+        oldb = beta
+        beta = r2.inner(y).real
+        if beta < 0:
+            raise ValueError('`precond` is not positive definite')
+        beta = np.sqrt(beta)
+
+        # Apply the previous rotation and compute the next one
+        oldeps = epsln
+        delta = cs * dbar + sn * alfa
+        gbar = sn * dbar - cs * alfa
+        epsln = sn * beta
+        dbar = -cs * beta
+        gamma = max(np.hypot(gbar, beta), eps)
+        cs = gbar / gamma
+        sn = beta / gamma
+        phi = cs * phibar
+        phibar = sn * phibar
+
+        # Update the search directions and x
+        w1, w2, w = w2, w, w1
+        w.lincomb(1 / gamma, v, -oldeps / gamma, w1)
+        w.lincomb(1, w, -delta / gamma, w2)
+        x.lincomb(1, x, phi, w)
+
+        if callback is not None:
+            callback(x)
+
+        if beta == 0:
+            return
+
+
+def gmres(op, x, rhs, niter, restart=20, precond=None, callback=None):
+    """Solve a linear system with restarted GMRES.
+
+    This method solves the problem ::
+
+        op(x) = rhs
+
+    for a general linear `Operator` ``op`` with equal domain and range by
+    minimizing the residual over Krylov subspaces of dimension up to
+    ``restart``, see [SS1986].
+
+    Parameters
+    ----------
+    op : linear `Operator`
+        Operator in the inverse problem. Its domain and range must be
+        equal.
+    x : ``op.domain`` element
+        Element to which the result is written. Its initial value is
+        used as starting point of the iteration, and its values are
+        updated after each restart cycle.
+    rhs : ``op.range`` element
+        Right-hand side of the equation defining the inverse problem.
+    niter : int
+        Total number of iterations, i.e., evaluations of ``op``, not
+        counting the residual computation at each restart.
+    restart : positive int, optional
+        Dimension of the Krylov subspace after which the method is
+        restarted. The method stores ``restart + 1`` basis vectors.
+    precond : linear `Operator`, optional
+        Right preconditioner approximating the inverse of ``op``. GMRES
+        is then applied to ``op * precond``.
+    callback : callable, optional
+        Object executing code per restart cycle, e.g. plotting each
+        iterate.
+
+    See Also
+    --------
+    minres : Solver for self-adjoint operators
+
+    References
+    ----------
+    [SS1986] Saad, Y, and Schultz, M H. *GMRES: A generalized minimal
+    residual algorithm for solving nonsymmetric linear systems*. SIAM
+    Journal on Scientific and Statistical Computing, 7.3 (1986),
+    pp 856-869.
+    """
+    _check_krylov_args(op, x, rhs, precond, square=True)
+    restart, restart_in = int(restart), restart
+    if restart <= 0 or restart != restart_in:
+        raise ValueError('`restart` must be a positive integer, got {}'
+                         ''.format(restart_in))
+
+    # Preallocated Krylov basis and Hessenberg matrix, the latter stored
+    # in its rotated (upper triangular) form
+    basis = [op.domain.element() for _ in range(restart + 1)]
+    dtype = complex if op.domain.field == ComplexNumbers() else float
+    hess = np.zeros((restart + 1, restart), dtype=dtype)
+    givens_c = np.zeros(restart, dtype=dtype)
+    givens_s = np.zeros(restart, dtype=dtype)
+    g = np.zeros(restart + 1, dtype=dtype)
+    tmp = op.domain.element()
+
+    num_iter = 0
+    while num_iter < niter:
+        # Residual and first basis vector
+        op(x, out=basis[0])
+        basis[0].lincomb(1, rhs, -1, basis[0])
+        beta = basis[0].norm()
+        if beta == 0:
+            return
+        basis[0] /= beta
+        g[:] = 0
+        g[0] = beta
+
+        # Arnoldi process with modified Gram-Schmidt
+        k = 0
+        breakdown = False
+        while k < restart and num_iter < niter:
+            if precond is None:
+                op(basis[k], out=basis[k + 1])
+            else:
+                precond(basis[k], out=tmp)
+                op(tmp, out=basis[k + 1])
+            for i in range(k + 1):
+                hess[i, k] = basis[k + 1].inner(basis[i])
+                basis[k + 1].lincomb(1, basis[k + 1], -hess[i, k], basis[i])
+            hess[k + 1, k] = basis[k + 1].norm()
+            if hess[k + 1, k] != 0:
+                basis[k + 1] /= hess[k + 1, k]
+
+            # Apply the previous rotations to the new column
+            for i in range(k):
+                h_i = hess[i, k]
+                hess[i, k] = (np.conj(givens_c[i]) * h_i +
+                              np.conj(givens_s[i]) * hess[i + 1, k])
+                hess[i + 1, k] = (-givens_s[i] * h_i +
+                                  givens_c[i] * hess[i + 1, k])
+
+            # New rotation eliminating the subdiagonal element
+            denom = np.hypot(abs(hess[k, k]), abs(hess[k + 1, k]))
+            if denom == 0:
+                # Singular Hessenberg matrix, no further progress possible
+                breakdown = True
+                break
+            givens_c[k] = hess[k, k] / denom
+            givens_s[k] = hess[k + 1, k] / denom
+            hess[k, k] = denom
+            hess[k + 1, k] = 0
+            g[k + 1] = -givens_s[k] * g[k]
+            g[k] = np.conj(givens_c[k]) * g[k]
+
+            k += 1
+            num_iter += 1
+            if abs(g[k]) == 0:
+                break
+
+        if k == 0:
+            return
+
+        # Solve the triangular system and update x
+        coeffs = np.zeros(k, dtype=dtype)
+        for i in reversed(range(k)):
+            coeffs[i] = ((g[i] - hess[i, i + 1:k].dot(coeffs[i + 1:k])) /
+                         hess[i, i])
+        tmp.lincomb(coeffs[0], basis[0])
+        for i in range(1, k):
+            tmp.lincomb(1, tmp, coeffs[i], basis[i])
+        if precond is None:
+            x += tmp
+        else:
+            # The first basis vector is recomputed in the next cycle
+            precond(tmp, out=basis[0])
+            x += basis[0]
+
+        if callback is not None:
+            callback(x)
+
+        if breakdown or abs(g[k]) == 0:
+            return
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
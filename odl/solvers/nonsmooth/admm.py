@@ -42,6 +42,12 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     ----------------
     callback : callable, optional
         Function called with the current iterate after each iteration.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` iterations. The primal
+        residual is ``||Lx - z||`` with scale ``max(||Lx||, ||z||)``, the
+        dual residual is the change ``||z - z_old||`` with scale
+        ``||u||``, see the Notes.
+        Default: ``None``
 
     Notes
     -----
@@ -77,10 +83,22 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
 
     Another name for this algorithm is *split inexact Uzawa method*.
 
+    The residuals for the ``stopping`` criterion are cheap variants of
+    the ones in Section 3.3 of [BPC+2011]: the primal residual
+    :math:`\|L x^{(k+1)} - z^{(k+1)}\|` measures the violation of the
+    constraint :math:`L x = z`, and the dual residual
+    :math:`\|z^{(k+1)} - z^{(k)}\|` omits the application of
+    :math:`L^*` to save an operator evaluation.
+
     References
     ----------
     [PB2014] Parikh, N and Boyd, S. *Proximal Algorithms*. Foundations and
     Trends in Optimization, 1(3) (2014), pp 123-231.
+
+    [BPC+2011] Boyd, S, Parikh, N, Chu, E, Peleato, B, and Eckstein, J.
+    *Distributed Optimization and Statistical Learning via the Alternating
+    Direction Method of Multipliers*. Foundations and Trends in Machine
+    Learning, 3(1) (2011), pp 1-122.
     """
     if not isinstance(L, Operator):
         raise TypeError('`op` {!r} is not an `Operator` instance'
@@ -108,6 +126,8 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     if callback is not None and not callable(callback):
         raise TypeError('`callback` {} is not callable'.format(callback))
 
+    stopping = kwargs.pop('stopping', None)
+
     # Initialize range variables
     z = L.range.zero()
     u = L.range.zero()
@@ -116,12 +136,17 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
     tmp_ran = L(x)
     # Temporary for L^*(Lx + u - z)
     tmp_dom = L.domain.element()
+    # Temporary for the residuals
+    if stopping is not None:
+        tmp_res = L.range.element()
 
     # Store proximals since their initialization may involve computation
     prox_tau_f = f.proximal(tau)
     prox_sigma_g = g.proximal(sigma)
 
-    for _ in range(niter):
+    for i in range(niter):
+        check = stopping is not None and stopping.check_iteration(i)
+
         # tmp_ran has value Lx^k here
         # tmp_dom <- L^*(Lx^k + u^k - z^k)
         tmp_ran += u
@@ -136,6 +161,8 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
         # tmp_ran <- Lx^(k+1)
         L(x, out=tmp_ran)
         # z^(k+1) <- prox[sigma*g](Lx^(k+1) + u^k)
+        if check:
+            tmp_res.assign(z)
         prox_sigma_g(tmp_ran + u, out=z)  # 1 copy here
 
         # u^(k+1) = u^k + Lx^(k+1) - z^(k+1)
@@ -145,6 +172,15 @@ def admm_linearized(x, f, g, L, tau, sigma, niter, **kwargs):
         if callback is not None:
             callback(x)
 
+        if check:
+            tmp_res.lincomb(1, z, -1, tmp_res)
+            dual_res = tmp_res.norm()
+            tmp_res.lincomb(1, tmp_ran, -1, z)
+            primal_res = tmp_res.norm()
+            if stopping(i, primal_res, dual_res,
+                        max(tmp_ran.norm(), z.norm()), u.norm()):
+                break
+
 
 def admm_linearized_simple(x, f, g, L, tau, sigma, niter, **kwargs):
     """Non-optimized version of ``admm_linearized``.
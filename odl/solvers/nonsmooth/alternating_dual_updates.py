@@ -21,7 +21,7 @@ __all__ = ('adupdates',)
 
 
 def adupdates(x, g, L, stepsize, inner_stepsizes, niter, random=False,
-              callback=None, callback_loop='outer'):
+              callback=None, callback_loop='outer', stopping=None):
     r"""Alternating Dual updates method.
 
     The Alternating Dual (AD) updates method of McGaffin and Fessler `[MF2015]
@@ -64,6 +64,11 @@ def adupdates(x, g, L, stepsize, inner_stepsizes, niter, random=False,
        iteration, i.e., after each dual update. If 'outer', the ``callback``
        function is called after each outer iteration, i.e., after each primal
        update.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` outer iterations. The
+        primal and dual residuals are the norms of the changes of ``x``
+        and of the dual variables ``v = (v_1, ..., v_m)`` in one outer
+        iteration, with scales ``||x||`` and ``||v||``, respectively.
 
     Notes
     -----
@@ -164,8 +169,17 @@ def adupdates(x, g, L, stepsize, inner_stepsizes, niter, random=False,
                                        else stepsize * np.asarray(inner_ss))
              for (func, inner_ss) in zip(g, inner_stepsizes)]
 
+    # Copy of the previous primal iterate for the stopping criterion
+    if stopping is not None:
+        x_prev = x.space.element()
+
     # Iteratively find a solution
-    for _ in range(niter):
+    for k in range(niter):
+        check = stopping is not None and stopping.check_iteration(k)
+        if check:
+            x_prev.assign(x)
+            dual_res_sq = 0.0
+
         # Update x = x - 1/stepsize * sum([ops[i].adjoint(duals[i])
         # for i in range(length)])
         for i in range(length):
@@ -183,14 +197,24 @@ def adupdates(x, g, L, stepsize, inner_stepsizes, niter, random=False,
             arg = duals[j] + step * L[j](x)
             tmp_ran = tmp_rans[L[j].range]
             proxs[j](arg, out=tmp_ran)
-            x -= 1.0 / stepsize * L[j].adjoint(tmp_ran - duals[j])
+            dual_diff = tmp_ran - duals[j]
+            x -= 1.0 / stepsize * L[j].adjoint(dual_diff)
             duals[j].assign(tmp_ran)
+            if check:
+                dual_res_sq += dual_diff.norm() ** 2
 
             if callback is not None and callback_loop == 'inner':
                 callback(x)
         if callback is not None and callback_loop == 'outer':
             callback(x)
 
+        if check:
+            x_prev.lincomb(1, x, -1, x_prev)
+            dual_norm = np.sqrt(sum(dual.norm() ** 2 for dual in duals))
+            if stopping(k, x_prev.norm(), np.sqrt(dual_res_sq),
+                        x.norm(), dual_norm):
+                break
+
 
 def adupdates_simple(x, g, L, stepsize, inner_stepsizes, niter,
                      random=False):
@@ -72,6 +72,12 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
     lam : float or callable, optional
         Overrelaxation step size. If callable, it should take an index
         (starting at zero) and return the corresponding step size.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` iterations. The primal
+        and dual residuals are the norms of the changes of the
+        fixed-point variables ``x`` and ``v = (v_1, ..., v_n)`` in
+        [BH2013], with scales ``||x||`` and ``||v||``, respectively.
+        Default: ``None``
 
     Notes
     -----
@@ -155,6 +161,8 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
         raise ValueError('`lam` must callable or a number between 0 and 2')
     lam = lam_in if callable(lam_in) else lambda _: lam_in
 
+    stopping = kwargs.pop('stopping', None)
+
     # Check for unused parameters
     if kwargs:
         raise TypeError('got unexpected keyword arguments: {}'.format(kwargs))
@@ -228,6 +236,21 @@ def douglas_rachford_pd(x, f, g, L, niter, tau=None, sigma=None,
         if callback is not None:
             callback(p1)
 
+        if stopping is not None and stopping.check_iteration(k):
+            # The changes of `x` and `v[i]` are `lam_k` times `z1 - p1`
+            # and `z2[i] - p2[i]`; `tmp_domain` and `z2` are free here.
+            tmp_domain.lincomb(lam_k, z1, -lam_k, p1)
+            primal_res = tmp_domain.norm()
+            dual_res_sq = 0.0
+            dual_norm_sq = 0.0
+            for i in range(m):
+                z2[i].lincomb(lam_k, z2[i], -lam_k, p2[i])
+                dual_res_sq += z2[i].norm() ** 2
+                dual_norm_sq += v[i].norm() ** 2
+            if stopping(k, primal_res, np.sqrt(dual_res_sq),
+                        x.norm(), np.sqrt(dual_norm_sq)):
+                break
+
     # The final result is actually in p1 according to the algorithm, so we need
     # to assign here.
     x.assign(p1)
@@ -10,6 +10,8 @@
 
 from __future__ import print_function, division, absolute_import
 
+import numpy as np
+
 from odl.operator import Operator
 
 
@@ -68,6 +70,12 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
     l : sequence of `Functional`'s, optional
         The functionals ``l_i``. Needs to have ``g_i.convex_conj.gradient``.
         If omitted, the simpler problem without ``l_i``  will be considered.
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` iterations. The primal
+        and dual residuals are the norms of the changes of ``x`` and of
+        the dual variables ``v = (v_1, ..., v_n)``, with scales ``||x||``
+        and ``||v||``, respectively.
+        Default: ``None``
 
     Notes
     -----
@@ -161,6 +169,8 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
             raise ValueError('`grad_cc_l` not same length as `L`')
         grad_cc_l = [li.convex_conj.gradient for li in l]
 
+    stopping = kwargs.pop('stopping', None)
+
     if kwargs:
         raise TypeError('unexpected keyword argument: {}'.format(kwargs))
 
@@ -168,7 +178,19 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
     v = [Li.range.zero() for Li in L]
     y = x.space.zero()
 
+    # Copies of the previous iterates, only updated when checking the
+    # stopping criterion
+    if stopping is not None:
+        x_prev = x.space.element()
+        v_prev = [Li.range.element() for Li in L]
+
     for k in range(niter):
+        check = stopping is not None and stopping.check_iteration(k)
+        if check:
+            x_prev.assign(x)
+            for vi, vi_prev in zip(v, v_prev):
+                vi_prev.assign(vi)
+
         x_old = x
 
         tmp_1 = grad_h(x) + sum(Li.adjoint(vi) for Li, vi in zip(L, v))
@@ -188,3 +210,15 @@ def forward_backward_pd(x, f, g, L, h, tau, sigma, niter,
 
         if callback is not None:
             callback(x)
+
+        if check:
+            x_prev.lincomb(1, x, -1, x_prev)
+            dual_res_sq = 0.0
+            dual_norm_sq = 0.0
+            for vi, vi_prev in zip(v, v_prev):
+                vi_prev.lincomb(1, vi, -1, vi_prev)
+                dual_res_sq += vi_prev.norm() ** 2
+                dual_norm_sq += vi.norm() ** 2
+            if stopping(k, x_prev.norm(), np.sqrt(dual_res_sq),
+                        x.norm(), np.sqrt(dual_norm_sq)):
+                break
@@ -15,14 +15,21 @@ non-smooth convex optimization problems in imaging.
 from __future__ import print_function, division, absolute_import
 import numpy as np
 
-from odl.operator import Operator
+from odl.discr.diff_ops import (
+    PartialDerivative, Gradient, Divergence, finite_diff)
+from odl.operator import (
+    Operator, BroadcastOperator, ReductionOperator, ProductSpaceOperator,
+    ScalingOperator, MultiplyOperator)
+from odl.operator.operator import (
+    OperatorLeftScalarMult, OperatorRightScalarMult)
+from odl.space import ProductSpace
 
 
-__all__ = ('pdhg', 'pdhg_stepsize')
+__all__ = ('pdhg', 'pdhg_adaptive', 'pdhg_linesearch', 'pdhg_stepsize',
+           'pdhg_diagonal_stepsize')
 
 
 # TODO: add dual gap as convergence measure
-# TODO: diagonal preconditioning
 
 def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
     r"""Primal-dual hybrid gradient algorithm for convex optimization.
@@ -58,11 +65,15 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         ``f``.
     niter : non-negative int
         Number of iterations.
-    tau : float, optional
-        Step size parameter for ``g``.
+    tau : float or ``L.domain`` element, optional
+        Step size parameter for ``f``. An element defines a step size
+        for each point (diagonal preconditioning), see
+        `pdhg_diagonal_stepsize`.
         Default: Sufficient for convergence, see `pdhg_stepsize`.
-    sigma : sequence of floats, optional
-        Step size parameters for ``f``.
+    sigma : float or ``L.range`` element, optional
+        Step size parameter for ``g``. An element defines a step size
+        for each point (diagonal preconditioning), see
+        `pdhg_diagonal_stepsize`.
         Default: Sufficient for convergence, see `pdhg_stepsize`.
 
     Other Parameters
@@ -95,6 +106,12 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         Required to resume iteration. For ``None``, ``op.range.zero()``
         is used.
         Default: ``None``
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` iterations. The primal
+        and dual residuals are ``||x - x_old||`` and ``||y - y_old||``,
+        the norms of the changes of the iterates, with scales ``||x||``
+        and ``||y||``, respectively.
+        Default: ``None``
 
     Notes
     -----
@@ -118,6 +135,15 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
 
     where :math:`\|L\|` is the operator norm of :math:`L`.
 
+    For badly scaled problems, e.g., a ray transform combined with a
+    gradient, a single step size for all variables leads to slow
+    convergence. The diagonal preconditioning of [CP2011b] replaces
+    :math:`\tau` and :math:`\sigma` by positive diagonal matrices, i.e.,
+    element-valued step sizes, which can be computed with
+    `pdhg_diagonal_stepsize`. The proximals of ``f`` and
+    ``g.convex_conj`` then need to support element-valued step sizes.
+    Acceleration is only possible with scalar step sizes.
+
     It is often of interest to study problems that involve several operators,
     for example the classical TV regularized problem
 
@@ -225,6 +251,13 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
     if gamma_primal is not None and gamma_dual is not None:
         raise ValueError('Only one acceleration parameter can be used')
 
+    scalar_steps = np.isscalar(tau) and np.isscalar(sigma)
+    if not scalar_steps:
+        if gamma_primal is not None or gamma_dual is not None:
+            raise ValueError('acceleration requires scalar step sizes')
+        tau = tau if np.isscalar(tau) else L.domain.element(tau)
+        sigma = sigma if np.isscalar(sigma) else L.range.element(sigma)
+
     # Callback object
     callback = kwargs.pop('callback', None)
     if callback is not None and not callable(callback):
@@ -247,6 +280,11 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         raise TypeError('`y` {} is not in the range of `L` '
                         '{}'.format(y.space, L.range))
 
+    # Stopping criterion, needs a copy of the previous dual iterate
+    stopping = kwargs.pop('stopping', None)
+    if stopping is not None:
+        y_old = L.range.element()
+
     # Get the proximals
     proximal_primal = f.proximal
     proximal_dual = g.convex_conj.proximal
@@ -263,14 +301,22 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
     dual_tmp = L.range.element()
     primal_tmp = L.domain.element()
 
-    for _ in range(niter):
+    for i in range(niter):
+        check = stopping is not None and stopping.check_iteration(i)
+
         # Copy required for relaxation
         x_old.assign(x)
+        if check:
+            y_old.assign(y)
 
         # Gradient ascent in the dual variable y
         # Compute dual_tmp = y + sigma * L(x_relax)
         L(x_relax, out=dual_tmp)
-        dual_tmp.lincomb(1, y, sigma, dual_tmp)
+        if np.isscalar(sigma):
+            dual_tmp.lincomb(1, y, sigma, dual_tmp)
+        else:
+            dual_tmp *= sigma
+            dual_tmp += y
 
         # Apply the dual proximal
         if not proximal_constant:
@@ -280,7 +326,11 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         # Gradient descent in the primal variable x
         # Compute primal_tmp = x + (- tau) * L.derivative(x).adjoint(y)
         L.derivative(x).adjoint(y, out=primal_tmp)
-        primal_tmp.lincomb(1, x, -tau, primal_tmp)
+        if np.isscalar(tau):
+            primal_tmp.lincomb(1, x, -tau, primal_tmp)
+        else:
+            primal_tmp *= tau
+            primal_tmp.lincomb(1, x, -1, primal_tmp)
 
         # Apply the primal proximal
         if not proximal_constant:
@@ -304,6 +354,554 @@ def pdhg(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
         if callback is not None:
             callback(x)
 
+        if check:
+            primal_tmp.lincomb(1, x, -1, x_old)
+            dual_tmp.lincomb(1, y, -1, y_old)
+            if stopping(i, primal_tmp.norm(), dual_tmp.norm(),
+                        x.norm(), y.norm()):
+                break
+
+
+def pdhg_adaptive(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
+    r"""PDHG with adaptive primal-dual balancing of the step sizes.
+
+    This variant of `pdhg` solves the same problem ::
+
+        min_{x in X} f(x) + g(L x)
+
+    but adapts ``tau`` and ``sigma`` during the iteration, following
+    [GLY+2015]. The step sizes are shifted towards the primal or dual
+    update if one of the primal and dual residuals is much larger than
+    the other, and a backtracking step reduces both if they are too large
+    for convergence. Hence, the initial step sizes need not satisfy
+    ``tau * sigma * ||L||^2 < 1``. The adaptation can save iterations
+    if the ratio of ``tau`` and ``sigma`` is badly chosen, e.g., for
+    badly scaled operators. Otherwise, the step sizes are rarely changed,
+    and the method behaves like `pdhg`.
+
+    Parameters
+    ----------
+    x : ``L.domain`` element
+        Starting point of the iteration, updated in-place.
+    f : `Functional`
+        The function ``f`` in the problem definition. Needs to have
+        ``f.proximal``.
+    g : `Functional`
+        The function ``g`` in the problem definition. Needs to have
+        ``g.convex_conj.proximal``.
+    L : linear `Operator`
+        The linear operator that should be applied before ``g``. Its range
+        must match the domain of ``g`` and its domain must match the
+        domain of ``f``.
+    niter : non-negative int
+        Number of iterations.
+    tau : positive float, optional
+        Initial step size parameter for ``f``.
+        Default: See `pdhg_stepsize`.
+    sigma : positive float, optional
+        Initial step size parameter for ``g``.
+        Default: See `pdhg_stepsize`.
+
+    Other Parameters
+    ----------------
+    callback : callable, optional
+        Function called with the current iterate after each iteration.
+    alpha : float in (0, 1), optional
+        Initial adaptation level, i.e., the relative change of the step
+        sizes when balancing. Default: 0.5
+    eta : float in (0, 1), optional
+        Factor by which ``alpha`` is reduced after each adaptation.
+        Default: 0.95
+    delta : float larger than 1, optional
+        Tolerated ratio of primal and dual residual norms before the step
+        sizes are adapted. Values close to 1 lead to frequent changes
+        of the step sizes, which can slow down convergence. Default: 3.0
+    scale : positive float, optional
+        Scaling of the dual residual relative to the primal one, which
+        can be used to favor one of them. Note that the ratio of the
+        residuals does not change if the data and ``g`` are scaled by
+        the same factor. Default: 1.0
+    restart : bool, optional
+        If ``True``, restart the iteration from the average of the
+        iterates when the primal-dual gap has decreased sufficiently,
+        see Notes. Default: ``False``
+    x_relax : ``op.domain`` element, optional
+        Required to resume iteration. For ``None``, a copy of the primal
+        variable ``x`` is used.
+        Default: ``None``
+    y : ``op.range`` element, optional
+        Required to resume iteration. For ``None``, ``op.range.zero()``
+        is used.
+        Default: ``None``
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` iterations, with residuals
+        as in `pdhg`.
+        Default: ``None``
+
+    Notes
+    -----
+    With the iterates of `pdhg`, the primal and dual residuals are
+
+    .. math::
+        p_{k+1} = \frac{x_k - x_{k+1}}{\tau_k}, \quad
+        d_{k+1} = \frac{y_{k+1} - y_k}{\sigma_k} +
+        L (x_{k+1} - \bar{x}_k).
+
+    If :math:`\|p_{k+1}\| > \delta s \|d_{k+1}\|`, the primal step size is
+    increased as :math:`\tau_{k+1} = \tau_k / (1 - \alpha_k)` and the dual
+    step size decreased as :math:`\sigma_{k+1} = \sigma_k (1 - \alpha_k)`,
+    and vice versa if :math:`\|p_{k+1}\| < s \|d_{k+1}\| / \delta`. After
+    each adaptation, :math:`\alpha_{k+1} = \eta \alpha_k`. The residuals
+    of PDHG typically oscillate, hence the value :math:`\delta = 1.5`
+    used in [GLY+2015] leads to frequent changes of the step sizes back
+    and forth, which can make the iteration slower than `pdhg`. Both
+    step sizes are reduced by the factor :math:`0.95 / b_{k+1}` if
+
+    .. math::
+        b_{k+1} = -\frac{2 \tau_k \sigma_k
+        \langle L (x_{k+1} - x_k), y_{k+1} - y_k \rangle}
+        {0.75 (\sigma_k \|x_{k+1} - x_k\|^2 +
+        \tau_k \|y_{k+1} - y_k\|^2)} > 1.
+
+    The iterates :math:`L x_k` are updated by linearity, hence one
+    iteration costs one evaluation of ``L`` and one of ``L.adjoint``,
+    as in `pdhg`.
+
+    With ``restart=True``, the primal-dual gap
+
+    .. math::
+        G(x, y) = f(x) + g(L x) + f^*(-L^* y) + g^*(y)
+
+    is evaluated at the current iterate and at the average of the
+    iterates since the last restart, following [ALH2021]. If the smaller
+    of the two has decreased by a factor 0.2 compared to the gap at the
+    last restart, or by a factor 0.8 but increased compared to the
+    previous iteration, the iteration is restarted from that point. This
+    requires ``f.convex_conj`` and ``g.convex_conj`` to be evaluable, and
+    has no effect as long as the gap is infinite, e.g., for iterates that
+    are infeasible for :math:`f^*`.
+
+    References
+    ----------
+    [GLY+2015] Goldstein, T, Li, M, Yuan, X, Esser, E, and Baraniuk, R.
+    *Adaptive Primal-Dual Hybrid Gradient Methods for Saddle-Point
+    Problems*. arXiv:1305.0546, 2015.
+
+    [ALH2021] Applegate, D, Lubin, M, and Hinder, O. *Faster first-order
+    primal-dual methods for linear programming using restarts and
+    sharpness*. Mathematical Programming, 2022.
+
+    See Also
+    --------
+    pdhg : Variant with fixed step sizes
+    pdhg_linesearch : Variant with line search
+    """
+    _check_pdhg_args(x, f, L, niter)
+    tau, sigma = pdhg_stepsize(L, tau, sigma)
+
+    alpha = float(kwargs.pop('alpha', 0.5))
+    if not 0 < alpha < 1:
+        raise ValueError('`alpha` must lie in (0, 1), got {}'.format(alpha))
+    alpha_init = alpha
+    eta = float(kwargs.pop('eta', 0.95))
+    if not 0 < eta < 1:
+        raise ValueError('`eta` must lie in (0, 1), got {}'.format(eta))
+    delta = float(kwargs.pop('delta', 3.0))
+    if delta <= 1:
+        raise ValueError('`delta` must be larger than 1, got {}'
+                         ''.format(delta))
+    scale = float(kwargs.pop('scale', 1.0))
+    if scale <= 0:
+        raise ValueError('`scale` must be positive, got {}'.format(scale))
+
+    callback = kwargs.pop('callback', None)
+    if callback is not None and not callable(callback):
+        raise TypeError('`callback` {} is not callable'
+                        ''.format(callback))
+
+    x_relax = kwargs.pop('x_relax', None)
+    if x_relax is None:
+        x_relax = x.copy()
+    elif x_relax not in L.domain:
+        raise TypeError('`x_relax` {} is not in the domain of '
+                        '`L` {}'.format(x_relax.space, L.domain))
+
+    y = kwargs.pop('y', None)
+    if y is None:
+        y = L.range.zero()
+    elif y not in L.range:
+        raise TypeError('`y` {} is not in the range of `L` '
+                        '{}'.format(y.space, L.range))
+
+    restart = kwargs.pop('restart', False)
+    stopping = kwargs.pop('stopping', None)
+
+    # Constants of the backtracking step, see [GLY+2015]
+    backtrack_factor = 0.95
+    backtrack_gamma = 0.75
+
+    proximal_primal = f.proximal
+    proximal_dual = g.convex_conj.proximal
+
+    # `L x` and `L x_relax`, updated by linearity
+    Lx = L(x)
+    Lx_relax = L(x_relax)
+    Lx_old = L.range.element()
+    Ladj_y = L.adjoint(y)
+
+    x_old = L.domain.element()
+    y_old = L.range.element()
+    dual_tmp = L.range.element()
+    primal_tmp = L.domain.element()
+
+    if restart:
+        restarter = _GapRestart(f, g, x, y, Lx, Ladj_y)
+
+    for i in range(niter):
+        x_old.assign(x)
+        y_old.assign(y)
+        Lx_old.assign(Lx)
+
+        # Dual update y = prox[sigma * g^*](y + sigma * L(x_relax))
+        dual_tmp.lincomb(1, y, sigma, Lx_relax)
+        proximal_dual(sigma)(dual_tmp, out=y)
+        L.adjoint(y, out=Ladj_y)
+
+        # Primal update x = prox[tau * f](x - tau * L^*(y))
+        primal_tmp.lincomb(1, x, -tau, Ladj_y)
+        proximal_primal(tau)(primal_tmp, out=x)
+        L(x, out=Lx)
+
+        # Residual norms, using `primal_tmp` and `dual_tmp` as temporaries
+        primal_tmp.lincomb(1, x_old, -1, x)
+        dx_norm = primal_tmp.norm()
+        primal_res = dx_norm / tau
+        dual_tmp.lincomb(1 / sigma, y, -1 / sigma, y_old)
+        dual_tmp.lincomb(1, dual_tmp, 1, Lx)
+        dual_tmp.lincomb(1, dual_tmp, -1, Lx_relax)
+        dual_res = dual_tmp.norm()
+
+        # Backtracking quantity b, reusing the temporaries. Since the dual
+        # variable is updated first, the roles of primal and dual variable
+        # are swapped compared to [GLY+2015], hence the sign of b.
+        dual_tmp.lincomb(1, y, -1, y_old)
+        dy_norm = dual_tmp.norm()
+        Lx_relax.lincomb(1, Lx, -1, Lx_old)  # L(x - x_old)
+        denom = backtrack_gamma * (sigma * dx_norm ** 2 +
+                                   tau * dy_norm ** 2)
+        if denom > 0:
+            b = -2 * tau * sigma * Lx_relax.inner(dual_tmp) / denom
+        else:
+            b = 0.0
+
+        # Adapt the step sizes
+        if b > 1:
+            tau *= backtrack_factor / b
+            sigma *= backtrack_factor / b
+        elif primal_res > delta * scale * dual_res:
+            tau /= 1 - alpha
+            sigma *= 1 - alpha
+            alpha *= eta
+        elif primal_res * delta < scale * dual_res:
+            tau *= 1 - alpha
+            sigma /= 1 - alpha
+            alpha *= eta
+
+        # Over-relaxation
+        x_relax.lincomb(2, x, -1, x_old)
+        Lx_relax.lincomb(2, Lx, -1, Lx_old)
+
+        if restart and restarter.update(x, y, Lx, Ladj_y):
+            x_relax.assign(x)
+            Lx_relax.assign(Lx)
+            alpha = alpha_init
+
+        if callback is not None:
+            callback(x)
+
+        if stopping is not None and stopping.check_iteration(i):
+            primal_tmp.lincomb(1, x, -1, x_old)
+            dual_tmp.lincomb(1, y, -1, y_old)
+            if stopping(i, primal_tmp.norm(), dual_tmp.norm(),
+                        x.norm(), y.norm()):
+                break
+
+
+def pdhg_linesearch(x, f, g, L, niter, tau=None, sigma=None, **kwargs):
+    r"""PDHG with line search for the step sizes.
+
+    This variant of `pdhg` solves the same problem ::
+
+        min_{x in X} f(x) + g(L x)
+
+    with the line search of [MP2018], which tries to increase the step
+    sizes in each iteration and reduces them until a local condition
+    holds. It does not need an estimate of ``||L||``, and the step sizes
+    adapt to the local curvature of the problem.
+
+    Parameters
+    ----------
+    x : ``L.domain`` element
+        Starting point of the iteration, updated in-place.
+    f : `Functional`
+        The function ``f`` in the problem definition. Needs to have
+        ``f.proximal``.
+    g : `Functional`
+        The function ``g`` in the problem definition. Needs to have
+        ``g.convex_conj.proximal``.
+    L : linear `Operator`
+        The linear operator that should be applied before ``g``. Its range
+        must match the domain of ``g`` and its domain must match the
+        domain of ``f``.
+    niter : non-negative int
+        Number of iterations.
+    tau : positive float, optional
+        Initial step size parameter for ``f``.
+        Default: See `pdhg_stepsize`.
+    sigma : positive float, optional
+        Initial step size parameter for ``g``. The ratio ``sigma / tau``
+        is kept fixed during the iteration.
+        Default: See `pdhg_stepsize`.
+
+    Other Parameters
+    ----------------
+    callback : callable, optional
+        Function called with the current iterate after each iteration.
+    mu : float in (0, 1), optional
+        Factor by which the step sizes are reduced in the line search.
+        Default: 0.7
+    delta : float in (0, 1), optional
+        Line search parameter, see Notes. Default: 0.99
+    restart : bool, optional
+        If ``True``, restart the iteration from the average of the
+        iterates when the primal-dual gap has decreased sufficiently,
+        see `pdhg_adaptive`. Default: ``False``
+    y : ``op.range`` element, optional
+        Required to resume iteration. For ``None``, ``op.range.zero()``
+        is used.
+        Default: ``None``
+    stopping : `StoppingCriterion`, optional
+        Criterion for stopping before ``niter`` iterations, with residuals
+        as in `pdhg`.
+        Default: ``None``
+
+    Notes
+    -----
+    With :math:`\beta = \sigma / \tau`, iteration :math:`k` computes
+
+    .. math::
+        x_k = \mathrm{prox}_{\tau_{k-1} f}(x_{k-1} - \tau_{k-1} L^* y_k),
+
+    then starts with :math:`\tau_k = \tau_{k-1} \sqrt{1 + \theta_{k-1}}`
+    and repeats
+
+    .. math::
+        \theta_k = \tau_k / \tau_{k-1}, \quad
+        \bar{x}_k = x_k + \theta_k (x_k - x_{k-1}),
+
+        y_{k+1} = \mathrm{prox}_{\beta \tau_k g^*}
+        (y_k + \beta \tau_k L \bar{x}_k),
+
+    with :math:`\tau_k \leftarrow \mu \tau_k` until
+
+    .. math::
+        \sqrt{\beta} \tau_k \|L^* y_{k+1} - L^* y_k\| \leq
+        \delta \|y_{k+1} - y_k\|.
+
+    Since :math:`L \bar{x}_k` is computed by linearity, one iteration
+    costs one evaluation of ``L`` and one of ``L.adjoint`` per line search
+    step.
+
+    References
+    ----------
+    [MP2018] Malitsky, Y, and Pock, T. *A first-order primal-dual
+    algorithm with linesearch*. SIAM Journal on Optimization, 28 (2018),
+    pp 411-432.
+
+    See Also
+    --------
+    pdhg : Variant with fixed step sizes
+    pdhg_adaptive : Variant with adaptive step sizes
+    """
+    _check_pdhg_args(x, f, L, niter)
+    tau, sigma = pdhg_stepsize(L, tau, sigma)
+    beta = sigma / tau
+
+    mu = float(kwargs.pop('mu', 0.7))
+    if not 0 < mu < 1:
+        raise ValueError('`mu` must lie in (0, 1), got {}'.format(mu))
+    delta = float(kwargs.pop('delta', 0.99))
+    if not 0 < delta < 1:
+        raise ValueError('`delta` must lie in (0, 1), got {}'.format(delta))
+
+    callback = kwargs.pop('callback', None)
+    if callback is not None and not callable(callback):
+        raise TypeError('`callback` {} is not callable'
+                        ''.format(callback))
+
+    y = kwargs.pop('y', None)
+    if y is None:
+        y = L.range.zero()
+    elif y not in L.range:
+        raise TypeError('`y` {} is not in the range of `L` '
+                        '{}'.format(y.space, L.range))
+
+    restart = kwargs.pop('restart', False)
+
+    # Stopping criterion, needs a copy of the previous primal iterate
+    stopping = kwargs.pop('stopping', None)
+    if stopping is not None:
+        x_old = L.domain.element()
+
+    proximal_primal = f.proximal
+    proximal_dual = g.convex_conj.proximal
+
+    # `L x` and `L^* y`, updated by linearity and in the line search
+    Lx = L(x)
+    Lx_old = L.range.element()
+    Ladj_y = L.adjoint(y)
+    Ladj_y_new = L.domain.element()
+    y_new = L.range.element()
+
+    primal_tmp = L.domain.element()
+    dual_tmp = L.range.element()
+    theta = 1.0
+
+    if restart:
+        restarter = _GapRestart(f, g, x, y, Lx, Ladj_y)
+
+    for i in range(niter):
+        check = stopping is not None and stopping.check_iteration(i)
+        if check:
+            x_old.assign(x)
+
+        # Primal update x = prox[tau * f](x - tau * L^*(y))
+        Lx_old.assign(Lx)
+        primal_tmp.lincomb(1, x, -tau, Ladj_y)
+        proximal_primal(tau)(primal_tmp, out=x)
+        L(x, out=Lx)
+
+        # Line search for the new step size
+        tau_new = tau * np.sqrt(1 + theta)
+        while True:
+            theta = tau_new / tau
+            sigma = beta * tau_new
+
+            # Dual update with L(x_relax) = (1 + theta) L(x) - theta L(x_old)
+            dual_tmp.lincomb(1 + theta, Lx, -theta, Lx_old)
+            dual_tmp.lincomb(1, y, sigma, dual_tmp)
+            proximal_dual(sigma)(dual_tmp, out=y_new)
+            L.adjoint(y_new, out=Ladj_y_new)
+
+            primal_tmp.lincomb(1, Ladj_y_new, -1, Ladj_y)
+            dual_tmp.lincomb(1, y_new, -1, y)
+            if (np.sqrt(beta) * tau_new * primal_tmp.norm() <=
+                    delta * dual_tmp.norm()):
+                break
+            tau_new *= mu
+
+        tau = tau_new
+        y.assign(y_new)
+        Ladj_y.assign(Ladj_y_new)
+
+        if check:
+            # `dual_tmp` holds the change of `y` from the line search
+            dual_res = dual_tmp.norm()
+            primal_tmp.lincomb(1, x, -1, x_old)
+            primal_res = primal_tmp.norm()
+
+        if restart and restarter.update(x, y, Lx, Ladj_y):
+            theta = 1.0
+
+        if callback is not None:
+            callback(x)
+
+        if check and stopping(i, primal_res, dual_res, x.norm(), y.norm()):
+            break
+
+
+def _check_pdhg_args(x, f, L, niter):
+    """Check the common arguments of the `pdhg` variants."""
+    if not isinstance(L, Operator):
+        raise TypeError('`op` {!r} is not an `Operator` instance'
+                        ''.format(L))
+    if not L.is_linear:
+        raise ValueError('`op` {!r} is not linear'.format(L))
+    if x not in L.domain:
+        raise TypeError('`x` {!r} is not in the domain of `op` {!r}'
+                        ''.format(x, L.domain))
+    if f.domain != L.domain:
+        raise TypeError('`f.domain` {!r} must equal `op.domain` {!r}'
+                        ''.format(f.domain, L.domain))
+    if not isinstance(niter, int) or niter < 0:
+        raise ValueError('`niter` {} not understood'
+                         ''.format(niter))
+
+
+class _GapRestart(object):
+
+    """Restart scheme for PDHG variants based on the primal-dual gap.
+
+    The scheme keeps the averages of the iterates since the last restart
+    and decides after each iteration whether the current iterate or the
+    average reduce the gap enough for a restart, see [ALH2021] in
+    `pdhg_adaptive`. Restarts happen in-place in the given iterates.
+    """
+
+    # Gap reduction factors, see [ALH2021]
+    sufficient_decay = 0.2
+    necessary_decay = 0.8
+
+    def __init__(self, f, g, x, y, Lx, Ladj_y):
+        """Initialize a new instance with the starting point."""
+        self.f = f
+        self.g = g
+        self.gap_last_restart = self.gap(x, y, Lx, Ladj_y)
+        self.gap_prev = np.inf
+        self.averages = [x.copy(), y.copy(), Lx.copy(), Ladj_y.copy()]
+        self.num_averaged = 1
+
+    def gap(self, x, y, Lx, Ladj_y):
+        """Return the primal-dual gap at ``(x, y)``."""
+        return (self.f(x) + self.g(Lx) +
+                self.f.convex_conj(-Ladj_y) + self.g.convex_conj(y))
+
+    def update(self, x, y, Lx, Ladj_y):
+        """Update the averages and restart if necessary.
+
+        Returns
+        -------
+        restarted : bool
+            ``True`` if the iterates were replaced by the restart point.
+        """
+        iterates = [x, y, Lx, Ladj_y]
+        n = self.num_averaged
+        for avg, it in zip(self.averages, iterates):
+            avg.lincomb(n / (n + 1), avg, 1 / (n + 1), it)
+        self.num_averaged += 1
+
+        gap_current = self.gap(*iterates)
+        gap_average = self.gap(*self.averages)
+        gap = min(gap_current, gap_average)
+        do_restart = (
+            gap <= self.sufficient_decay * self.gap_last_restart or
+            (gap <= self.necessary_decay * self.gap_last_restart and
+             gap > self.gap_prev))
+        self.gap_prev = gap
+        if not do_restart:
+            return False
+
+        if gap_average < gap_current:
+            for avg, it in zip(self.averages, iterates):
+                it.assign(avg)
+        else:
+            for avg, it in zip(self.averages, iterates):
+                avg.assign(it)
+        self.num_averaged = 1
+        self.gap_last_restart = gap
+        self.gap_prev = np.inf
+        return True
+
 
 def pdhg_stepsize(L, tau=None, sigma=None):
     r"""Default step sizes for `pdhg`.
@@ -355,9 +953,12 @@ def pdhg_stepsize(L, tau=None, sigma=None):
           \sigma = \frac{0.9}{\tau \|L\|^2}
 
     - If both are given, they are returned as-is without further validation.
+      Element-valued step sizes are only possible in this case.
     """
     if tau is not None and sigma is not None:
-        return float(tau), float(sigma)
+        tau = float(tau) if np.isscalar(tau) else tau
+        sigma = float(sigma) if np.isscalar(sigma) else sigma
+        return tau, sigma
 
     L_norm = L.norm(estimate=True) if isinstance(L, Operator) else float(L)
     if tau is None and sigma is None:
@@ -371,6 +972,204 @@ def pdhg_stepsize(L, tau=None, sigma=None):
         return float(tau), sigma
 
 
+def pdhg_diagonal_stepsize(L):
+    r"""Diagonally preconditioned step sizes for `pdhg`.
+
+    The step sizes are the inverse absolute row sums of the matrices
+    representing ``L`` and ``L.adjoint``, which is the diagonal
+    preconditioning from [CP2011b] with :math:`\alpha = 1`.
+
+    Parameters
+    ----------
+    L : linear `Operator`
+        Operator used in the `pdhg` method.
+
+    Returns
+    -------
+    tau : ``L.domain`` element
+        Step size for the primal update, inverse of the absolute row sums
+        of ``L.adjoint``.
+    sigma : ``L.range`` element
+        Step size for the dual update, inverse of the absolute row sums
+        of ``L``.
+
+    Notes
+    -----
+    For a matrix :math:`K`, the step sizes
+
+    .. math::
+        \tau_j = \frac{1}{\sum_i |K_{ij}|}, \quad
+        \sigma_i = \frac{1}{\sum_j |K_{ij}|}
+
+    guarantee :math:`\|\Sigma^{1/2} K T^{1/2}\| \leq 1` for the
+    diagonal matrices :math:`T` and :math:`\Sigma` of step sizes, see
+    [CP2011b]. The sums are taken over the operators that are actually
+    applied in `pdhg`, hence weighted spaces are accounted for.
+
+    The absolute sums are computed separately for each block of a
+    `BroadcastOperator`, `ReductionOperator`, `ProductSpaceOperator` or
+    `DiagonalOperator`. They are exact for scalings, `MultiplyOperator`
+    and finite difference operators (`PartialDerivative`, `Gradient`,
+    `Divergence`). Any other operator is assumed to have non-negative
+    matrix entries, as is the case for ray transforms, and its absolute
+    sums are computed as ``op(one)``, with one forward and one adjoint
+    evaluation in total.
+
+    Points that are not coupled to any other, i.e., with zero absolute
+    sum, get the largest of the other step sizes in the same space.
+
+    References
+    ----------
+    [CP2011b] Chambolle, A and Pock, T. *Diagonal
+    preconditioning for first order primal-dual algorithms in convex
+    optimization*. 2011 IEEE International Conference on Computer Vision
+    (ICCV), 2011, pp 1762-1769.
+
+    Examples
+    --------
+    For the gradient in 1D with forward differences and zero padding,
+    each row and column of the matrix contains one entry ``-1`` and one
+    entry ``1``, except for the last row and the first column:
+
+    >>> space = odl.uniform_discr(0, 4, 4)
+    >>> grad = odl.Gradient(space)
+    >>> tau, sigma = pdhg_diagonal_stepsize(grad)
+    >>> tau
+    uniform_discr(0.0, 4.0, 4).element([ 1. ,  0.5,  0.5,  0.5])
+    >>> sigma[0]
+    uniform_discr(0.0, 4.0, 4).element([ 0.5,  0.5,  0.5,  1. ])
+    """
+    if not isinstance(L, Operator) or not L.is_linear:
+        raise TypeError('`L` {!r} is not a linear `Operator`'.format(L))
+
+    tau = _abs_row_sums(L.adjoint)
+    _invert_abs_sums(tau)
+    sigma = _abs_row_sums(L)
+    _invert_abs_sums(sigma)
+    return tau, sigma
+
+
+def _abs_row_sums(op):
+    """Return the absolute row sums of the matrix of ``op``.
+
+    See `pdhg_diagonal_stepsize` for the supported operators.
+    """
+    if isinstance(op, BroadcastOperator):
+        return op.range.element([_abs_row_sums(opi)
+                                 for opi in op.operators])
+
+    elif isinstance(op, ReductionOperator):
+        sums = op.range.zero()
+        for opi in op.operators:
+            sums += _abs_row_sums(opi)
+        return sums
+
+    elif isinstance(op, ProductSpaceOperator):
+        sums = op.range.zero()
+        for i, opij in zip(op.ops.row, op.ops.data):
+            sums[i] += _abs_row_sums(opij)
+        return sums
+
+    elif isinstance(op, (OperatorLeftScalarMult, OperatorRightScalarMult)):
+        return abs(op.scalar) * _abs_row_sums(op.operator)
+
+    elif isinstance(op, ScalingOperator):
+        return op.range.element(abs(op.scalar) * op.range.one())
+
+    elif isinstance(op, MultiplyOperator):
+        if isinstance(op.multiplicand, Operator):
+            # Multiplication with a scalar
+            return _abs_row_sums_nonnegative(op)
+        elif np.isscalar(op.multiplicand):
+            return op.range.element(abs(op.multiplicand) * op.range.one())
+        else:
+            return op.range.element(np.abs(op.multiplicand))
+
+    elif isinstance(op, PartialDerivative):
+        return op.range.element(_finite_diff_abs_sums(
+            op.range.shape, op.axis, op.dx, op.method, op.pad_mode))
+
+    elif isinstance(op, Gradient):
+        dx = op.domain.cell_sides
+        return op.range.element(
+            [_finite_diff_abs_sums(op.domain.shape, axis, dx[axis],
+                                   op.method, op.pad_mode)
+             for axis in range(op.domain.ndim)])
+
+    elif isinstance(op, Divergence):
+        dx = op.range.cell_sides
+        return op.range.element(
+            sum(_finite_diff_abs_sums(op.range.shape, axis, dx[axis],
+                                      op.method, op.pad_mode)
+                for axis in range(op.range.ndim)))
+
+    else:
+        return _abs_row_sums_nonnegative(op)
+
+
+def _abs_row_sums_nonnegative(op):
+    """Return the row sums of ``op``, assuming non-negative entries."""
+    sums = op(op.domain.one())
+    sums.ufuncs.absolute(out=sums)
+    return sums
+
+
+# Number of boundary points for which the absolute sums of a finite
+# difference matrix can differ from the interior
+_FINITE_DIFF_BOUNDARY = 4
+
+
+def _finite_diff_abs_sums(shape, axis, dx, method, pad_mode):
+    """Return the absolute row sums of a finite difference matrix.
+
+    The result is an array of the given ``shape``. Its values are
+    computed from a 1D difference matrix of small size, using that
+    the stencil is the same for all points away from the boundary.
+    """
+    n = shape[axis]
+    num_bdry = _FINITE_DIFF_BOUNDARY
+    m = min(n, 2 * num_bdry + 1)
+    # Column `j` of the result is the matrix applied to the unit vector
+    # `e_j`, hence the result is the matrix itself
+    matrix = finite_diff(np.eye(m), axis=0, dx=dx, method=method,
+                         pad_mode=pad_mode)
+    sums_small = np.sum(np.abs(matrix), axis=1)
+    if m == n:
+        sums = sums_small
+    else:
+        sums = np.empty(n)
+        sums[:num_bdry] = sums_small[:num_bdry]
+        sums[num_bdry:-num_bdry] = sums_small[num_bdry]
+        sums[-num_bdry:] = sums_small[-num_bdry:]
+
+    bcast_shape = [1] * len(shape)
+    bcast_shape[axis] = n
+    return np.broadcast_to(sums.reshape(bcast_shape), shape)
+
+
+def _invert_abs_sums(sums):
+    """Replace absolute sums by their inverse, in-place.
+
+    Zero sums are replaced by the largest of the other inverses in the
+    same space, or by 1 if all sums are zero.
+    """
+    if isinstance(sums.space, ProductSpace):
+        for sums_i in sums:
+            _invert_abs_sums(sums_i)
+        return
+
+    sums_arr = sums.asarray()
+    nonzero = sums_arr > 0
+    if not np.any(nonzero):
+        sums[:] = 1
+        return
+
+    steps = np.empty(sums_arr.shape, dtype=float)
+    steps[nonzero] = 1 / sums_arr[nonzero]
+    steps[~nonzero] = np.max(steps[nonzero])
+    sums[:] = steps
+
+
 if __name__ == '__main__':
     from odl.util.testutils import run_doctests
     run_doctests()
@@ -101,17 +101,20 @@ def proximal_gradient(x, f, g, gamma, niter, callback=None, **kwargs):
     f_prox = f.proximal(gamma)
     g_grad = g.gradient
 
-    # Create temporary
+    # Create temporaries
     tmp = x.space.element()
+    grad = x.space.element()
 
     for k in range(niter):
         lam_k = lam(k)
 
         # x - gamma grad_g (x)
-        tmp.lincomb(1, x, -gamma, g_grad(x))
+        g_grad(x, out=grad)
+        tmp.lincomb(1, x, -gamma, grad)
 
-        # Update x
-        x.lincomb(1 - lam_k, x, lam_k, f_prox(tmp))
+        # Update x, using `grad` for the proximal point
+        f_prox(tmp, out=grad)
+        x.lincomb(1 - lam_k, x, lam_k, grad)
 
         if callback is not None:
             callback(x)
@@ -141,12 +144,43 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
         The function ``g`` in the problem definition. Needs to have
         ``g.gradient``.
     gamma : positive float
-        Step size parameter.
+        Step size parameter. With ``backtracking=True`` or
+        ``greedy=True``, this is the initial step size.
     niter : non-negative int, optional
         Number of iterations.
     callback : callable, optional
         Function called with the current iterate after each iteration.
 
+    Other Parameters
+    ----------------
+    backtracking : bool, optional
+        If ``True``, reduce the step size by the factor ``beta`` until
+        the sufficient decrease condition (see Notes) holds. This
+        requires evaluating ``g``. Default: ``False``
+    beta : float in (0, 1), optional
+        Reduction factor of the step size for ``backtracking=True``.
+        Default: 0.5
+    restart : {None, 'gradient', 'function'}, optional
+        Adaptive restart scheme of `[OC2015]`_, which resets the momentum
+        if the iterates move in an ascent direction. ``'gradient'`` uses
+        the cheap gradient-based test, ``'function'`` requires evaluating
+        ``f + g`` in each iteration.
+        Default: ``None``
+    greedy : bool, optional
+        If ``True``, use the greedy FISTA variant of `[LLS2022]`_ with
+        constant momentum, gradient restart and a safeguard that reduces
+        the step size. ``gamma`` can then be chosen up to twice as large
+        as for the standard method.
+        Default: ``False``
+    xi : float in (0, 1), optional
+        Reduction factor of the step size for the safeguard of
+        ``greedy=True``. The step size is never reduced below
+        ``gamma / 2``. Default: 0.96
+    safeguard : positive float, optional
+        The step size is reduced with ``greedy=True`` if the norm of the
+        update is larger than ``safeguard`` times the norm of the first
+        update. Default: 1.0
+
     Notes
     -----
     The problem of interest is
@@ -164,9 +198,30 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
     .. math::
        0 < \\gamma < 2 \\beta.
 
+    If the Lipschitz constant is unknown, ``backtracking=True`` reduces
+    the step size :math:`\\gamma` until the new iterate
+    :math:`x^+ = \\mathrm{prox}_{\\gamma f}(y - \\gamma \\nabla g(y))`
+    satisfies
+
+    .. math::
+        g(x^+) \\leq g(y) + \\langle \\nabla g(y), x^+ - y \\rangle +
+        \\frac{1}{2 \\gamma} \\|x^+ - y\\|^2,
+
+    see `[Beck2009]`_. Here :math:`g(y)` and :math:`\\nabla g(y)` are
+    evaluated only once per iteration, and each trial costs one proximal
+    and one evaluation of :math:`g`. The step size is never increased.
+
+    The gradient-based restart resets the momentum if
+    :math:`\\langle y_k - x_{k+1}, x_{k+1} - x_k \\rangle > 0`, and the
+    function-based restart if the objective value increases.
+
     References
     ----------
     .. _[Beck2009]: http://epubs.siam.org/doi/abs/10.1137/080716542
+
+    .. _[OC2015]: https://doi.org/10.1007/s10208-013-9150-3
+
+    .. _[LLS2022]: https://doi.org/10.1007/s10107-021-01622-z
     """
     # Get and validate input
     if x not in f.domain:
@@ -183,31 +238,111 @@ def accelerated_proximal_gradient(x, f, g, gamma, niter, callback=None,
     if int(niter) != niter:
         raise ValueError('`niter` {} not understood'.format(niter))
 
-    # Get the proximal
+    backtracking = bool(kwargs.pop('backtracking', False))
+    beta = float(kwargs.pop('beta', 0.5))
+    if not 0 < beta < 1:
+        raise ValueError('`beta` must lie in (0, 1), got {}'.format(beta))
+
+    restart = restart_in = kwargs.pop('restart', None)
+    if restart is not None:
+        restart = str(restart).lower()
+        if restart not in ('gradient', 'function'):
+            raise ValueError('`restart` {!r} not understood'
+                             ''.format(restart_in))
+
+    greedy = bool(kwargs.pop('greedy', False))
+    xi = float(kwargs.pop('xi', 0.96))
+    if not 0 < xi < 1:
+        raise ValueError('`xi` must lie in (0, 1), got {}'.format(xi))
+    safeguard = float(kwargs.pop('safeguard', 1.0))
+    if safeguard <= 0:
+        raise ValueError('`safeguard` must be positive, got {}'
+                         ''.format(safeguard))
+    if greedy and backtracking:
+        raise ValueError('`greedy` and `backtracking` cannot be combined')
+    if greedy:
+        restart = 'gradient'
+        gamma_min = gamma / 2
+        first_step_norm = None
+
+    if kwargs:
+        raise TypeError('got unexpected keyword arguments: {}'
+                        ''.format(kwargs))
+
+    # Get the proximal, recomputed when the step size changes
     f_prox = f.proximal(gamma)
     g_grad = g.gradient
 
-    # Create temporary
+    # Create temporaries
     tmp = x.space.element()
+    grad = x.space.element()
+    x_old = x.space.element()
     y = x.copy()
     t = 1
 
+    # Cached values of g(x) and f(x) + g(x) for backtracking and restart
+    g_x = None
+    obj_old = None
+    y_is_x = True
+
     for k in range(niter):
         # Update t
         t, t_old = (1 + np.sqrt(1 + 4 * t ** 2)) / 2, t
-        alpha = (t_old - 1) / t
-
-        # x - gamma grad_g (y)
-        tmp.lincomb(1, y, -gamma, g_grad(y))
-
-        # Store old x value in y
-        y.assign(x)
-
-        # Update x
-        f_prox(tmp, out=x)
+        alpha = 1.0 if greedy else (t_old - 1) / t
+
+        # Store old x value
+        x_old.assign(x)
+
+        # grad = grad_g(y), g(y) is cached if y equals x
+        g_grad(y, out=grad)
+        if backtracking:
+            g_y = g_x if (g_x is not None and y_is_x) else g(y)
+
+        while True:
+            # x = prox[gamma * f](y - gamma grad_g(y))
+            tmp.lincomb(1, y, -gamma, grad)
+            f_prox(tmp, out=x)
+            if not backtracking:
+                break
+
+            # Sufficient decrease condition, tmp = x - y
+            tmp.lincomb(1, x, -1, y)
+            g_x = g(x)
+            if (g_x <= g_y + grad.inner(tmp) +
+                    tmp.norm() ** 2 / (2 * gamma)):
+                break
+            gamma *= beta
+            f_prox = f.proximal(gamma)
+
+        # Adaptive restart of the momentum
+        do_restart = False
+        if restart == 'gradient':
+            # Check <y - x, x - x_old> > 0, using `tmp` and `grad`
+            tmp.lincomb(1, y, -1, x)
+            grad.lincomb(1, x, -1, x_old)
+            do_restart = tmp.inner(grad) > 0
+        elif restart == 'function':
+            obj = f(x) + (g_x if backtracking else g(x))
+            do_restart = obj_old is not None and obj > obj_old
+            obj_old = obj
+
+        # Safeguard of the greedy variant, reducing the step size
+        if greedy:
+            step_norm = grad.norm()  # `grad` holds x - x_old
+            if first_step_norm is None:
+                first_step_norm = step_norm
+            elif (step_norm >= safeguard * first_step_norm and
+                    gamma > gamma_min):
+                gamma = max(xi * gamma, gamma_min)
+                f_prox = f.proximal(gamma)
+
+        if do_restart:
+            t = 1
+            alpha = 0.0
 
         # Update y
-        y.lincomb(1 + alpha, x, -alpha, y)
+        y_is_x = (alpha == 0)
+        y.lincomb(1 + alpha, x, -alpha, x_old)
 
         if callback is not None:
             callback(x)
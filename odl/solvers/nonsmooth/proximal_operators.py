@@ -40,7 +40,7 @@ __all__ = ('combine_proximals', 'proximal_convex_conj', 'proximal_translation',
            'proximal_linfty',
            'proj_simplex', 'proj_l1',
            'proximal_l2_squared', 'proximal_convex_conj_l2_squared',
-           'proximal_l1_l2', 'proximal_convex_conj_l1_l2',
+           'proximal_l1_l2', 'proximal_convex_conj_l1_l2', 'proximal_tv',
            'proximal_convex_conj_kl', 'proximal_convex_conj_kl_cross_entropy',
            'proximal_huber')
 
@@ -1202,12 +1202,16 @@ def proximal_convex_conj_l1_l2(space, lam=1, g=None):
 
             Parameters
             ----------
-            sigma : positive float
-                Step size parameter
+            sigma : positive float or pointwise positive space.element
+                Step size parameter. If scalar, it contains a global stepsize,
+                otherwise the space.element defines a stepsize for each point.
             """
             super(ProximalConvexConjL1L2, self).__init__(
                 domain=space, range=space, linear=False)
-            self.sigma = float(sigma)
+            if np.isscalar(sigma):
+                self.sigma = float(sigma)
+            else:
+                self.sigma = space.element(sigma)
 
         def _call(self, x, out):
             """Return ``self(x, out=out)``."""
@@ -1216,7 +1220,11 @@ def proximal_convex_conj_l1_l2(space, lam=1, g=None):
             # diff = x - sig * g
             if g is not None:
                 diff = self.domain.element()
-                diff.lincomb(1, x, -self.sigma, g)
+                if np.isscalar(self.sigma):
+                    diff.lincomb(1, x, -self.sigma, g)
+                else:
+                    self.sigma.multiply(g, out=diff)
+                    diff.lincomb(1, x, -1, diff)
             else:
                 diff = x
 
@@ -1443,6 +1451,215 @@ def proximal_l1_l2(space, lam=1, g=None):
     return ProximalL1L2
 
 
+def proximal_tv(space, lam=1, isotropic=True, niter=20, tol=None):
+    r"""Proximal operator factory of the total variation.
+
+    Implements the proximal operator of the functional ::
+
+        F(x) = lam || |grad(x)|_2 ||_1
+
+    with ``x`` in ``space`` and scaling factor ``lam``. Here, ``grad`` is
+    the forward difference `Gradient` with Neumann boundary conditions,
+    i.e., ``pad_mode='symmetric'``, and ``|.|_2`` is the pointwise
+    Euclidean norm for isotropic total variation. For the anisotropic
+    variant, the pointwise 1-norm is used instead.
+
+    Parameters
+    ----------
+    space : `DiscreteLp` or `TensorSpace`
+        Real domain of the functional. For `TensorSpace`, the cell
+        sides are 1.
+    lam : positive float, optional
+        Scaling factor or regularization parameter.
+    isotropic : bool, optional
+        If ``True``, use the isotropic total variation, otherwise the
+        anisotropic one.
+    niter : positive int, optional
+        Number of iterations in each evaluation of the proximal.
+    tol : positive float, optional
+        If given, an evaluation stops before ``niter`` iterations once
+        the relative change of the dual variable is below ``tol``.
+
+    Returns
+    -------
+    prox_factory : function
+        Factory for the proximal operator to be initialized
+
+    Notes
+    -----
+    The proximal operator of :math:`\sigma F` is the solution of the
+    ROF problem
+
+    .. math::
+        \mathrm{prox}_{\sigma F}(x) = \arg\min_u
+        \frac{1}{2} \|u - x\|_2^2 + \sigma \lambda \| |\nabla u| \|_1,
+
+    which is given by :math:`u = x - \sigma\lambda \nabla^* p` with the
+    solution :math:`p` of the dual problem
+
+    .. math::
+        \min_{|p| \leq 1} \|x - \sigma\lambda \nabla^* p\|_2^2.
+
+    It is computed with the fast gradient projection (FGP) method of
+    [BT2009b], an accelerated version of the projection algorithm of
+    [Cha2004], where the step size is given by the bound
+    :math:`\|\nabla\|^2 \leq 4 \sum_i h_i^{-2}` for the cell sides
+    :math:`h_i`.
+
+    Forward differences and divergence are evaluated in-place on
+    preallocated arrays. The dual variable is shared by all proximal
+    operators created by the same factory, and each evaluation starts
+    from the dual solution of the previous one. In iterative solvers,
+    where the argument changes little between iterations, a few
+    iterations per evaluation are then sufficient.
+
+    Since the buffers are shared, the proximal operators created by one
+    factory are not thread-safe, i.e., they must not be evaluated
+    concurrently. Use a separate factory for each thread instead.
+
+    References
+    ----------
+    [BT2009b] Beck, A, and Teboulle, M. *Fast gradient-based algorithms
+    for constrained total variation image denoising and deblurring
+    problems*. IEEE Transactions on Image Processing, 18.11 (2009),
+    pp 2419--2434.
+
+    [Cha2004] Chambolle, A. *An algorithm for total variation
+    minimization and applications*. Journal of Mathematical Imaging and
+    Vision, 20 (2004), pp 89--97.
+
+    See Also
+    --------
+    proximal_l1_l2 : proximal of the isotropic norm of a vector field
+    odl.solvers.nonsmooth.proximal_gradient_solvers.proximal_gradient :
+        Solver that can use this proximal for TV-regularized problems
+
+    Examples
+    --------
+    Small jumps are removed and large jumps are reduced:
+
+    >>> space = odl.uniform_discr(0, 4, 4)
+    >>> prox = odl.solvers.proximal_tv(space, lam=0.1, niter=100)(1.0)
+    >>> prox([1.0, 1.1, 2.0, 2.0])
+    uniform_discr(0.0, 4.0, 4).element([ 1.1 ,  1.1 ,  1.95,  1.95])
+    """
+    lam = float(lam)
+    isotropic = bool(isotropic)
+    niter, niter_in = int(niter), niter
+    if niter <= 0 or niter != niter_in:
+        raise ValueError('`niter` must be a positive integer, got {}'
+                         ''.format(niter_in))
+    if tol is not None:
+        tol = float(tol)
+    if not getattr(space, 'is_real', False):
+        raise TypeError('`space` {!r} is not a real space'.format(space))
+
+    ndim = space.ndim
+    cell_sides = getattr(space, 'cell_sides', None)
+    if cell_sides is None:
+        cell_sides = np.ones(ndim)
+    inv_cell_sides = 1 / np.asarray(cell_sides, dtype=float)
+    lipschitz = 4 * np.sum(inv_cell_sides ** 2)
+
+    # Index tuples for the forward differences along each axis
+    lower = [tuple(slice(None, -1) if j == i else slice(None)
+                   for j in range(ndim)) for i in range(ndim)]
+    upper = [tuple(slice(1, None) if j == i else slice(None)
+                   for j in range(ndim)) for i in range(ndim)]
+    last = [tuple(-1 if j == i else slice(None) for j in range(ndim))
+            for i in range(ndim)]
+
+    # Buffers shared by all operators from this factory. `dual` holds the
+    # last dual solution, which is used as warm start.
+    dual_shape = (ndim,) + space.shape
+    dual = np.zeros(dual_shape, dtype=space.dtype)
+    dual_old = np.empty(dual_shape, dtype=space.dtype)
+    momentum = np.empty(dual_shape, dtype=space.dtype)
+    primal = np.empty(space.shape, dtype=space.dtype)
+    tmp = np.empty(space.shape, dtype=space.dtype)
+    pointwise_norm = np.empty(space.shape, dtype=space.dtype)
+
+    def primal_from_dual(x_arr, p, step, out):
+        """Compute ``out = x - step * grad^*(p)``."""
+        out[:] = x_arr
+        for i in range(ndim):
+            # grad_i^*(p)[j] = (p_i[j - 1] - p_i[j]) / h_i with
+            # p_i[-1] = p_i[n - 1] = 0
+            np.multiply(p[i], step * inv_cell_sides[i], out=tmp)
+            out += tmp
+            out[upper[i]] -= tmp[lower[i]]
+
+    def dual_step(u, q, step_size, out):
+        """Compute ``out = proj(q + step_size * grad(u))``."""
+        for i in range(ndim):
+            out_i = out[i]
+            np.subtract(u[upper[i]], u[lower[i]], out=out_i[lower[i]])
+            out_i[lower[i]] *= step_size * inv_cell_sides[i]
+            out_i[lower[i]] += q[i][lower[i]]
+            out_i[last[i]] = 0
+
+        if isotropic:
+            np.multiply(out[0], out[0], out=pointwise_norm)
+            for i in range(1, ndim):
+                np.multiply(out[i], out[i], out=tmp)
+                np.add(pointwise_norm, tmp, out=pointwise_norm)
+            np.sqrt(pointwise_norm, out=pointwise_norm)
+            np.maximum(pointwise_norm, 1, out=pointwise_norm)
+            out /= pointwise_norm
+        else:
+            np.clip(out, -1, 1, out=out)
+
+    class ProximalTV(Operator):
+
+        """Proximal operator of the total variation."""
+
+        def __init__(self, sigma):
+            """Initialize a new instance.
+
+            Parameters
+            ----------
+            sigma : positive float
+                Step size parameter.
+            """
+            super(ProximalTV, self).__init__(
+                domain=space, range=space, linear=False)
+            self.sigma = float(sigma)
+
+        def _call(self, x, out):
+            """Return ``self(x, out=out)``."""
+            p, p_old, q = dual, dual_old, momentum
+            x_arr = x.asarray()
+            step = self.sigma * lam
+            if step == 0:
+                out.assign(x)
+                return
+            step_size = 1 / (step * lipschitz)
+
+            q[:] = p
+            t = 1.0
+            for _ in range(niter):
+                p, p_old = p_old, p
+                primal_from_dual(x_arr, q, step, out=primal)
+                dual_step(primal, q, step_size, out=p)
+
+                t_old, t = t, (1 + np.sqrt(1 + 4 * t ** 2)) / 2
+                np.subtract(p, p_old, out=q)
+                if tol is not None:
+                    change = np.linalg.norm(q)
+                    if change <= tol * np.linalg.norm(p):
+                        break
+                q *= (t_old - 1) / t
+                q += p
+
+            # Keep the solution in `dual` for the next evaluation
+            if p is not dual:
+                dual[:] = p
+            primal_from_dual(x_arr, dual, step, out=primal)
+            out[:] = primal
+
+    return ProximalTV
+
+
 def proximal_linfty(space):
     """Proximal operator factory of the ``l_\infty``-norm.
 
@@ -1464,7 +1681,9 @@ def proximal_linfty(space):
     Notes
     -----
     The proximal is computed by the Moreau identity and a projection onto an
-    l1-ball [PB2014].
+    l1-ball [PB2014]::
+
+        prox[sigma * F](x) = x - proj_{||.||_1 <= sigma}(x)
 
     See Also
     --------
@@ -1490,7 +1709,7 @@ def proximal_linfty(space):
         def _call(self, x, out):
             """Return ``self(x)``."""
 
-            radius = 1
+            radius = self.sigma
 
             if x is out:
                 x = x.copy()
@@ -1501,7 +1720,7 @@ def proximal_linfty(space):
     return ProximalLInfty
 
 
-def proj_l1(x, radius=1, out=None):
+def proj_l1(x, radius=1, out=None, axis=None):
     """Projection onto l1-ball.
 
     Projection onto::
@@ -1512,20 +1731,29 @@ def proj_l1(x, radius=1, out=None):
 
     Parameters
     ----------
-    space : `LinearSpace`
-        Space / domain ``X``.
+    x : `LinearSpaceElement`
+        Real element to be projected.
     radius : positive float, optional
         Radius ``r`` of the ball.
+    out : `LinearSpaceElement`, optional
+        Element to which the result is written. Can be ``x``.
+    axis : int, optional
+        If given, the vectors along this axis of ``x.asarray()`` are
+        projected independently. For a power `ProductSpace` element,
+        ``axis=0`` projects the vector of components in each point.
+        By default, ``x`` is projected as a whole.
 
     Returns
     -------
-    prox_factory : callable
-        Factory for the proximal operator to be initialized.
+    out : `LinearSpaceElement`
+        Projection of ``x``. If ``out`` was given, the returned object
+        is a reference to it.
 
     Notes
     -----
-    The projection onto an l1-ball can be computed by projection onto a
-    simplex, see [D+2008] for details.
+    Points outside the ball are projected by soft-thresholding with the
+    threshold of the projection of ``|x|`` onto the simplex of diameter
+    ``r``, see [D+2008] and `proj_simplex`.
 
     References
     ----------
@@ -1537,77 +1765,163 @@ def proj_l1(x, radius=1, out=None):
     --------
     proximal_linfty : proximal for l-infinity norm
     proj_simplex : projection onto simplex
-    """
 
+    Examples
+    --------
+    >>> space = odl.rn(3)
+    >>> odl.solvers.proj_l1(space.element([2, 0.5, -3]))
+    rn(3).element([ 0.,  0., -1.])
+    >>> odl.solvers.proj_l1(space.element([0.5, -0.25, 0]))
+    rn(3).element([ 0.5 , -0.25,  0.  ])
+
+    Projecting the vectors of components in each point:
+
+    >>> pspace = odl.ProductSpace(odl.rn(2), 2)
+    >>> x = pspace.element([[2, 0.5], [1, 0]])
+    >>> odl.solvers.proj_l1(x, axis=0)
+    ProductSpace(rn(2), 2).element([
+        [ 1. ,  0.5],
+        [ 0.,  0.]
+    ])
+    """
     if out is None:
         out = x.space.element()
 
-    u = x.ufuncs.absolute()
-    v = x.ufuncs.sign()
-    proj_simplex(u, radius, out)
-    out *= v
+    x_arr = x.asarray()
+    result = np.abs(x_arr)
+    threshold = _simplex_threshold(result, radius, axis)
+
+    # Points inside the ball have a non-positive threshold and are kept
+    threshold = np.maximum(threshold, 0)
+    result -= threshold
+    np.maximum(result, 0, out=result)
+    np.copysign(result, x_arr, out=result)
+    out[:] = result
 
     return out
 
 
-def proj_simplex(x, diameter=1, out=None):
+def proj_simplex(x, diameter=1, out=None, axis=None):
     """Projection onto simplex.
 
     Projection onto::
 
         ``{ x \in X | x_i \geq 0, \sum_i x_i = r}``
 
-    with :math:`r` being the diameter. It is computed by the formula proposed
-    in [D+2008].
+    with :math:`r` being the diameter.
 
     Parameters
     ----------
-    space : `LinearSpace`
-        Space / domain ``X``.
+    x : `LinearSpaceElement`
+        Real element to be projected.
     diameter : positive float, optional
         Diameter of the simplex.
+    out : `LinearSpaceElement`, optional
+        Element to which the result is written. Can be ``x``.
+    axis : int, optional
+        If given, the vectors along this axis of ``x.asarray()`` are
+        projected independently. For a power `ProductSpace` element,
+        ``axis=0`` projects the vector of components in each point.
+        By default, ``x`` is projected as a whole.
 
     Returns
     -------
-    prox_factory : callable
-        Factory for the proximal operator to be initialized.
+    out : `LinearSpaceElement`
+        Projection of ``x``. If ``out`` was given, the returned object
+        is a reference to it.
 
     Notes
     -----
-    The projection onto a simplex is not of closed-form but can be solved by a
-    non-iterative algorithm, see [D+2008] for details.
+    The projection is given by ``max(x - tau, 0)``, where the threshold
+    ``tau`` is found with the algorithm of [Mic1986]: starting from all
+    entries, ``tau`` is set to make the sum of the remaining entries
+    minus ``tau`` equal to ``r``, and entries not larger than ``tau``
+    are discarded until no entry is removed anymore. In contrast to
+    sorting, this takes an expected linear number of operations
+    [Con2016], and the remaining entries are compressed in each step.
+    With ``axis``, all vectors are processed simultaneously.
 
     References
     ----------
-    [D+2008] Duchi, J., Shalev-Shwartz, S., Singer, Y., and Chandra, T.
-    *Efficient Projections onto the L1-ball for Learning in High dimensions*.
-    ICML 2008, pp. 272-279. http://doi.org/10.1145/1390156.1390191
+    [Mic1986] Michelot, C. *A finite algorithm for finding the projection
+    of a point onto the canonical simplex of R^n*. Journal of Optimization
+    Theory and Applications, 50.1 (1986), pp 195--200.
+
+    [Con2016] Condat, L. *Fast projection onto the simplex and the l1
+    ball*. Mathematical Programming, 158.1 (2016), pp 575--585.
 
     See Also
     --------
     proj_l1 : projection onto l1-norm ball
-    """
 
+    Examples
+    --------
+    >>> space = odl.rn(3)
+    >>> odl.solvers.proj_simplex(space.element([1, 0.5, -1]))
+    rn(3).element([ 0.75,  0.25,  0.  ])
+
+    Projecting the vectors of components in each point:
+
+    >>> pspace = odl.ProductSpace(odl.rn(2), 2)
+    >>> x = pspace.element([[1, 2], [0, 0]])
+    >>> odl.solvers.proj_simplex(x, axis=0)
+    ProductSpace(rn(2), 2).element([
+        [ 1.,  1.],
+        [ 0.,  0.]
+    ])
+    """
     if out is None:
         out = x.space.element()
 
-    # sort values in descending order
-    x_sor = x.asarray().flatten()
-    x_sor.sort()
-    x_sor = x_sor[::-1]
-
-    # find critical index
-    j = np.arange(1, x.size + 1)
-    x_avrg = (1 / j) * (np.cumsum(x_sor) - diameter)
-    crit = x_sor - x_avrg
-    i = np.argwhere(crit >= 0).flatten().max()
+    x_arr = x.asarray()
+    threshold = _simplex_threshold(x_arr, diameter, axis)
 
     # output is a shifted and thresholded version of the input
-    out[:] = np.maximum(x - x_avrg[i], 0)
+    result = np.subtract(x_arr, threshold)
+    np.maximum(result, 0, out=result)
+    out[:] = result
 
     return out
 
 
+def _simplex_threshold(arr, diameter, axis=None):
+    """Return the threshold of the projection of ``arr`` onto a simplex.
+
+    For ``axis=None``, the threshold is a scalar, otherwise an array with
+    the shape of ``arr`` except for length 1 along ``axis``.
+    """
+    diameter = float(diameter)
+    if diameter <= 0:
+        raise ValueError('`diameter` must be positive, got {}'
+                         ''.format(diameter))
+
+    if axis is None:
+        active = arr.ravel()
+        size = active.size
+        threshold = (active.sum() - diameter) / size
+        while True:
+            active = active[active > threshold]
+            if active.size == size:
+                return threshold
+            size = active.size
+            threshold = (active.sum() - diameter) / size
+    else:
+        sizes = np.full_like(arr.sum(axis=axis, keepdims=True),
+                             arr.shape[axis], dtype=int)
+        threshold = (arr.sum(axis=axis, keepdims=True) - diameter) / sizes
+        active = np.empty(arr.shape, dtype=bool)
+        active_arr = np.empty(arr.shape, dtype=threshold.dtype)
+        while True:
+            np.greater(arr, threshold, out=active)
+            new_sizes = active.sum(axis=axis, keepdims=True)
+            if np.array_equal(new_sizes, sizes):
+                return threshold
+            sizes = new_sizes
+            np.multiply(arr, active, out=active_arr)
+            threshold = ((active_arr.sum(axis=axis, keepdims=True) -
+                          diameter) / sizes)
+
+
 def proximal_convex_conj_kl(space, lam=1, g=None):
     """Proximal operator factory of the convex conjugate of the KL divergence.
 
@@ -10,12 +10,13 @@
 
 from __future__ import print_function, division, absolute_import
 import numpy as np
+import scipy.linalg
 
-from odl.solvers.util import ConstantLineSearch
+from odl.solvers.util import ConstantLineSearch, MoreThuenteLineSearch
 from odl.solvers.iterative.iterative import conjugate_gradient
 
 
-__all__ = ('newtons_method', 'bfgs_method', 'broydens_method')
+__all__ = ('newtons_method', 'bfgs_method', 'lbfgs', 'broydens_method')
 
 
 def _bfgs_direction(s, y, x, hessinv_estimate=None):
@@ -357,6 +358,216 @@ Goldfarb%E2%80%93Shanno_algorithm>`_
             callback(x)
 
 
+def _real_inner_weights(space):
+    """Return weights for batched real inner products in ``space``.
+
+    The returned array or scalar ``w`` satisfies
+    ``x.inner(y).real == np.dot(_real_view(x), w * _real_view(y))``.
+    """
+    weighting = getattr(space, 'weighting', None)
+    if getattr(weighting, 'exponent', None) != 2.0:
+        raise TypeError('`space` {!r} has no inner product given by a '
+                        'weighting'.format(space))
+    if hasattr(weighting, 'const'):
+        return weighting.const
+    elif hasattr(weighting, 'array'):
+        weights = np.broadcast_to(weighting.array, space.shape).ravel()
+        if space.is_complex:
+            weights = np.repeat(weights, 2)
+        return weights
+    else:
+        raise TypeError('`space` {!r} has neither constant nor array '
+                        'weighting'.format(space))
+
+
+def _real_view(x):
+    """Return the values of ``x`` as flat real array, without copy."""
+    arr = np.ascontiguousarray(x.asarray()).ravel()
+    return arr.view(x.space.real_dtype)
+
+
+def lbfgs(f, x, line_search=None, maxiter=1000, tol=1e-15, num_store=10,
+          callback=None):
+    r"""Limited memory BFGS method in compact representation.
+
+    Notes
+    -----
+    This method minimizes a differentiable function
+    :math:`f: \mathcal{X}\to \mathbb{R}` with quasi-Newton steps
+
+    .. math::
+        x_{k+1} = x_k - \alpha_k H_k \nabla f(x_k),
+
+    where :math:`H_k` is the limited memory BFGS approximation of the
+    inverse Hessian given by the last ``num_store`` differences
+    :math:`s_i = x_{i+1} - x_i` and
+    :math:`y_i = \nabla f(x_{i+1}) - \nabla f(x_i)`, and the step
+    :math:`\alpha_k` satisfies the strong Wolfe conditions.
+
+    In contrast to `bfgs_method` with ``num_store``, the differences are
+    stored in a ring buffer, i.e., one contiguous array per history, and
+    :math:`H_k \nabla f(x_k)` is computed with the compact
+    representation from [BNS1994]
+
+    .. math::
+        H_k = \gamma_k I + [S_k\ \gamma_k Y_k]\, M_k\,
+        [S_k\ \gamma_k Y_k]^*
+
+    with a small :math:`2m \times 2m` matrix :math:`M_k` and
+    :math:`\gamma_k = \langle s_{k-1}, y_{k-1}\rangle /
+    \|y_{k-1}\|^2`. Hence, all inner products with the history are
+    computed in one matrix-vector product, and the direction is
+    assembled in another one, instead of :math:`4m` separate passes over
+    the data in the two-loop recursion. The inner products between the
+    stored vectors are updated with two more matrix-vector products per
+    iteration.
+
+    Parameters
+    ----------
+    f : `Functional`
+        Functional with ``f.gradient``. Its domain must be a
+        `TensorSpace` or `DiscreteLp` with constant or array weighting.
+    x : ``f.domain`` element
+        Starting point of the iteration. It is updated in-place.
+    line_search : `LineSearch`, optional
+        Strategy to choose the step length. The values of ``f`` and its
+        gradient computed by a `MoreThuenteLineSearch` are reused.
+        Default: ``MoreThuenteLineSearch(f)``
+    maxiter : int, optional
+        Maximum number of iterations.
+    tol : float, optional
+        Tolerance for the norm of the gradient, below which the iteration
+        stops.
+    num_store : positive int, optional
+        Maximum number of stored differences.
+    callback : callable, optional
+        Object executing code per iteration, e.g. plotting each iterate.
+
+    See Also
+    --------
+    bfgs_method : BFGS and L-BFGS in two-loop form, for arbitrary spaces
+    odl.solvers.util.steplen.MoreThuenteLineSearch :
+        Default line search
+
+    References
+    ----------
+    [BNS1994] Byrd, R H, Nocedal, J, and Schnabel, R B. *Representations
+    of quasi-Newton matrices and their use in limited memory methods*.
+    Mathematical Programming, 63 (1994), pp 129--156.
+
+    Examples
+    --------
+    Minimize the Rosenbrock function:
+
+    >>> f = odl.solvers.RosenbrockFunctional(odl.rn(2))
+    >>> x = f.domain.zero()
+    >>> lbfgs(f, x, maxiter=100, tol=1e-10)
+    >>> x
+    rn(2).element([ 1.,  1.])
+    """
+    grad = f.gradient
+    if x not in grad.domain:
+        raise TypeError('`x` {!r} is not in the domain of `grad` {!r}'
+                        ''.format(x, grad.domain))
+    num_store, num_store_in = int(num_store), num_store
+    if num_store <= 0 or num_store != num_store_in:
+        raise ValueError('`num_store` must be a positive integer, got {}'
+                         ''.format(num_store_in))
+
+    if line_search is None:
+        line_search = MoreThuenteLineSearch(f)
+    elif not callable(line_search):
+        line_search = ConstantLineSearch(line_search)
+    cached_values = isinstance(line_search, MoreThuenteLineSearch)
+
+    space = x.space
+    weights = _real_inner_weights(space)
+    m = num_store
+
+    # Ring buffer, rows [0, m) hold the s_i and rows [m, 2m) the y_i.
+    # The Gram matrices are stored by slot, and `slots` holds the used
+    # slots from oldest to newest.
+    history = np.zeros((2 * m, _real_view(x).size), dtype=space.real_dtype)
+    s_inner_y = np.zeros((m, m))
+    y_inner_y = np.zeros((m, m))
+    slots = []
+    next_slot = 0
+
+    search_dir = space.element()
+    fx = f(x) if cached_values else None
+    grad_x = grad(x)
+    for _ in range(maxiter):
+        grad_arr = _real_view(grad_x)
+        weighted_grad = weights * grad_arr
+        if np.sqrt(grad_arr.dot(weighted_grad)) <= tol:
+            return
+
+        if slots:
+            # Compact representation of -H * grad
+            idx = np.array(slots)
+            both_idx = np.concatenate([idx, m + idx])
+            inner_grad = history.dot(weighted_grad)[both_idx]
+            a, b = inner_grad[:len(idx)], inner_grad[len(idx):]
+            sy = s_inner_y[np.ix_(idx, idx)]
+            yy = y_inner_y[np.ix_(idx, idx)]
+            gamma = sy[-1, -1] / yy[-1, -1]
+
+            u = scipy.linalg.solve_triangular(sy, a)
+            v = scipy.linalg.solve_triangular(
+                sy, np.diag(sy) * u + gamma * (yy.dot(u) - b), trans='T')
+            coeffs = np.zeros(2 * m)
+            coeffs[idx] = v
+            coeffs[m + idx] = -gamma * u
+            dir_arr = coeffs.dot(history)
+            dir_arr += gamma * grad_arr
+            dir_arr *= -1
+        else:
+            # Steepest descent with unit length
+            dir_arr = grad_arr / -np.sqrt(grad_arr.dot(weighted_grad))
+
+        search_dir[:] = dir_arr.view(space.dtype).reshape(space.shape)
+        dir_deriv = dir_arr.dot(weighted_grad)
+        if dir_deriv >= 0:
+            # Loss of positive definiteness, restart from steepest descent
+            slots = []
+            search_dir.lincomb(-1, grad_x)
+            dir_deriv = -grad_arr.dot(weighted_grad)
+
+        if cached_values:
+            step = line_search(x, search_dir, dir_deriv, fval=fx)
+        else:
+            step = line_search(x, search_dir, dir_deriv)
+        x.lincomb(1, x, step, search_dir)
+
+        # Store s = step * dir and y = grad(x_new) - grad(x_old) in the
+        # next slot of the ring buffer
+        slot = next_slot
+        if slot in slots:
+            slots.remove(slot)
+        np.multiply(step, _real_view(search_dir), out=history[slot])
+        # `grad_arr` is a view of `grad_x`, hence copy it before updating
+        np.negative(grad_arr, out=history[m + slot])
+        if cached_values:
+            fx = line_search.fval
+            grad_x.assign(line_search.gradient)
+        else:
+            grad(x, out=grad_x)
+        history[m + slot] += _real_view(grad_x)
+
+        inner_s = history.dot(weights * history[slot])
+        inner_y = history.dot(weights * history[m + slot])
+        if inner_y[slot] > np.finfo(float).eps * inner_y[m + slot]:
+            # Curvature condition holds, keep the pair
+            s_inner_y[:, slot] = inner_y[:m]
+            s_inner_y[slot, :] = inner_s[m:]
+            y_inner_y[:, slot] = y_inner_y[slot, :] = inner_y[m:]
+            slots.append(slot)
+            next_slot = (slot + 1) % m
+
+        if callback is not None:
+            callback(x)
+
+
 def broydens_method(f, x, line_search=1.0, impl='first', maxiter=1000,
                     tol=1e-15, hessinv_estimate=None,
                     callback=None):
@@ -13,8 +13,8 @@ from builtins import object
 import numpy as np
 
 
-__all__ = ('LineSearch', 'BacktrackingLineSearch', 'ConstantLineSearch',
-           'LineSearchFromIterNum')
+__all__ = ('LineSearch', 'BacktrackingLineSearch', 'MoreThuenteLineSearch',
+           'ConstantLineSearch', 'LineSearchFromIterNum')
 
 
 class LineSearch(object):
@@ -225,6 +225,345 @@ class BacktrackingLineSearch(LineSearch):
         return alpha
 
 
+def _more_thuente_step(stx, fx, dx, sty, fy, dy, stp, fp, dp, brackt,
+                       stpmin, stpmax):
+    """Safeguarded step of the More-Thuente line search.
+
+    This is the routine ``dcstep`` of MINPACK-2, see [MT1994] in
+    `MoreThuenteLineSearch`. The interval ``[stx, sty]`` contains a
+    minimizer; ``stx`` is the step with the least function value so far
+    and ``stp`` is the current step. Function values and derivatives at
+    these steps are given by the ``f`` and ``d`` arguments.
+
+    Returns
+    -------
+    stx, fx, dx, sty, fy, dy : float
+        Updated end points of the interval with function values and
+        derivatives.
+    stp : float
+        New trial step.
+    brackt : bool
+        ``True`` if a minimizer has been bracketed.
+    """
+    sgnd = dp * np.sign(dx)
+
+    if fp > fx:
+        # Higher function value, the minimum is bracketed. Take the cubic
+        # step if it is closer to stx than the quadratic step, otherwise
+        # the average of both.
+        theta = 3 * (fx - fp) / (stp - stx) + dx + dp
+        s = max(abs(theta), abs(dx), abs(dp))
+        gamma = s * np.sqrt((theta / s) ** 2 - (dx / s) * (dp / s))
+        if stp < stx:
+            gamma = -gamma
+        p = (gamma - dx) + theta
+        q = ((gamma - dx) + gamma) + dp
+        stpc = stx + p / q * (stp - stx)
+        stpq = stx + dx / ((fx - fp) / (stp - stx) + dx) / 2 * (stp - stx)
+        if abs(stpc - stx) < abs(stpq - stx):
+            stpf = stpc
+        else:
+            stpf = stpc + (stpq - stpc) / 2
+        brackt = True
+
+    elif sgnd < 0:
+        # Lower function value and derivatives of opposite sign, the
+        # minimum is bracketed. Take the step farther from stp.
+        theta = 3 * (fx - fp) / (stp - stx) + dx + dp
+        s = max(abs(theta), abs(dx), abs(dp))
+        gamma = s * np.sqrt((theta / s) ** 2 - (dx / s) * (dp / s))
+        if stp > stx:
+            gamma = -gamma
+        p = (gamma - dp) + theta
+        q = ((gamma - dp) + gamma) + dx
+        stpc = stp + p / q * (stx - stp)
+        stpq = stp + dp / (dp - dx) * (stx - stp)
+        if abs(stpc - stp) > abs(stpq - stp):
+            stpf = stpc
+        else:
+            stpf = stpq
+        brackt = True
+
+    elif abs(dp) < abs(dx):
+        # Lower function value, derivatives of the same sign and
+        # decreasing magnitude. The cubic step is only used if it tends
+        # to infinity in the direction of the step or if the minimum of
+        # the cubic is beyond stp.
+        theta = 3 * (fx - fp) / (stp - stx) + dx + dp
+        s = max(abs(theta), abs(dx), abs(dp))
+        gamma = s * np.sqrt(max(0, (theta / s) ** 2 - (dx / s) * (dp / s)))
+        if stp > stx:
+            gamma = -gamma
+        p = (gamma - dp) + theta
+        q = (gamma + (dx - dp)) + gamma
+        r = p / q
+        if r < 0 and gamma != 0:
+            stpc = stp + r * (stx - stp)
+        elif stp > stx:
+            stpc = stpmax
+        else:
+            stpc = stpmin
+        stpq = stp + dp / (dp - dx) * (stx - stp)
+
+        if brackt:
+            # Take the step closer to stp, but stay away from sty
+            if abs(stpc - stp) < abs(stpq - stp):
+                stpf = stpc
+            else:
+                stpf = stpq
+            if stp > stx:
+                stpf = min(stp + 0.66 * (sty - stp), stpf)
+            else:
+                stpf = max(stp + 0.66 * (sty - stp), stpf)
+        else:
+            # Take the step farther from stp
+            if abs(stpc - stp) > abs(stpq - stp):
+                stpf = stpc
+            else:
+                stpf = stpq
+            stpf = min(max(stpf, stpmin), stpmax)
+
+    else:
+        # Lower function value, derivatives of the same sign and
+        # non-decreasing magnitude. Take the cubic step in the bracket,
+        # otherwise go to the bound.
+        if brackt:
+            theta = 3 * (fp - fy) / (sty - stp) + dy + dp
+            s = max(abs(theta), abs(dy), abs(dp))
+            gamma = s * np.sqrt((theta / s) ** 2 - (dy / s) * (dp / s))
+            if stp > sty:
+                gamma = -gamma
+            p = (gamma - dp) + theta
+            q = ((gamma - dp) + gamma) + dy
+            stpf = stp + p / q * (sty - stp)
+        elif stp > stx:
+            stpf = stpmax
+        else:
+            stpf = stpmin
+
+    # Update the interval containing a minimizer
+    if fp > fx:
+        sty, fy, dy = stp, fp, dp
+    else:
+        if sgnd < 0:
+            sty, fy, dy = stx, fx, dx
+        stx, fx, dx = stp, fp, dp
+
+    return stx, fx, dx, sty, fy, dy, stpf, brackt
+
+
+class MoreThuenteLineSearch(LineSearch):
+
+    """Line search satisfying the strong Wolfe conditions.
+
+    This line search finds a step length ``alpha`` such that ::
+
+        f(x + alpha * d) <= f(x) + c1 * alpha * <grad f(x), d>
+        |<grad f(x + alpha * d), d>| <= c2 * |<grad f(x), d>|
+
+    by safeguarded cubic and quadratic interpolation of the function
+    values and directional derivatives, as described in [MT1994]. These
+    are the step lengths required by quasi-Newton methods like `lbfgs`.
+
+    Each trial step costs one evaluation of the function and its
+    gradient. The values at the returned step are kept in the
+    attributes ``fval`` and ``gradient``, so that solvers can reuse them
+    instead of evaluating the function again.
+
+    References
+    ----------
+    [MT1994] More, J J, and Thuente, D J. *Line search algorithms with
+    guaranteed sufficient decrease*. ACM Transactions on Mathematical
+    Software, 20.3 (1994), pp 286--307.
+    """
+
+    def __init__(self, function, c1=1e-4, c2=0.9, alpha=1.0,
+                 max_num_iter=20, alpha_max=1e10, xtol=1e-14):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        function : `Functional`
+            The cost function of the optimization problem to be solved.
+            It needs to have a ``gradient``.
+        c1 : float, optional
+            Constant in the sufficient decrease condition,
+            ``0 < c1 < c2``.
+        c2 : float, optional
+            Constant in the curvature condition, ``c1 < c2 < 1``.
+        alpha : positive float, optional
+            The initial guess for the step length.
+        max_num_iter : positive int, optional
+            Maximum number of function evaluations in each call. If the
+            conditions are not met after this many evaluations, the last
+            trial step is returned.
+        alpha_max : positive float, optional
+            Upper bound for the step length.
+        xtol : positive float, optional
+            Relative tolerance for the width of the interval of
+            uncertainty, below which the search stops.
+
+        Examples
+        --------
+        >>> r3 = odl.rn(3)
+        >>> func = odl.solvers.L2NormSquared(r3)
+        >>> line_search = MoreThuenteLineSearch(func)
+        >>> x = r3.element([1, 2, 3])
+        >>> d = r3.element([-1, -1, -1])
+        >>> step_len = line_search(x, d)
+        >>> step_len
+        1.0
+
+        The function value and gradient in the new point are cached:
+
+        >>> line_search.fval == func(x + step_len * d)
+        True
+        >>> line_search.gradient
+        rn(3).element([ 0.,  2.,  4.])
+
+        A smaller ``c2`` enforces a more exact line search:
+
+        >>> line_search = MoreThuenteLineSearch(func, c2=0.1)
+        >>> line_search(x, d)
+        2.0
+        """
+        self.function = function
+        self.c1 = float(c1)
+        self.c2 = float(c2)
+        if not 0 < self.c1 < self.c2 < 1:
+            raise ValueError('`c1` and `c2` must satisfy 0 < c1 < c2 < 1, '
+                             'got {} and {}'.format(c1, c2))
+        self.alpha = float(alpha)
+        if self.alpha <= 0:
+            raise ValueError('`alpha` must be positive, got {}'.format(alpha))
+        self.max_num_iter = int(max_num_iter)
+        self.alpha_max = float(alpha_max)
+        self.xtol = float(xtol)
+
+        self.total_num_iter = 0
+        self.fval = None
+        self.gradient = None
+
+    def __call__(self, x, direction, dir_derivative=None, fval=None):
+        """Calculate a step length satisfying the strong Wolfe conditions.
+
+        Parameters
+        ----------
+        x : `LinearSpaceElement`
+            The current point
+        direction : `LinearSpaceElement`
+            Search direction in which the line search should be computed.
+            It must be a descent direction.
+        dir_derivative : float, optional
+            Directional derivative along the ``direction``
+            Default: ``function.gradient(x).inner(direction)``
+        fval : float, optional
+            Function value in ``x``.
+            Default: ``function(x)``
+
+        Returns
+        -------
+        step : float
+            The computed step length
+        """
+        gradient = self.function.gradient
+        # Values of functionals on complex spaces can have complex type
+        finit = np.real(self.function(x) if fval is None else fval)
+        if dir_derivative is None:
+            ginit = gradient(x).inner(direction).real
+        else:
+            ginit = np.real(dir_derivative)
+
+        if ginit >= 0:
+            raise ValueError('`direction` is not a descent direction, '
+                             'dir_derivative = {}'.format(ginit))
+        if not np.isfinite(finit):
+            raise ValueError('function returned invalid value {} in starting '
+                             'point ({})'.format(finit, x))
+
+        point = x.copy()
+        if self.gradient is None or self.gradient not in gradient.range:
+            self.gradient = gradient.range.element()
+
+        def phi(step):
+            """Return function value and derivative at ``x + step * d``."""
+            point.lincomb(1, x, step, direction)
+            gradient(point, out=self.gradient)
+            return (np.real(self.function(point)),
+                    self.gradient.inner(direction).real)
+
+        # Translation of the routine dcsrch of MINPACK-2, see [MT1994]
+        stpmin, stpmax = 0.0, self.alpha_max
+        stp = min(self.alpha, stpmax)
+        gtest = self.c1 * ginit
+        width = stpmax - stpmin
+        width1 = 2 * width
+        brackt = False
+        stage = 1
+        stx, fx, gx = 0.0, finit, ginit
+        sty, fy, gy = 0.0, finit, ginit
+        stmin, stmax = 0.0, stp + 4 * stp
+
+        for num_iter in range(1, self.max_num_iter + 1):
+            # The step for which ``f``, ``g`` and the cached gradient are
+            # valid, ``stp`` is updated below
+            step = stp
+            f, g = phi(step)
+            ftest = finit + stp * gtest
+            if stage == 1 and f <= ftest and g >= 0:
+                stage = 2
+
+            # Stop if the Wolfe conditions hold, or if no progress is
+            # possible due to bounds or rounding errors
+            if ((f <= ftest and abs(g) <= -self.c2 * ginit) or
+                    (brackt and (stp <= stmin or stp >= stmax)) or
+                    (brackt and stmax - stmin <= self.xtol * stmax) or
+                    (stp == stpmax and f <= ftest and g <= gtest) or
+                    (stp == stpmin and (f > ftest or g >= gtest))):
+                break
+
+            if stage == 1 and fx >= f > ftest:
+                # Use the modified function psi(stp) = f(stp) - ftest as
+                # long as no step with psi <= 0 and f' >= 0 was found
+                (stx, fxm, gxm, sty, fym, gym,
+                 stp, brackt) = _more_thuente_step(
+                    stx, fx - stx * gtest, gx - gtest,
+                    sty, fy - sty * gtest, gy - gtest,
+                    stp, f - stp * gtest, g - gtest,
+                    brackt, stmin, stmax)
+                fx, gx = fxm + stx * gtest, gxm + gtest
+                fy, gy = fym + sty * gtest, gym + gtest
+            else:
+                (stx, fx, gx, sty, fy, gy,
+                 stp, brackt) = _more_thuente_step(
+                    stx, fx, gx, sty, fy, gy, stp, f, g,
+                    brackt, stmin, stmax)
+
+            # Force a sufficient decrease of the interval size
+            if brackt:
+                if abs(sty - stx) >= 0.66 * width1:
+                    stp = stx + 0.5 * (sty - stx)
+                width1 = width
+                width = abs(sty - stx)
+                stmin, stmax = min(stx, sty), max(stx, sty)
+            else:
+                stmin = stp + 1.1 * (stp - stx)
+                stmax = stp + 4.0 * (stp - stx)
+
+            stp = min(max(stp, stpmin), stpmax)
+
+            # Go back to the best step if no further progress is possible
+            if brackt and (stp <= stmin or stp >= stmax or
+                           stmax - stmin <= self.xtol * stmax):
+                stp = stx
+
+        # If the iteration limit is hit, ``stp`` holds an unevaluated trial
+        # step, hence return the last evaluated one
+        self.total_num_iter += num_iter
+        self.fval = f
+        return step
+
+
 class ConstantLineSearch(LineSearch):
 
     """Line search object that returns a constant step length."""
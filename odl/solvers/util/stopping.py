@@ -0,0 +1,144 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Stopping criteria for iterative methods."""
+
+from __future__ import print_function, division, absolute_import
+from builtins import object
+
+from odl.util import signature_string
+
+__all__ = ('StoppingCriterion',)
+
+
+class StoppingCriterion(object):
+
+    """Stopping criterion based on primal and dual residuals.
+
+    Solvers supporting this criterion (e.g. `pdhg`, `douglas_rachford_pd`,
+    `forward_backward_pd`, `admm_linearized` and `adupdates`) compute a
+    primal and a dual residual every ``check_every`` iterations from
+    quantities they already hold, typically the norms of the changes
+    of the primal and dual variables, and stop when both are small
+    relative to the given scales, i.e., when ::
+
+        primal_residual <= atol + rtol * primal_scale
+        dual_residual <= atol + rtol * dual_scale
+
+    The exact definition of residuals and scales is documented in each
+    solver. Subclasses can implement other rules by overriding
+    ``__call__``.
+
+    After a check, the attributes ``num_iter``, ``primal_residual``,
+    ``dual_residual`` and ``converged`` hold the values of the last check.
+    """
+
+    def __init__(self, rtol=1e-4, atol=0.0, check_every=1):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        rtol : non-negative float, optional
+            Relative tolerance for the residuals.
+        atol : non-negative float, optional
+            Absolute tolerance for the residuals.
+        check_every : positive int, optional
+            Number of iterations between checks. Since computing the
+            residuals costs a few vector operations, checking less often
+            makes the iterations cheaper on average.
+
+        Examples
+        --------
+        Check every 10th iteration if both residuals are smaller than
+        ``1e-3`` times their scales:
+
+        >>> stopping = StoppingCriterion(rtol=1e-3, check_every=10)
+        >>> stopping.check_iteration(0)
+        False
+        >>> stopping.check_iteration(9)
+        True
+        >>> stopping(9, primal_residual=0.1, dual_residual=1e-4,
+        ...          primal_scale=10, dual_scale=1)
+        False
+        >>> stopping(19, primal_residual=1e-3, dual_residual=1e-4,
+        ...          primal_scale=10, dual_scale=1)
+        True
+        >>> stopping.num_iter
+        20
+        """
+        self.rtol, rtol_in = float(rtol), rtol
+        if self.rtol < 0:
+            raise ValueError('`rtol` must be non-negative, got {}'
+                             ''.format(rtol_in))
+        self.atol, atol_in = float(atol), atol
+        if self.atol < 0:
+            raise ValueError('`atol` must be non-negative, got {}'
+                             ''.format(atol_in))
+        self.check_every, check_every_in = int(check_every), check_every
+        if self.check_every <= 0 or self.check_every != check_every_in:
+            raise ValueError('`check_every` must be a positive integer, '
+                             'got {}'.format(check_every_in))
+        self.reset()
+
+    def check_iteration(self, iteration):
+        """Return ``True`` if the criterion should be checked.
+
+        Parameters
+        ----------
+        iteration : int
+            Index of the current iteration, starting at 0.
+        """
+        return (iteration + 1) % self.check_every == 0
+
+    def __call__(self, iteration, primal_residual, dual_residual,
+                 primal_scale=1.0, dual_scale=1.0):
+        """Return ``True`` if the iteration should be stopped.
+
+        Parameters
+        ----------
+        iteration : int
+            Index of the current iteration, starting at 0.
+        primal_residual, dual_residual : float
+            Residuals of the current iterate.
+        primal_scale, dual_scale : float, optional
+            Scales for the relative tolerance, typically the norms of
+            the primal and dual variables.
+        """
+        self.num_iter = iteration + 1
+        self.primal_residual = float(primal_residual)
+        self.dual_residual = float(dual_residual)
+        self.converged = (
+            self.primal_residual <= self.atol + self.rtol * primal_scale and
+            self.dual_residual <= self.atol + self.rtol * dual_scale)
+        return self.converged
+
+    def reset(self):
+        """Reset the values of the last check."""
+        self.num_iter = 0
+        self.primal_residual = float('inf')
+        self.dual_residual = float('inf')
+        self.converged = False
+
+    def __repr__(self):
+        """Return ``repr(self)``.
+
+        Examples
+        --------
+        >>> StoppingCriterion(rtol=1e-3, check_every=10)
+        StoppingCriterion(rtol=0.001, check_every=10)
+        """
+        optargs = [('rtol', self.rtol, 1e-4),
+                   ('atol', self.atol, 0.0),
+                   ('check_every', self.check_every, 1)]
+        inner_str = signature_string([], optargs)
+        return '{}({})'.format(self.__class__.__name__, inner_str)
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
@@ -689,7 +689,7 @@ class FunctionSpace(LinearSpace):
             equals this space, ``False`` otherwise.
         """
         return (isinstance(other, self.element_type) and
-                other.space == self)
+                super(FunctionSpace, self).__contains__(other))
 
     def _astype(self, out_dtype):
         """Internal helper for ``astype``."""
@@ -13,9 +13,9 @@ import numpy as np
 import pytest
 
 import odl
-from odl.deform import LinDeformFixedTempl, LinDeformFixedDisp
+from odl.deform import LinDeformFixedTempl, LinDeformFixedDisp, linear_deform
 from odl.space.entry_points import tensor_space_impl
-from odl.util.testutils import simple_fixture
+from odl.util.testutils import simple_fixture, all_almost_equal
 
 
 # --- pytest fixtures --- #
@@ -154,6 +154,37 @@ def inv_deformed_template(x):
     return template_function(disp_x)
 
 
+# --- linear_deform --- #
+
+
+def test_linear_deform_tiles(space):
+    """Verify that tiled and threaded deformation gives the same result."""
+    template = space.element(template_function)
+    disp_field = space.real_space.tangent_bundle.element(
+        disp_field_factory(space.ndim))
+
+    # Reference: interpolation at all displaced points at once
+    image_pts = space.points()
+    for i, vi in enumerate(disp_field):
+        image_pts[:, i] += vi.asarray().ravel()
+    true_deformed = template.interpolation(image_pts.T, bounds_check=False)
+    true_deformed = true_deformed.reshape(space.shape)
+
+    deformed = linear_deform(template, disp_field)
+    assert all_almost_equal(deformed, true_deformed)
+
+    # One slab per index along the first axis
+    tile_size = space.size // space.shape[0]
+    deformed = linear_deform(template, disp_field, tile_size=tile_size)
+    assert all_almost_equal(deformed, true_deformed)
+
+    out = np.empty(space.shape, dtype=space.dtype)
+    deformed = linear_deform(template, disp_field, out=out,
+                             tile_size=tile_size, threads=3)
+    assert deformed is out
+    assert all_almost_equal(out, true_deformed)
+
+
 # --- LinDeformFixedTempl --- #
 
 
@@ -214,6 +245,42 @@ def test_fixed_templ_deriv(space):
     assert rlt_err < error_bound(space.interp)
 
 
+def test_fixed_templ_call_and_deriv(space):
+    """Verify the combined evaluation of LinDeformFixedTempl."""
+    if not space.is_real:
+        pytest.skip('derivative not implemented for complex dtypes')
+
+    template = space.element(template_function)
+    disp_field = space.tangent_bundle.element(disp_field_factory(space.ndim))
+    vector_field = space.tangent_bundle.element(
+        vector_field_factory(space.ndim))
+
+    for cache_plan in [True, False]:
+        op = LinDeformFixedTempl(template, cache_plan=cache_plan)
+        out = space.element()
+        deformed, deriv = op.call_and_derivative(disp_field, out=out)
+        assert deformed is out
+        assert all_almost_equal(deformed, op(disp_field))
+        assert all_almost_equal(deriv(vector_field),
+                                op.derivative(disp_field)(vector_field))
+
+        # The template gradient is only computed once
+        assert op.template_grad is op.template_grad
+        # The interpolation is cached for the same displacement element
+        assert ((op._engine(disp_field) is op._engine(disp_field)) ==
+                cache_plan)
+
+        # A new displacement must be noticed, and an in-place change
+        # after invalidating the cache
+        disp_field = 0.5 * disp_field
+        assert all_almost_equal(op(disp_field),
+                                linear_deform(template, disp_field))
+        disp_field *= 0.5
+        op.clear_plan_cache()
+        assert all_almost_equal(op(disp_field),
+                                linear_deform(template, disp_field))
+
+
 # --- LinDeformFixedDisp --- #
 
 
@@ -264,6 +331,12 @@ def test_fixed_disp_call(space):
     rlt_err = error / deformed_templ.norm()
     assert rlt_err < error_bound(space.interp)
 
+    # In-place evaluation reuses the interpolation plan
+    out = space.element()
+    deform_op(template, out=out)
+    assert all_almost_equal(out, deformed_templ)
+    assert all_almost_equal(out, linear_deform(template, disp_field))
+
 
 def test_fixed_disp_inv(space):
     """Verify that the inverse of LinDeformFixedDisp is correct."""
@@ -16,8 +16,8 @@ import odl
 from odl.discr.grid import sparse_meshgrid
 from odl.discr.discr_mappings import (
     PointCollocation, NearestInterpolation, LinearInterpolation,
-    PerAxisInterpolation)
-from odl.util.testutils import all_almost_equal, all_equal
+    PerAxisInterpolation, InterpolationPlan)
+from odl.util.testutils import all_almost_equal, all_equal, noise_array
 
 
 def test_nearest_interpolation_1d_complex(odl_tspace_impl):
@@ -340,5 +340,44 @@ def test_collocation_interpolation_identity():
         assert all_almost_equal(ident_values, values)
 
 
+def test_interpolation_plan():
+    """Check the interpolation plan against the interpolation operators."""
+    for interp in ['nearest', 'linear', ['linear', 'nearest']]:
+        space = odl.uniform_discr([-1, 0], [1, 2], (5, 4), interp=interp)
+        values = noise_array(space)
+
+        # Points partly outside the domain
+        pts = np.random.uniform(low=-1.5, high=2.5, size=(2, 20))
+        true_vals = space.element(values).interpolation(
+            pts, bounds_check=False)
+
+        plan = InterpolationPlan(space, pts, weight_dtype='float64')
+        assert plan.out_shape == (20,)
+        assert all_almost_equal(plan(values), true_vals)
+        out = np.empty(20)
+        plan(values, out=out)
+        assert all_almost_equal(out, true_vals)
+
+        # Compact default weights
+        plan = InterpolationPlan(space, pts)
+        assert plan.matrix.dtype == 'float32'
+        assert all_almost_equal(plan(values), true_vals, ndigits=5)
+
+        # Adjoint
+        y = np.random.rand(20)
+        assert pytest.approx(np.vdot(plan(values), y)) == np.vdot(
+            values, plan.adjoint(y))
+
+        # Meshgrid input gives values with the shape of the grid
+        plan = InterpolationPlan(space, space.meshgrid)
+        assert plan.out_shape == space.shape
+        assert all_almost_equal(plan(values), values)
+
+    with pytest.raises(ValueError):
+        InterpolationPlan(space, np.zeros((3, 5)))
+    with pytest.raises(ValueError):
+        plan(np.zeros((4, 5)))
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -16,7 +16,8 @@ import odl
 from odl.discr.discr_ops import _SUPPORTED_RESIZE_PAD_MODES
 from odl.space.entry_points import tensor_space_impl
 from odl.util import is_numeric_dtype, is_real_floating_dtype
-from odl.util.testutils import noise_element, dtype_tol
+from odl.util.testutils import (
+    noise_element, dtype_tol, dtype_ndigits, all_almost_equal)
 
 
 # --- pytest fixtures --- #
@@ -281,5 +282,38 @@ def test_resizing_op_mixed_uni_nonuni():
     assert inner1 == pytest.approx(inner2)
 
 
+# --- Resampling tests --- #
+
+
+def test_resampling_call_and_adjoint(odl_tspace_impl):
+    impl = odl_tspace_impl
+    dtypes = [dt for dt in tensor_space_impl(impl).available_dtypes()
+              if is_real_floating_dtype(dt)]
+
+    for dtype in dtypes:
+        space = odl.uniform_discr([0, -1], [1, 1], (5, 4), dtype=dtype,
+                                  impl=impl, interp=['linear', 'nearest'])
+        res_space = odl.uniform_discr([0, -1], [1, 1], (7, 9), dtype=dtype,
+                                      impl=impl)
+        resamp_op = odl.Resampling(space, res_space)
+
+        # Result must agree with interpolation followed by sampling
+        elem = noise_element(space)
+        expected = res_space.element(elem.interpolation)
+        assert all_almost_equal(resamp_op(elem), expected,
+                                ndigits=dtype_ndigits(dtype))
+
+        out = res_space.element()
+        resamp_op(elem, out=out)
+        assert all_almost_equal(out, expected, ndigits=dtype_ndigits(dtype))
+
+        # The adjoint is exact
+        res_elem = noise_element(res_space)
+        inner1 = resamp_op(elem).inner(res_elem)
+        inner2 = elem.inner(resamp_op.adjoint(res_elem))
+        assert inner1 == pytest.approx(inner2, rel=dtype_tol(dtype))
+        assert resamp_op.adjoint.adjoint is resamp_op
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -9,6 +9,7 @@
 """Unit tests for `tensor_ops`."""
 
 from __future__ import division
+from multiprocessing.pool import ThreadPool
 import pytest
 import numpy as np
 import scipy.sparse
@@ -192,6 +193,32 @@ def test_pointwise_norm_weighted(exponent):
     assert all_almost_equal(out, true_norm)
 
 
+def test_pointwise_norm_multiple_blocks(exponent):
+    # Test a size that is processed in several blocks, which are not all
+    # of the same size, with constant and varying weights
+    fspace = odl.uniform_discr([0, 0], [1, 1], (150, 130), dtype=complex)
+    vfspace = ProductSpace(fspace, 3)
+    testarr = noise_element(vfspace).asarray()
+
+    for weight in [2.0, np.array([1.0, 2.0, 3.0])]:
+        pwnorm = PointwiseNorm(vfspace, exponent, weighting=weight)
+        weight = weight * np.ones(3)
+        if exponent in (1.0, float('inf')):
+            true_norm = np.linalg.norm(weight[:, None, None] * testarr,
+                                       ord=exponent, axis=0)
+        else:
+            true_norm = np.linalg.norm(
+                weight[:, None, None] ** (1 / exponent) * testarr,
+                ord=exponent, axis=0)
+
+        func = vfspace.element(testarr)
+        assert all_almost_equal(pwnorm(func), true_norm)
+
+        # Aliased output
+        pwnorm(func, out=func[0])
+        assert all_almost_equal(func[0], true_norm)
+
+
 def test_pointwise_norm_gradient_real(exponent):
     # The operator is not differentiable for exponent 'inf'
     if exponent == float('inf'):
@@ -430,6 +457,46 @@ def test_pointwise_inner_weighted():
     assert all_almost_equal(out, true_inner)
 
 
+def test_pointwise_inner_multiple_blocks():
+    # Test a size that is processed in several blocks, which are not all
+    # of the same size, with constant and varying weights
+    fspace = odl.uniform_discr([0, 0], [1, 1], (150, 130), dtype=complex)
+    vfspace = ProductSpace(fspace, 3)
+    array = noise_element(vfspace).asarray()
+    testarr = noise_element(vfspace).asarray()
+
+    for weight in [2.0, np.array([1.0, 2.0, 3.0])]:
+        pwinner = PointwiseInner(vfspace, vecfield=array, weighting=weight)
+        weight = weight * np.ones(3)
+        true_inner = np.sum(weight[:, None, None] * testarr * array.conj(),
+                            axis=0)
+
+        func = vfspace.element(testarr)
+        assert all_almost_equal(pwinner(func), true_inner)
+
+        # Aliased output
+        pwinner(func, out=func[0])
+        assert all_almost_equal(func[0], true_inner)
+
+
+def test_pointwise_ops_threaded():
+    # Concurrent calls of the same operator must not share scratch space
+    fspace = odl.uniform_discr([0, 0], [1, 1], (150, 130))
+    vfspace = ProductSpace(fspace, 3)
+    pwnorm = PointwiseNorm(vfspace, weighting=[1.0, 2.0, 3.0])
+    pwinner = PointwiseInner(vfspace, vecfield=noise_element(vfspace))
+    funcs = [noise_element(vfspace) for _ in range(8)]
+
+    pool = ThreadPool(4)
+    for op in [pwnorm, pwinner]:
+        expected = [op(func) for func in funcs]
+        for _ in range(5):
+            results = pool.map(op, funcs)
+            for res, exp in zip(results, expected):
+                assert all_equal(res, exp)
+    pool.close()
+
+
 def test_pointwise_inner_adjoint():
     # 1d
     fspace = odl.uniform_discr([0, 0], [1, 1], (2, 2), dtype=complex)
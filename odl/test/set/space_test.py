@@ -75,5 +75,38 @@ def test_comparsion(linear_space):
         x > y
 
 
+def test_trusted():
+    """Verify that membership checks are cached in a trusted context."""
+    space = odl.uniform_discr([0, 0], [1, 1], (3, 4))
+    same_space = odl.uniform_discr([0, 0], [1, 1], (3, 4))
+    other_space = odl.uniform_discr([0, 0], [1, 2], (3, 4))
+    x = same_space.one()
+    y = other_space.one()
+
+    with odl.trusted() as ctx:
+        assert x in space
+        assert len(ctx.verified) == 1
+        assert x in space
+        assert len(ctx.verified) == 1
+
+        # Negative results are not cached
+        assert y not in space
+        assert y not in space
+        assert len(ctx.verified) == 1
+
+        # Identical spaces do not need to be cached
+        assert space.one() in space
+        assert len(ctx.verified) == 1
+
+        op = odl.IdentityOperator(space)
+        assert op(x) in same_space
+        with pytest.raises(odl.OpDomainError):
+            op(odl.rn(5).one())
+
+    assert ctx.verified == {}
+    assert x in space
+    assert y not in space
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
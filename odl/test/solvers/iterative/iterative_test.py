@@ -24,7 +24,11 @@ import numpy as np
                         'conjugate_gradient_normal',
                         'mlem',
                         'osmlem',
-                        'kaczmarz'])
+                        'kaczmarz',
+                        'lsqr',
+                        'lsmr',
+                        'minres',
+                        'gmres'])
 def iterative_solver(request):
     """Return a solver given by a name with interface solve(op, x, rhs)."""
     solver_name = request.param
@@ -62,6 +66,12 @@ def iterative_solver(request):
             norm2 = op.adjoint(op(x)).norm() / x.norm()
             odl.solvers.kaczmarz([op, op], x, [rhs, rhs], niter=20,
                                  omega=0.5 / norm2)
+    elif solver_name in ('lsqr', 'lsmr', 'minres'):
+        def solver(op, x, rhs):
+            getattr(odl.solvers, solver_name)(op, x, rhs, niter=10)
+    elif solver_name == 'gmres':
+        def solver(op, x, rhs):
+            odl.solvers.gmres(op, x, rhs, niter=10, restart=3)
     else:
         raise ValueError('solver not valid')
 
@@ -111,6 +121,146 @@ def test_solver(optimization_problem, iterative_solver):
     assert all_almost_equal(op(x), rhs, ndigits=2)
 
 
+def test_krylov_least_squares():
+    """Test LSQR and LSMR with damping and preconditioner."""
+    mat = np.random.RandomState(0).randn(8, 5)
+    op = odl.MatrixOperator(mat)
+    rhs = op.range.element(np.arange(8, dtype=float))
+    x0 = op.domain.element([1, -1, 0, 2, 0.5])
+    damp = 0.5
+
+    # Tikhonov regularization around the initial guess
+    normal_mat = mat.T.dot(mat) + damp ** 2 * np.eye(5)
+    expected = x0 + np.linalg.solve(normal_mat, mat.T.dot(rhs - op(x0)))
+    precond = odl.MultiplyOperator(
+        op.domain.element(1 / np.linalg.norm(mat, axis=0)))
+    lstsq_sol = np.linalg.solve(mat.T.dot(mat), mat.T.dot(rhs))
+
+    for solver in [odl.solvers.lsqr, odl.solvers.lsmr]:
+        x = x0.copy()
+        solver(op, x, rhs, niter=10, damp=damp)
+        assert all_almost_equal(x, expected)
+
+        x = op.domain.zero()
+        solver(op, x, rhs, niter=10, precond=precond)
+        assert all_almost_equal(x, lstsq_sol)
+
+
+def test_krylov_square():
+    """Test MINRES and GMRES on indefinite and nonsymmetric systems."""
+    rng = np.random.RandomState(0)
+    space = odl.rn(6)
+    rhs = space.element(np.arange(6, dtype=float))
+
+    # Symmetric indefinite
+    mat = np.diag([3.0, -2.0, 1.0, -1.0, 2.0, 4.0]) + 0.1 * np.ones((6, 6))
+    op = odl.MatrixOperator(mat)
+    precond = odl.MatrixOperator(np.diag(1 / np.abs(np.diag(mat))))
+    expected = np.linalg.solve(mat, rhs)
+    for kwargs in [{}, {'precond': precond}]:
+        x = space.zero()
+        odl.solvers.minres(op, x, rhs, niter=20, **kwargs)
+        assert all_almost_equal(x, expected)
+
+    # Nonsymmetric, with restarts
+    mat = 4 * np.eye(6) + rng.randn(6, 6)
+    op = odl.MatrixOperator(mat)
+    precond = odl.MatrixOperator(np.diag(1 / np.diag(mat)))
+    expected = np.linalg.solve(mat, rhs)
+    for kwargs in [{}, {'restart': 4}, {'precond': precond}]:
+        x = space.zero()
+        odl.solvers.gmres(op, x, rhs, niter=40, **kwargs)
+        assert all_almost_equal(x, expected)
+
+
+def test_block_conjugate_gradient():
+    """Test block CG and CGLS on several right-hand sides."""
+    rng = np.random.RandomState(0)
+    mat = rng.randn(12, 8)
+    spd_mat = mat.T.dot(mat) + np.eye(8)
+    op = odl.MatrixOperator(spd_mat)
+    block_space = odl.ProductSpace(op.domain, 4)
+    rhs = block_space.element(list(rng.randn(4, 8)))
+
+    # With 4 right-hand sides, the Krylov space is full after 2 iterations
+    x = block_space.zero()
+    odl.solvers.block_conjugate_gradient(op, x, rhs, niter=2)
+    for xi, rhsi in zip(x, rhs):
+        assert all_almost_equal(xi, np.linalg.solve(spd_mat, rhsi))
+
+    # Linearly dependent right-hand sides
+    rhs = block_space.element([rhs[0], rhs[1], rhs[0], 2 * rhs[1]])
+    x = block_space.zero()
+    odl.solvers.block_conjugate_gradient(op, x, rhs, niter=4)
+    assert all_almost_equal(x[2], x[0])
+    assert all_almost_equal(x[3], 2 * x[1])
+    assert all_almost_equal(op(x[0]), rhs[0])
+
+    # CGLS
+    op = odl.MatrixOperator(mat)
+    rhs = odl.ProductSpace(op.range, 4).element(list(rng.randn(4, 12)))
+    x = block_space.zero()
+    odl.solvers.block_conjugate_gradient_normal(op, x, rhs, niter=2)
+    for xi, rhsi in zip(x, rhs):
+        lstsq_sol = np.linalg.solve(mat.T.dot(mat), mat.T.dot(rhsi))
+        assert all_almost_equal(xi, lstsq_sol)
+
+
+def test_block_conjugate_gradient_batched():
+    """Test block CGLS with an operator acting on a power space."""
+    space = odl.uniform_discr(0, 1, 8, dtype='complex')
+    block_space = odl.ProductSpace(space, 2)
+    points = np.linspace(-4, 4, 20)
+    op = odl.trafos.NonUniformFourierTransform(block_space, points)
+    rhs = op(odl.util.testutils.noise_element(block_space))
+
+    x = block_space.zero()
+    odl.solvers.block_conjugate_gradient_normal(op, x, rhs, niter=20)
+    assert all_almost_equal(op(x), rhs, ndigits=4)
+
+    with pytest.raises(TypeError):
+        odl.solvers.block_conjugate_gradient_normal(op, space.zero(), rhs,
+                                                    niter=1)
+
+
+def test_multigrid():
+    """Test that multigrid converges independently of the grid size."""
+    def op_factory(space):
+        """Return ``B^* B + 0.1 * (-Laplacian)`` with ``B`` a weighting."""
+        weight = space.element(lambda x: 1 + x[0] ** 2)
+        mask = odl.MultiplyOperator(weight)
+        laplacian = odl.Laplacian(space, pad_mode='symmetric')
+        return mask.adjoint * mask - 0.1 * laplacian
+
+    for shape in [(32, 32), (64, 64)]:
+        space = odl.uniform_discr([-1, -1], [1, 1], shape)
+        rhs = odl.phantom.cuboid(space, [-0.5, -0.5], [0.5, 0.3])
+        op = op_factory(space)
+
+        for kwargs in [{}, {'cycle': 'W'}, {'smoother': 'chebyshev'}]:
+            x = space.zero()
+            odl.solvers.multigrid(op_factory, x, rhs, niter=15, **kwargs)
+            assert (op(x) - rhs).norm() < 1e-6 * rhs.norm()
+
+        # Galerkin coarse operators and preconditioned CG
+        for mg_op in [op_factory, op]:
+            mg = odl.solvers.MultigridPreconditioner(mg_op, space)
+            assert mg.spaces[-1].size <= 64
+            x = space.zero()
+            odl.solvers.conjugate_gradient(op, x, rhs, niter=8, precond=mg)
+            assert (op(x) - rhs).norm() < 1e-6 * rhs.norm()
+
+    with pytest.raises(ValueError):
+        odl.solvers.MultigridPreconditioner(op_factory)
+    with pytest.raises(ValueError):
+        odl.solvers.MultigridPreconditioner(op, cycle='F')
+    with pytest.raises(ValueError):
+        odl.solvers.MultigridPreconditioner(op, smoother='gauss_seidel')
+    with pytest.raises(TypeError):
+        odl.solvers.MultigridPreconditioner(
+            odl.IdentityOperator(odl.rn(3)))
+
+
 def test_steepst_descent():
     """Test steepest descent on the rosenbrock function in 3d."""
     space = odl.rn(3)
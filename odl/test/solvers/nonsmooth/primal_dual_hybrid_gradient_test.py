@@ -10,10 +10,12 @@
 
 from __future__ import division
 import numpy as np
+import pytest
 
 import odl
-from odl.solvers import pdhg
-from odl.util.testutils import all_almost_equal
+from odl.solvers import (
+    pdhg, pdhg_adaptive, pdhg_linesearch, pdhg_diagonal_stepsize)
+from odl.util.testutils import all_almost_equal, simple_fixture
 
 # Places for the accepted error when comparing results
 PLACES = 8
@@ -27,6 +29,38 @@ THETA = 0.9
 DATA = np.arange(6)
 
 
+restart = simple_fixture('restart', [False, True])
+
+
+def _flat(x):
+    """Return the entries of a (nested product space) element as 1d array.
+    """
+    if isinstance(x.space, odl.ProductSpace):
+        return np.concatenate([_flat(xi) for xi in x])
+    else:
+        return x.asarray().ravel()
+
+
+def _unflat(arr, space):
+    """Inverse of `_flat`."""
+    if isinstance(space, odl.ProductSpace):
+        parts, start = [], 0
+        for spc in space:
+            size = _flat(spc.zero()).size
+            parts.append(_unflat(arr[start:start + size], spc))
+            start += size
+        return space.element(parts)
+    else:
+        return space.element(arr.reshape(space.shape))
+
+
+def _matrix(op):
+    """Return the matrix of ``op`` acting on flattened elements."""
+    size = _flat(op.domain.zero()).size
+    return np.array([_flat(op(_unflat(unit_vec, op.domain)))
+                     for unit_vec in np.eye(size)]).T
+
+
 def test_pdhg_simple_space():
     """Test for the Primal-Dual Hybrid Gradient algorithm."""
 
@@ -133,5 +167,138 @@ def test_pdhg_product_space():
     assert all_almost_equal(discr_vec, vec_expl, PLACES)
 
 
+def test_pdhg_diagonal_stepsize():
+    """Test the diagonal preconditioner against explicit matrices."""
+    space = odl.uniform_discr([0, 0], [1, 2], (5, 12))
+    matrix = np.random.rand(7, space.size)
+    flatten = odl.FlatteningOperator(space)
+    fwd_op = odl.MatrixOperator(matrix, flatten.range) * flatten
+    op = odl.BroadcastOperator(fwd_op, 2 * odl.Gradient(space))
+
+    tau, sigma = pdhg_diagonal_stepsize(op)
+
+    row_sums = np.sum(np.abs(_matrix(op)), axis=1)
+    adj_row_sums = np.sum(np.abs(_matrix(op.adjoint)), axis=1)
+    assert all_almost_equal(_flat(tau), 1 / adj_row_sums)
+    assert all_almost_equal(_flat(sigma), 1 / row_sums)
+
+
+def test_pdhg_element_stepsize():
+    """Test PDHG with element-valued step sizes."""
+    space = odl.uniform_discr(0, 1, DATA.size)
+    op = odl.MultiplyOperator(space.element(DATA + 1))
+    f = odl.solvers.ZeroFunctional(space)
+    g = odl.solvers.L2NormSquared(space).translated(DATA)
+
+    # Constant elements give the same result as scalars
+    x_scalar = space.zero()
+    pdhg(x_scalar, f, g, op, niter=3, tau=TAU, sigma=SIGMA)
+    x_elem = space.zero()
+    pdhg(x_elem, f, g, op, niter=3, tau=TAU * space.one(),
+         sigma=SIGMA * space.one())
+    assert all_almost_equal(x_elem, x_scalar, PLACES)
+
+    # Diagonal preconditioning solves the (diagonal) problem exactly
+    x = space.zero()
+    tau, sigma = pdhg_diagonal_stepsize(op)
+    pdhg(x, f, g, op, niter=100, tau=tau, sigma=sigma)
+    assert all_almost_equal(x, DATA / (DATA + 1), PLACES)
+
+
+def _tv_denoising_functionals(shape=10, op_scale=1, data_scale=1):
+    """Return ``f, g, L`` of a TV denoising problem.
+
+    The solution does not depend on ``op_scale``, and it scales linearly
+    with ``data_scale``.
+    """
+    space = odl.uniform_discr([0] * np.size(shape), [1] * np.size(shape),
+                              shape)
+    grad = op_scale * odl.Gradient(space)
+    data = odl.phantom.cuboid(space)
+    data += space.element(np.sin(np.linspace(0, 5, space.size)).reshape(
+        space.shape))
+    data *= data_scale
+    f = odl.solvers.L2NormSquared(space).translated(data)
+    g = 0.05 * data_scale / op_scale * odl.solvers.L1Norm(grad.range)
+    return f, g, grad
+
+
+def _pdhg_gap(f, g, L, x, y):
+    """Return the primal-dual gap of the PDHG problem at ``(x, y)``."""
+    return (f(x) + g(L(x)) + f.convex_conj(-L.adjoint(y)) +
+            g.convex_conj(y))
+
+
+def _tv_denoising_problem():
+    """Return a small TV denoising problem and its solution."""
+    f, g, grad = _tv_denoising_functionals()
+
+    x_opt = grad.domain.zero()
+    tau, sigma = odl.solvers.pdhg_stepsize(grad)
+    pdhg(x_opt, f, g, grad, niter=1000, tau=tau, sigma=sigma)
+    return f, g, grad, x_opt
+
+
+def test_pdhg_adaptive(restart):
+    """Test PDHG with adaptive step sizes on a TV denoising problem."""
+    f, g, grad, x_opt = _tv_denoising_problem()
+
+    # Step sizes violating the convergence condition are reduced
+    x = grad.domain.zero()
+    pdhg_adaptive(x, f, g, grad, niter=200, tau=10, sigma=10,
+                  restart=restart)
+    assert all_almost_equal(x, x_opt, 6)
+
+    # Resuming the iteration with `x_relax` and `y`
+    x = grad.domain.zero()
+    x_relax = x.copy()
+    y = grad.range.zero()
+    pdhg_adaptive(x, f, g, grad, niter=100, x_relax=x_relax, y=y)
+    pdhg_adaptive(x, f, g, grad, niter=100, x_relax=x_relax, y=y)
+    assert all_almost_equal(x, x_opt, 6)
+
+    with pytest.raises(ValueError):
+        pdhg_adaptive(x, f, g, grad, niter=1, alpha=1)
+
+
+def test_pdhg_adaptive_vs_pdhg():
+    """Test that adaptive PDHG is not slower than PDHG with fixed steps."""
+    for shape, op_scale, data_scale, niter in [(10, 1, 1, 20),
+                                               (10, 0.01, 1, 20),
+                                               (10, 100, 1, 20),
+                                               ((16, 16), 1, 255, 100),
+                                               ((16, 16), 100, 1, 100)]:
+        f, g, L = _tv_denoising_functionals(shape, op_scale, data_scale)
+        gaps = []
+        for solver, stepsize in [(pdhg, odl.solvers.pdhg_stepsize(L)),
+                                 (pdhg_adaptive, (None, None))]:
+            x = L.domain.zero()
+            y = L.range.zero()
+            solver(x, f, g, L, niter, tau=stepsize[0], sigma=stepsize[1],
+                   y=y)
+            gaps.append(_pdhg_gap(f, g, L, x, y))
+
+        assert gaps[1] <= gaps[0]
+
+
+def test_pdhg_linesearch(restart):
+    """Test PDHG with line search on a TV denoising problem."""
+    f, g, grad, x_opt = _tv_denoising_problem()
+
+    x = grad.domain.zero()
+    pdhg_linesearch(x, f, g, grad, niter=200, tau=10, sigma=10,
+                    restart=restart)
+    assert all_almost_equal(x, x_opt, 6)
+
+    x = grad.domain.zero()
+    y = grad.range.zero()
+    pdhg_linesearch(x, f, g, grad, niter=100, y=y)
+    pdhg_linesearch(x, f, g, grad, niter=100, y=y)
+    assert all_almost_equal(x, x_opt, 6)
+
+    with pytest.raises(ValueError):
+        pdhg_linesearch(x, f, g, grad, niter=1, mu=0)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
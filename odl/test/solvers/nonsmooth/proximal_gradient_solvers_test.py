@@ -0,0 +1,110 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Tests for the (accelerated) proximal gradient solvers."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.solvers import proximal_gradient, accelerated_proximal_gradient
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+
+# Diagonal of the forward operator and data of the test problem
+DIAG = np.array([1.0, 1.5, 2.0, 2.5, 3.0])
+DATA = np.array([1.0, -1.0, 0.2, -2.0, 3.0])
+# Regularization parameter
+LAM = 0.5
+
+
+fista_kwargs = simple_fixture(
+    'kwargs',
+    [{},
+     {'restart': 'gradient'},
+     {'restart': 'function'},
+     {'backtracking': True},
+     {'backtracking': True, 'restart': 'function'},
+     {'greedy': True}])
+
+
+def _lasso_problem():
+    """Return ``f, g`` and solution of a diagonal LASSO problem.
+
+    The problem is ``min_x LAM ||x||_1 + ||D x - DATA||_2^2`` with
+    ``D = diag(DIAG)``, which has the solution
+    ``x = shrink(2 * DIAG * DATA, LAM) / (2 * DIAG^2)``.
+    """
+    space = odl.rn(DIAG.size)
+    op = odl.MultiplyOperator(space.element(DIAG))
+    f = LAM * odl.solvers.L1Norm(space)
+    g = odl.solvers.L2NormSquared(space).translated(DATA) * op
+    rhs = 2 * DIAG * DATA
+    x_opt = np.sign(rhs) * np.maximum(np.abs(rhs) - LAM, 0) / (2 * DIAG ** 2)
+    return f, g, x_opt
+
+
+def test_proximal_gradient():
+    """Test ISTA on the LASSO problem."""
+    f, g, x_opt = _lasso_problem()
+    x = f.domain.zero()
+    gamma = 1 / (2 * DIAG.max() ** 2)
+    proximal_gradient(x, f, g, gamma, niter=500)
+    assert all_almost_equal(x, x_opt, ndigits=6)
+
+
+def test_accelerated_proximal_gradient(fista_kwargs):
+    """Test the FISTA variants on the LASSO problem."""
+    f, g, x_opt = _lasso_problem()
+    lipschitz = 2 * DIAG.max() ** 2
+    if fista_kwargs.get('backtracking', False):
+        # Step size that violates the convergence condition
+        gamma = 10.0
+    elif fista_kwargs.get('greedy', False):
+        gamma = 1.5 / lipschitz
+    else:
+        gamma = 1 / lipschitz
+
+    x = f.domain.zero()
+    accelerated_proximal_gradient(x, f, g, gamma, niter=300, **fista_kwargs)
+    assert all_almost_equal(x, x_opt, ndigits=6)
+
+
+def test_accelerated_proximal_gradient_restart():
+    """Test that restarts speed up FISTA for a strongly convex problem."""
+    f, g, x_opt = _lasso_problem()
+    gamma = 1 / (2 * DIAG.max() ** 2)
+
+    errors = []
+    for restart in [None, 'gradient']:
+        x = f.domain.zero()
+        accelerated_proximal_gradient(x, f, g, gamma, niter=30,
+                                      restart=restart)
+        errors.append((x - x_opt).norm())
+    assert errors[1] < 0.1 * errors[0]
+
+
+def test_accelerated_proximal_gradient_input_handling():
+    """Test that bad parameters raise errors."""
+    f, g, _ = _lasso_problem()
+    x = f.domain.zero()
+    with pytest.raises(ValueError):
+        accelerated_proximal_gradient(x, f, g, 0.1, 1, restart='always')
+    with pytest.raises(ValueError):
+        accelerated_proximal_gradient(x, f, g, 0.1, 1, backtracking=True,
+                                      beta=1)
+    with pytest.raises(ValueError):
+        accelerated_proximal_gradient(x, f, g, 0.1, 1, backtracking=True,
+                                      greedy=True)
+    with pytest.raises(TypeError):
+        accelerated_proximal_gradient(x, f, g, 0.1, 1, backtrack=True)
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
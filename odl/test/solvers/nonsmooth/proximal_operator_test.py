@@ -532,5 +532,92 @@ def test_proximal_arg_scaling():
             assert all_almost_equal(lhs, rhs)
 
 
+def test_proj_simplex_l1():
+    """Test the projections onto the simplex and the l1-ball."""
+    rng = np.random.RandomState(0)
+    space = odl.rn(50)
+
+    def sort_proj_simplex(arr, diameter):
+        """Reference projection onto the simplex by sorting [D+2008]."""
+        arr_sorted = np.sort(arr)[::-1]
+        cumsum = np.cumsum(arr_sorted) - diameter
+        idx = np.arange(1, arr.size + 1)
+        i = np.nonzero(arr_sorted > cumsum / idx)[0].max()
+        return np.maximum(arr - cumsum[i] / (i + 1), 0)
+
+    for arr in [rng.randn(50), np.round(rng.randn(50)), rng.rand(50) / 100]:
+        x = space.element(arr)
+        for radius in [0.5, 2]:
+            expected = sort_proj_simplex(arr, radius)
+            assert all_almost_equal(odl.solvers.proj_simplex(x, radius),
+                                    expected, HIGH_ACC)
+
+            if np.abs(arr).sum() <= radius:
+                expected = arr
+            else:
+                expected = np.sign(arr) * sort_proj_simplex(np.abs(arr),
+                                                            radius)
+            assert all_almost_equal(odl.solvers.proj_l1(x, radius),
+                                    expected, HIGH_ACC)
+
+    # Independent projections of the components in each point, in-place
+    pspace = odl.ProductSpace(odl.uniform_discr(0, 1, 10), 3)
+    x = odl.phantom.white_noise(pspace, seed=0)
+    x_arr = x.asarray()
+    for proj in [odl.solvers.proj_simplex, odl.solvers.proj_l1]:
+        out = x.copy()
+        proj(out, 2, out=out, axis=0)
+        for i in range(10):
+            expected = proj(odl.rn(3).element(x_arr[:, i]), 2)
+            assert all_almost_equal(out.asarray()[:, i], expected, HIGH_ACC)
+
+    # Proximal of the l-infinity norm by the Moreau identity
+    sigma = 2.0
+    prox = odl.solvers.proximal_linfty(space)(sigma)
+    x = space.element(rng.randn(50))
+    expected = x - odl.solvers.proj_l1(x, sigma)
+    assert all_almost_equal(prox(x), expected, HIGH_ACC)
+    assert all_almost_equal(prox(x / (x.ufuncs.absolute().ufuncs.sum())),
+                            space.zero(), HIGH_ACC)
+
+
+def test_proximal_tv():
+    """Test the total variation proximal against a PDHG reference."""
+    space = odl.uniform_discr([0, 0], [1, 1.5], [16, 12])
+    x = odl.phantom.shepp_logan(space, modified=True)
+    x += odl.phantom.white_noise(space, stddev=0.1, seed=0)
+    lam, sigma = 0.02, 0.5
+    grad = odl.Gradient(space, pad_mode='symmetric')
+    grad_norm = 1.05 * odl.power_method_opnorm(grad, maxiter=100)
+    data_fit = 0.5 * odl.solvers.L2NormSquared(space).translated(x)
+
+    for isotropic in [True, False]:
+        if isotropic:
+            tv = odl.solvers.GroupL1Norm(grad.range)
+        else:
+            tv = odl.solvers.L1Norm(grad.range)
+        expected = x.copy()
+        odl.solvers.pdhg(expected, data_fit, sigma * lam * tv, grad,
+                         niter=3000, tau=1 / grad_norm, sigma=1 / grad_norm)
+
+        prox_factory = odl.solvers.proximal_tv(space, lam, isotropic,
+                                               niter=2000)
+        assert all_almost_equal(prox_factory(sigma)(x), expected, ndigits=4)
+
+        # Warm start: repeated evaluations improve the result
+        prox_factory = odl.solvers.proximal_tv(space, lam, isotropic,
+                                               niter=10)
+        errors = [(prox_factory(sigma)(x) - expected).norm()
+                  for _ in range(3)]
+        assert errors[0] > errors[1] > errors[2]
+
+        # In-place evaluation with aliased input and output
+        prox = odl.solvers.proximal_tv(space, lam, isotropic, niter=10000,
+                                       tol=1e-10)(sigma)
+        x_inplace = x.copy()
+        prox(x_inplace, out=x_inplace)
+        assert all_almost_equal(x_inplace, expected, ndigits=4)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -9,9 +9,11 @@
 """Test for the smooth solvers."""
 
 from __future__ import division
+import numpy as np
 import pytest
 import odl
 from odl.operator import OpNotImplementedError
+from odl.util.testutils import all_almost_equal
 
 
 nonlinear_cg_beta = odl.util.testutils.simple_fixture('nonlinear_cg_beta',
@@ -112,6 +114,26 @@ def test_lbfgs_solver(functional_and_linesearch):
     assert functional(x) < 1e-3
 
 
+def test_lbfgs_compact(functional):
+    """Test the ``lbfgs`` solver with default and backtracking line search."""
+    for line_search in [None, odl.solvers.BacktrackingLineSearch(functional)]:
+        x = functional.domain.one()
+        odl.solvers.lbfgs(functional, x, tol=1e-6, line_search=line_search,
+                          num_store=3)
+        assert functional(x) < 1e-3
+
+    # Fewer stored pairs than iterations, complex space
+    space = odl.cn(10)
+    diag = space.element(np.arange(1, 11) + 1j)
+    func = odl.solvers.L2NormSquared(space) * odl.MultiplyOperator(diag)
+    x = space.one()
+    odl.solvers.lbfgs(func, x, tol=1e-10, num_store=2)
+    assert all_almost_equal(x, space.zero())
+
+    with pytest.raises(ValueError):
+        odl.solvers.lbfgs(func, x, num_store=0)
+
+
 def test_broydens_method(broyden_impl, functional_and_linesearch):
     """Test the ``broydens_method`` quasi-Newton solver."""
     functional, line_search = functional_and_linesearch
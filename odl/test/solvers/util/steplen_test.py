@@ -9,7 +9,10 @@
 """Test for the smooth solvers."""
 
 from __future__ import division
+import pytest
+
 import odl
+from odl.util.testutils import all_almost_equal
 
 
 def test_backtracking_line_search():
@@ -30,6 +33,50 @@ def test_backtracking_line_search():
         assert func(x + steplen * direction) < func(x)
 
 
+def test_more_thuente_line_search():
+    """Test the strong Wolfe conditions for MoreThuenteLineSearch."""
+    space = odl.rn(2)
+    func = odl.solvers.RosenbrockFunctional(space)
+
+    for c2 in [0.9, 0.1]:
+        line_search = odl.solvers.MoreThuenteLineSearch(func, c2=c2)
+        x = space.element([-1, 1])
+        for direction in [-func.gradient(x),
+                          space.element([1, 0]),
+                          space.element([1e-3, -1e-3])]:
+            dir_derivative = func.gradient(x).inner(direction)
+            fval = func(x)
+
+            steplen = line_search(x, direction, dir_derivative)
+            new_x = x + steplen * direction
+            new_dir_derivative = func.gradient(new_x).inner(direction)
+            assert func(new_x) <= fval + 1e-4 * steplen * dir_derivative
+            assert abs(new_dir_derivative) <= c2 * abs(dir_derivative)
+
+            # Cached values
+            assert line_search.fval == func(new_x)
+            assert all_almost_equal(line_search.gradient,
+                                    func.gradient(new_x))
+
+    with pytest.raises(ValueError):
+        line_search(x, space.element([-1, 0]))
+    with pytest.raises(ValueError):
+        odl.solvers.MoreThuenteLineSearch(func, c1=0.5, c2=0.1)
+
+    # Cached values must belong to the returned step also if the
+    # iteration limit is hit before the Wolfe conditions hold
+    for max_num_iter in [1, 2]:
+        line_search = odl.solvers.MoreThuenteLineSearch(
+            func, c2=0.1, max_num_iter=max_num_iter)
+        x = space.element([-1, 1])
+        direction = -func.gradient(x)
+        steplen = line_search(x, direction)
+        new_x = x + steplen * direction
+        assert line_search.total_num_iter == max_num_iter
+        assert line_search.fval == func(new_x)
+        assert all_almost_equal(line_search.gradient, func.gradient(new_x))
+
+
 def test_constant_line_search():
     """Test some basic properties of BacktrackingLineSearch."""
     space = odl.rn(2)
@@ -0,0 +1,100 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Tests for the stopping criteria of the nonsmooth solvers."""
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.solvers import StoppingCriterion
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+
+solver = simple_fixture(
+    'solver', ['pdhg', 'douglas_rachford_pd', 'forward_backward_pd',
+               'admm_linearized', 'adupdates'])
+
+
+def _run_solver(solver, x, niter, stopping):
+    """Solve ``min_x 1/2 ||x - data||^2 + 0.1 ||x||_1`` with ``solver``."""
+    space = x.space
+    data = space.element(np.linspace(-1, 1, space.size))
+    ident = odl.IdentityOperator(space)
+    data_fit = 0.5 * odl.solvers.L2NormSquared(space).translated(data)
+    reg = 0.1 * odl.solvers.L1Norm(space)
+
+    if solver == 'pdhg':
+        odl.solvers.pdhg(x, data_fit, reg, ident, niter, tau=0.5, sigma=0.5,
+                         stopping=stopping)
+    elif solver == 'douglas_rachford_pd':
+        odl.solvers.douglas_rachford_pd(x, data_fit, [reg], [ident], niter,
+                                        tau=1.0, sigma=[1.0],
+                                        stopping=stopping)
+    elif solver == 'forward_backward_pd':
+        odl.solvers.forward_backward_pd(
+            x, odl.solvers.ZeroFunctional(space), [reg], [ident], data_fit,
+            tau=0.5, sigma=[0.5], niter=niter, stopping=stopping)
+    elif solver == 'admm_linearized':
+        odl.solvers.admm_linearized(x, data_fit, reg, ident, tau=0.5,
+                                    sigma=1.0, niter=niter, stopping=stopping)
+    elif solver == 'adupdates':
+        odl.solvers.adupdates(x, [data_fit, reg], [ident, ident],
+                              stepsize=1.0, inner_stepsizes=[1.0, 1.0],
+                              niter=niter, stopping=stopping)
+    return np.sign(data) * np.maximum(np.abs(data) - 0.1, 0)
+
+
+def test_stopping_criterion():
+    """Test the basic properties of StoppingCriterion."""
+    stopping = StoppingCriterion(rtol=0.1, atol=1e-3, check_every=3)
+    assert not stopping.converged
+    assert [stopping.check_iteration(i) for i in range(6)] == [
+        False, False, True, False, False, True]
+
+    assert not stopping(2, primal_residual=0.2, dual_residual=0.0,
+                        primal_scale=1.0, dual_scale=1.0)
+    assert stopping.num_iter == 3
+    assert stopping(5, primal_residual=0.1, dual_residual=1e-3,
+                    primal_scale=1.0, dual_scale=0.0)
+    assert stopping.converged
+
+    stopping.reset()
+    assert stopping.num_iter == 0
+    assert not stopping.converged
+
+    with pytest.raises(ValueError):
+        StoppingCriterion(rtol=-1)
+    with pytest.raises(ValueError):
+        StoppingCriterion(check_every=0)
+    with pytest.raises(ValueError):
+        StoppingCriterion(check_every=1.5)
+
+
+def test_solver_early_stopping(solver):
+    """Test that the solvers stop early at a converged iterate."""
+    space = odl.uniform_discr(0, 1, 10)
+    niter = 1000
+    stopping = StoppingCriterion(rtol=1e-8, check_every=5)
+
+    x = space.zero()
+    expected = _run_solver(solver, x, niter, stopping)
+    assert stopping.converged
+    assert stopping.num_iter < niter
+    assert stopping.num_iter % 5 == 0
+    assert all_almost_equal(x, expected, ndigits=5)
+
+    # A tolerance of 0 never stops
+    stopping = StoppingCriterion(rtol=0)
+    _run_solver(solver, space.zero(), 20, stopping)
+    assert stopping.num_iter == 20
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
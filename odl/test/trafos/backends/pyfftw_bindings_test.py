@@ -7,11 +7,14 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 from __future__ import division
+from multiprocessing.pool import ThreadPool
 import numpy as np
 import pytest
 
 import odl
-from odl.trafos.backends import pyfftw_call, PYFFTW_AVAILABLE
+from odl.trafos.backends import (
+    pyfftw_call, PYFFTW_AVAILABLE, fftw_wisdom_file, load_fftw_wisdom,
+    save_fftw_wisdom, clear_fftw_plan_cache)
 from odl.util import (
     is_real_dtype, complex_dtype)
 from odl.util.testutils import (
@@ -385,5 +388,70 @@ def test_pyfftw_call_backward_with_plan():
         assert all_almost_equal(idft_arr, true_idft)
 
 
+def test_pyfftw_call_plan_cache(tmpdir, monkeypatch):
+    import pyfftw
+
+    monkeypatch.setenv('ODL_HOME', str(tmpdir))
+    clear_fftw_plan_cache()
+
+    # Alignment is part of the cache key
+    shape = (4, 5)
+    arr = pyfftw.byte_align(_random_array(shape, dtype='complex128'))
+    true_dft = np.fft.fftn(arr)
+
+    dft_arr = pyfftw.empty_aligned(shape, dtype='complex128')
+    plan1 = pyfftw_call(arr, dft_arr, planning_effort='measure')
+    assert all_almost_equal(dft_arr, true_dft)
+
+    # Same parameters and memory layout -> same plan from the cache
+    dft_arr2 = pyfftw.empty_aligned(shape, dtype='complex128')
+    plan2 = pyfftw_call(pyfftw.byte_align(arr.copy()), dft_arr2,
+                        planning_effort='measure')
+    assert plan2 is plan1
+    assert all_almost_equal(dft_arr2, true_dft)
+
+    # Cached plans use internal arrays, and wisdom is not saved per call
+    assert plan1.input_array is not arr
+    assert plan1.output_array is not dft_arr
+    assert not tmpdir.join('fftw_wisdom.pkl').check()
+
+    # Concurrent calls with the same parameters
+    pool = ThreadPool(4)
+    arrs = [_random_array(shape, dtype='complex128') for _ in range(8)]
+
+    def fft(arr):
+        out = np.empty(shape, dtype='complex128')
+        pyfftw_call(arr, out, planning_effort='measure')
+        return out
+
+    for arr_i, dft_i in zip(arrs, pool.map(fft, arrs)):
+        assert all_almost_equal(dft_i, np.fft.fftn(arr_i))
+    pool.close()
+
+    # Different parameters -> new plan
+    plan3 = pyfftw_call(arr, dft_arr, planning_effort='measure', axes=0)
+    assert plan3 is not plan1
+
+    # Plans can be bypassed
+    plan4 = pyfftw_call(arr, dft_arr, planning_effort='measure',
+                        use_plan_cache=False)
+    assert plan4 is not plan1
+
+    clear_fftw_plan_cache()
+    plan5 = pyfftw_call(arr, dft_arr, planning_effort='measure')
+    assert plan5 is not plan1
+
+
+def test_fftw_wisdom_file(tmpdir, monkeypatch):
+    monkeypatch.setenv('ODL_HOME', str(tmpdir))
+    fname = fftw_wisdom_file()
+    assert fname.startswith(str(tmpdir))
+
+    assert not load_fftw_wisdom()  # no file yet
+    save_fftw_wisdom()
+    assert isinstance(load_fftw_wisdom(fname), bool)
+    assert tmpdir.join('fftw_wisdom.pkl').check()
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
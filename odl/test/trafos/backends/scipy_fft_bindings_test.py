@@ -0,0 +1,123 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.trafos.backends import scipy_fft_call, SCIPY_FFT_AVAILABLE
+from odl.util import is_real_dtype, complex_dtype
+from odl.util.testutils import all_almost_equal, simple_fixture
+
+
+pytestmark = pytest.mark.skipif(not SCIPY_FFT_AVAILABLE,
+                                reason='`scipy.fft` backend not available')
+
+
+# --- pytest fixtures --- #
+
+
+shape = simple_fixture('shape', [(10,), (3, 4, 5)])
+axes = simple_fixture('axes', [None, (0,), (-1,)])
+
+
+# --- helper functions --- #
+
+
+def _random_array(shape, dtype):
+    if is_real_dtype(dtype):
+        return np.random.rand(*shape).astype(dtype)
+    else:
+        return (np.random.rand(*shape).astype(dtype) +
+                1j * np.random.rand(*shape).astype(dtype))
+
+
+def _halfcomplex_shape(shape, axes):
+    shape = list(shape)
+    shape[axes[-1]] = shape[axes[-1]] // 2 + 1
+    return tuple(shape)
+
+
+# ---- scipy_fft_call ---- #
+
+
+def test_scipy_fft_call_forward(odl_floating_dtype, shape, axes):
+    # Test against Numpy's FFT
+    dtype = odl_floating_dtype
+    if dtype == np.dtype('float16'):  # not supported, skipping
+        return
+
+    halfcomplex = is_real_dtype(dtype)
+    arr = _random_array(shape, dtype)
+    ax = tuple(range(len(shape))) if axes is None else axes
+
+    if halfcomplex:
+        true_dft = np.fft.rfftn(arr, axes=ax)
+        dft_arr = np.empty(_halfcomplex_shape(shape, ax),
+                           dtype=complex_dtype(dtype))
+    else:
+        true_dft = np.fft.fftn(arr, axes=ax)
+        dft_arr = np.empty(shape, dtype=dtype)
+
+    arr_cpy = arr.copy()
+    scipy_fft_call(arr, dft_arr, direction='forward', axes=axes,
+                   halfcomplex=halfcomplex, workers=2)
+
+    assert all_almost_equal(arr, arr_cpy)  # Input preserved
+    assert all_almost_equal(dft_arr, true_dft)
+
+
+def test_scipy_fft_call_backward(odl_floating_dtype, shape, axes):
+    # Test against Numpy's IFFT, with and without normalization
+    dtype = odl_floating_dtype
+    if dtype == np.dtype('float16'):  # not supported, skipping
+        return
+
+    halfcomplex = is_real_dtype(dtype)
+    ax = tuple(range(len(shape))) if axes is None else axes
+    idft_scaling = np.prod(np.take(shape, ax))
+
+    if halfcomplex:
+        arr = _random_array(_halfcomplex_shape(shape, ax),
+                            complex_dtype(dtype))
+        true_idft = np.fft.irfftn(arr, np.take(shape, ax), axes=ax)
+    else:
+        arr = _random_array(shape, dtype)
+        true_idft = np.fft.ifftn(arr, axes=ax)
+
+    idft_arr = np.empty(shape, dtype=dtype)
+    scipy_fft_call(arr, idft_arr, direction='backward', axes=axes,
+                   halfcomplex=halfcomplex)
+    assert all_almost_equal(idft_arr, true_idft * idft_scaling)
+
+    scipy_fft_call(arr, idft_arr, direction='backward', axes=axes,
+                   halfcomplex=halfcomplex, normalise_idft=True)
+    assert all_almost_equal(idft_arr, true_idft)
+
+
+def test_scipy_fft_call_in_place():
+    arr = _random_array((3, 4), dtype='complex128')
+    true_dft = np.fft.fftn(arr)
+    scipy_fft_call(arr, arr, overwrite_input=True)
+    assert all_almost_equal(arr, true_dft)
+
+
+def test_scipy_fft_call_bad_input():
+    arr = np.zeros((3, 4), dtype='float64')
+    with pytest.raises(ValueError):  # wrong output shape
+        scipy_fft_call(arr, np.zeros((3, 4), dtype='complex128'),
+                       halfcomplex=True)
+    with pytest.raises(ValueError):
+        scipy_fft_call(arr, arr, direction='sideways')
+    with pytest.raises(TypeError):
+        scipy_fft_call(arr, arr, planning_effort='measure')
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
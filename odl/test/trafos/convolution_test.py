@@ -0,0 +1,125 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import numpy as np
+import pytest
+import scipy.signal
+
+import odl
+from odl.trafos import Convolution
+from odl.util.numerics import resize_array
+from odl.util.testutils import (
+    all_almost_equal, dtype_tol, noise_array, noise_element, simple_fixture)
+
+
+# --- pytest fixtures --- #
+
+
+pad_mode = simple_fixture(
+    'pad_mode', ['constant', 'symmetric', 'periodic', 'order0', 'order1'])
+method = simple_fixture('method', ['direct', 'fft', 'overlap_add'])
+kernel_shape = simple_fixture('kernel_shape', [(3, 5), (8, 4)])
+separable = simple_fixture('separable', [True, False])
+space_dtype = simple_fixture('dtype', ['float32', 'complex128'])
+
+
+# --- helper functions --- #
+
+
+def _reference_convolution(arr, kernel, pad_mode):
+    """Pad and convolve with ``scipy.signal.convolve``."""
+    padded_shape = tuple(n + k - 1 for n, k in zip(arr.shape, kernel.shape))
+    offset = tuple(k // 2 for k in kernel.shape)
+    padded = resize_array(arr, padded_shape, offset=offset,
+                          pad_mode=pad_mode)
+    return scipy.signal.convolve(padded, kernel, mode='valid',
+                                 method='direct')
+
+
+def _kernel(space, kernel_shape, separable):
+    kernel_space = odl.uniform_discr([0, 0], [1, 1], kernel_shape,
+                                     dtype=space.dtype)
+    if separable:
+        return np.multiply.outer(noise_array(odl.rn(kernel_shape[0])),
+                                 noise_array(odl.rn(kernel_shape[1])))
+    else:
+        return noise_array(kernel_space)
+
+
+# --- Convolution --- #
+
+
+def test_convolution_call(pad_mode, method, kernel_shape, separable,
+                          space_dtype):
+    space = odl.uniform_discr([0, 0], [1, 1], (17, 13), dtype=space_dtype)
+    kernel = _kernel(space, kernel_shape, separable)
+    conv = Convolution(space, kernel, pad_mode=pad_mode, method=method)
+    assert conv.is_separable == separable
+    x = noise_element(space)
+
+    expected = _reference_convolution(x.asarray(),
+                                      kernel.astype(space.dtype), pad_mode)
+    tol = dtype_tol(space.dtype)
+    assert np.allclose(conv(x), expected, rtol=tol, atol=tol)
+
+    out = space.element()
+    conv(x, out=out)
+    assert np.allclose(out, expected, rtol=tol, atol=tol)
+
+
+def test_convolution_scipy_same(method, kernel_shape):
+    """Compare with ``mode='same'`` in SciPy, also for even kernel sizes."""
+    space = odl.uniform_discr([0, 0], [1, 1], (17, 13))
+    kernel = noise_array(odl.rn(kernel_shape))
+    conv = Convolution(space, kernel, method=method)
+    x = noise_element(space)
+
+    expected = scipy.signal.convolve(x.asarray(), kernel, mode='same',
+                                     method='direct')
+    assert all_almost_equal(conv(x), expected)
+
+
+def test_convolution_adjoint(pad_mode, method, separable):
+    space = odl.uniform_discr([0, 0], [1, 1], (17, 13), dtype='complex128')
+    kernel = _kernel(space, (4, 5), separable)
+    conv = Convolution(space, kernel, pad_mode=pad_mode, method=method)
+    x = noise_element(space)
+    y = noise_element(space)
+
+    assert conv(x).inner(y) == pytest.approx(x.inner(conv.adjoint(y)))
+    assert conv.adjoint.adjoint is conv
+
+
+def test_convolution_method_choice():
+    space = odl.uniform_discr([0, 0], [1, 1], (256, 256))
+    assert Convolution(space, np.ones((3, 3))).method == 'direct'
+    assert Convolution(space, noise_array(odl.rn((31, 31)))).method == 'fft'
+
+    # The kernel spectrum is computed once and reused
+    conv = Convolution(space, noise_array(odl.rn((31, 31))))
+    x = noise_element(space)
+    assert all_almost_equal(conv(x), conv(x))
+
+
+def test_convolution_bad_input():
+    space = odl.uniform_discr([0, 0], [1, 1], (5, 5))
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones(3))  # wrong ndim
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones((6, 1)))  # too large
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones((3, 3)) * 1j)  # complex kernel
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones((3, 3)), pad_mode='reflect')
+    with pytest.raises(ValueError):
+        Convolution(space, np.ones((3, 3)), method='winograd')
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
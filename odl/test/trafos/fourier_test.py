@@ -18,7 +18,7 @@ from odl.trafos.fourier import (
     DiscreteFourierTransform, DiscreteFourierTransformInverse,
     FourierTransform)
 from odl.util import (all_almost_equal, never_skip, skip_if_no_pyfftw,
-                      noise_element,
+                      skip_if_no_scipy_fft, noise_element,
                       is_real_dtype, conj_exponent, complex_dtype)
 from odl.util.testutils import simple_fixture
 
@@ -27,7 +27,8 @@ from odl.util.testutils import simple_fixture
 
 
 impl = simple_fixture('impl', [never_skip('numpy'),
-                               skip_if_no_pyfftw('pyfftw')])
+                               skip_if_no_pyfftw('pyfftw'),
+                               skip_if_no_scipy_fft('scipy')])
 exponent = simple_fixture('exponent', [2.0, 1.0, float('inf'), 1.5])
 sign = simple_fixture('sign', ['-', '+'])
 
@@ -314,7 +315,17 @@ def test_dft_init_plan(impl):
         with pytest.raises(ValueError):
             dft.clear_fftw_plan()
     else:
+        from odl.trafos.backends.pyfftw_bindings import _FFTW_PLAN_CACHE
+
+        # Plans from the global cache must not be stored in the operator
+        dft(dft.domain.one())
+        assert dft._fftw_plan is None
+
+        # The initialized plan is private to the operator
         dft.init_fftw_plan()
+        assert all(dft._fftw_plan is not entry[0]
+                   for entries in _FFTW_PLAN_CACHE.values()
+                   for entry in entries)
 
         # Make sure plan can be used
         dft._fftw_plan(dft.domain.element().asarray(),
@@ -358,10 +369,12 @@ def test_fourier_trafo_range(exponent, odl_floating_dtype):
                                              shift=True)
     assert dft.range.exponent == conj_exponent(exponent)
 
-    # shift must be True in the last axis
+    # shift must be True in all axes
     if halfcomplex:
         with pytest.raises(ValueError):
             FourierTransform(space_discr, shift=(True, True, False))
+        with pytest.raises(ValueError):
+            FourierTransform(space_discr, shift=(False, True, True))
 
     if exponent != 2.0:
         with pytest.raises(NotImplementedError):
@@ -371,6 +384,23 @@ def test_fourier_trafo_range(exponent, odl_floating_dtype):
         FourierTransform(dft.domain.partition)
 
 
+def test_fourier_trafo_mixed_shift(impl):
+    # Mixed shifts are not possible in half-complex transforms, since the
+    # pre-processed data is complex. The full R2C transform must match
+    # the transform of the complex space.
+    space = odl.uniform_discr([0, 0], [1, 1], (6, 8), impl='numpy')
+    shift = (False, True)
+    with pytest.raises(ValueError):
+        FourierTransform(space, shift=shift, halfcomplex=True, impl=impl)
+
+    ft = FourierTransform(space, shift=shift, halfcomplex=False, impl=impl)
+    ft_complex = FourierTransform(space.complex_space, shift=shift,
+                                  impl=impl)
+    x = noise_element(space)
+    assert all_almost_equal(ft(x), ft_complex(x.asarray().astype(complex)))
+    assert all_almost_equal(ft.inverse(ft(x)), x)
+
+
 def test_fourier_trafo_init_plan(impl, odl_floating_dtype):
     dtype = odl_floating_dtype
 
@@ -474,6 +504,32 @@ def test_fourier_trafo_call(impl, odl_floating_dtype):
     assert np.allclose(ift(ft(one)), one)
 
 
+def test_fourier_trafo_pre_post_processing(impl):
+    # Cached processing factors must match the `ft_utils` functions
+    space = odl.uniform_discr([0, 0, -1], [1, 2, 1], (4, 5, 6),
+                              dtype='complex128', interp='linear')
+    shift = (True, False)
+    axes = (0, 2)
+    ft = FourierTransform(space, impl=impl, axes=axes, shift=shift)
+    ift = ft.inverse
+
+    x = noise_element(space).asarray()
+    true_pre = dft_preprocess_data(x, shift=shift, axes=axes)
+    true_post = dft_postprocess_data(
+        x, real_grid=space.grid, recip_grid=ft.range.grid, shift=shift,
+        axes=axes, interp=space.interp)
+
+    # Repeated calls reuse the factors computed in the first one
+    for _ in range(2):
+        assert all_almost_equal(ft._preprocess(x), true_pre)
+        assert all_almost_equal(ft._postprocess(x), true_post)
+        assert all_almost_equal(ift._preprocess(ft._postprocess(x)), x)
+        assert all_almost_equal(ift._postprocess(ft._preprocess(x)), x)
+
+    y = noise_element(space)
+    assert all_almost_equal(ift(ft(y)), y)
+
+
 def test_fourier_trafo_charfun_1d():
     # Characteristic function of [0, 1], its Fourier transform is
     # given by exp(-1j * y / 2) * sinc(y/2)
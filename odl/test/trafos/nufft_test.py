@@ -0,0 +1,116 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import division
+import numpy as np
+import pytest
+
+import odl
+from odl.trafos import FourierTransform, NonUniformFourierTransform
+from odl.trafos.util.ft_utils import _interp_kernel_ft
+from odl.util.testutils import (
+    all_almost_equal, noise_element, simple_fixture)
+
+
+# --- pytest fixtures --- #
+
+
+space_dtype = simple_fixture('dtype', ['float64', 'complex128'])
+interp = simple_fixture('interp', ['nearest', 'linear'])
+
+
+# --- helper functions --- #
+
+
+def _dense_ft(x, points):
+    """Direct evaluation of the discretized continuous FT."""
+    space = x.space
+    grid_pts = space.points()
+    phase = np.exp(-1j * points.dot(grid_pts.T))
+    values = phase.dot(x.asarray().ravel())
+    for axis, intp in enumerate(space.interp_byaxis):
+        stride = space.cell_sides[axis]
+        values *= stride * _interp_kernel_ft(
+            points[:, axis] * stride / (2 * np.pi), intp)
+    return values
+
+
+# --- NonUniformFourierTransform --- #
+
+
+def test_nufft_against_dense(space_dtype, interp):
+    space = odl.uniform_discr([-1, 0], [1, 3], (10, 13), dtype=space_dtype,
+                              interp=interp)
+    # Random frequencies, including some beyond the Nyquist frequency
+    points = (np.random.rand(50, 2) - 0.5) * 2.5 * np.pi / space.cell_sides
+    nuft = NonUniformFourierTransform(space, points)
+    x = noise_element(space)
+
+    result = nuft(x)
+    expected = _dense_ft(x, points)
+    assert result.space == odl.cn(50)
+    assert np.max(np.abs(result - expected)) < 1e-4 * np.max(np.abs(expected))
+
+
+def test_nufft_against_fourier_trafo():
+    space = odl.uniform_discr([0, 0], [1, 2], (8, 9), dtype='complex')
+    ft = FourierTransform(space, impl='numpy')
+    nuft = NonUniformFourierTransform(space, ft.range.points(),
+                                      kernel_width=8)
+    x = noise_element(space)
+    assert all_almost_equal(nuft(x), ft(x).asarray().ravel(), ndigits=5)
+
+
+def test_nufft_adjoint(space_dtype):
+    space = odl.uniform_discr([-1, 0], [1, 3], (10, 13), dtype=space_dtype)
+    points = np.random.randn(40, 2) * 5
+    nuft = NonUniformFourierTransform(space, points, oversampling=1.5,
+                                      kernel_width=4)
+    x = noise_element(space)
+    y = noise_element(nuft.range)
+
+    # The adjoint is exact for the approximated operator. For real
+    # domains, it is the adjoint with respect to the real inner product.
+    lhs = nuft(x).inner(y)
+    if space.is_real:
+        lhs = lhs.real
+    assert lhs == pytest.approx(x.inner(nuft.adjoint(y)))
+    assert nuft.adjoint.adjoint is nuft
+
+
+def test_nufft_batched():
+    space = odl.uniform_discr(-1, 1, 16, dtype='complex')
+    points = np.linspace(-20, 20, 31)
+    nuft = NonUniformFourierTransform(space, points)
+    nuft_batch = NonUniformFourierTransform(space ** 3, points)
+    assert nuft_batch.range == odl.cn(31) ** 3
+
+    x = noise_element(nuft_batch.domain)
+    y = noise_element(nuft_batch.range)
+    result = nuft_batch(x)
+    adj_result = nuft_batch.adjoint(y)
+    for i in range(3):
+        assert all_almost_equal(result[i], nuft(x[i]))
+        assert all_almost_equal(adj_result[i], nuft.adjoint(y[i]))
+
+
+def test_nufft_bad_input():
+    space = odl.uniform_discr([0, 0], [1, 1], (4, 4))
+    with pytest.raises(ValueError):
+        NonUniformFourierTransform(space, np.zeros((5, 3)))
+    with pytest.raises(ValueError):
+        NonUniformFourierTransform(space, np.zeros((5, 2)), oversampling=1)
+    with pytest.raises(ValueError):
+        NonUniformFourierTransform(space, np.zeros((5, 2)),
+                                   kernel_width=2.5)
+    with pytest.raises(ValueError):
+        NonUniformFourierTransform(space * odl.rn(2), np.zeros((5, 2)))
+
+
+if __name__ == '__main__':
+    odl.util.test_file(__file__)
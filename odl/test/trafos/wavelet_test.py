@@ -109,5 +109,32 @@ def test_wavelet_transform(wave_impl, shape_setup, odl_floating_dtype, axes):
     assert all_almost_equal(image, reco_image)
 
 
+def test_wavelet_transform_threads(wave_impl, wavelet):
+    # Batch transforms split across threads must give the same result
+    space = odl.uniform_discr([-1, -1, -1], [1, 1, 1], (7, 16, 17))
+    image = noise_element(space)
+
+    for axes in [(1, 2), (0,)]:
+        wave_trafo = odl.trafos.WaveletTransform(
+            space, wavelet, nlevels=2, impl=wave_impl, axes=axes, threads=1)
+        wave_trafo_thr = odl.trafos.WaveletTransform(
+            space, wavelet, nlevels=2, impl=wave_impl, axes=axes, threads=3)
+        assert wave_trafo_thr.inverse.threads == 3
+
+        coeffs = wave_trafo(image)
+        coeffs_thr = wave_trafo_thr.range.element()
+        wave_trafo_thr(image, out=coeffs_thr)
+        assert all_almost_equal(coeffs_thr, coeffs)
+
+        reco = space.element()
+        wave_trafo_thr.inverse(coeffs_thr, out=reco)
+        assert all_almost_equal(reco, wave_trafo.inverse(coeffs))
+        assert all_almost_equal(reco, image)
+
+    with pytest.raises(ValueError):
+        odl.trafos.WaveletTransform(space, wavelet, impl=wave_impl,
+                                    threads=0)
+
+
 if __name__ == '__main__':
     odl.util.test_file(__file__)
@@ -11,7 +11,7 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 
 from odl.discr import ResizingOperator
-from odl.trafos import FourierTransform, PYFFTW_AVAILABLE
+from odl.trafos import FourierTransform
 
 
 __all__ = ('fbp_op', 'fbp_filter_op', 'tam_danielson_window',
@@ -361,7 +361,6 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
     --------
     tam_danielson_window : Windowing for helical data
     """
-    impl = 'pyfftw' if PYFFTW_AVAILABLE else 'numpy'
     alen = ray_trafo.geometry.motion_params.length
 
     if ray_trafo.domain.ndim == 2:
@@ -380,10 +379,10 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
                        ray_trafo.range.shape[1] * 2 - 1)
             resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
 
-            fourier = FourierTransform(resizing.range, axes=1, impl=impl)
+            fourier = FourierTransform(resizing.range, axes=1)
             fourier = fourier * resizing
         else:
-            fourier = FourierTransform(ray_trafo.range, axes=1, impl=impl)
+            fourier = FourierTransform(ray_trafo.range, axes=1)
 
     elif ray_trafo.domain.ndim == 3:
         # Find the direction that the filter should be taken in
@@ -447,10 +446,10 @@ def fbp_filter_op(ray_trafo, padding=True, filter_type='Ram-Lak',
                        padded_shape_v)
             resizing = ResizingOperator(ray_trafo.range, ran_shp=ran_shp)
 
-            fourier = FourierTransform(resizing.range, axes=axes, impl=impl)
+            fourier = FourierTransform(resizing.range, axes=axes)
             fourier = fourier * resizing
         else:
-            fourier = FourierTransform(ray_trafo.range, axes=axes, impl=impl)
+            fourier = FourierTransform(ray_trafo.range, axes=axes)
     else:
         raise NotImplementedError('FBP only implemented in 2d and 3d')
 
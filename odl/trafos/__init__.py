@@ -15,11 +15,21 @@ __all__ = ()
 from . import util
 
 from . import backends
-from .backends import PYFFTW_AVAILABLE, PYWT_AVAILABLE
-__all__ += (PYFFTW_AVAILABLE, PYWT_AVAILABLE)
+from .backends import (
+    PYFFTW_AVAILABLE, PYWT_AVAILABLE, SCIPY_FFT_AVAILABLE)
+__all__ += (PYFFTW_AVAILABLE, PYWT_AVAILABLE, SCIPY_FFT_AVAILABLE)
 
 from .fourier import *
 __all__ += fourier.__all__
 
 from .wavelet import *
 __all__ += wavelet.__all__
+
+from .trigonometric import *
+__all__ += trigonometric.__all__
+
+from .nufft import *
+__all__ += nufft.__all__
+
+from .convolution import *
+__all__ += convolution.__all__
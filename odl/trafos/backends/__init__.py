@@ -15,5 +15,8 @@ __all__ = ()
 from . pyfftw_bindings import *
 __all__ += pyfftw_bindings.__all__
 
+from . scipy_fft_bindings import *
+__all__ += scipy_fft_bindings.__all__
+
 from . pywt_bindings import *
 __all__ += pywt_bindings.__all__
@@ -14,7 +14,11 @@ Fourier transforms.
 """
 
 from __future__ import print_function, division, absolute_import
+import atexit
+from collections import OrderedDict
 from multiprocessing import cpu_count
+import os
+import threading
 import numpy as np
 from packaging.version import parse as parse_version
 import warnings
@@ -33,7 +37,159 @@ else:
 from odl.util import (
     is_real_dtype, dtype_repr, complex_dtype, normalized_axes_tuple)
 
-__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE')
+__all__ = ('pyfftw_call', 'PYFFTW_AVAILABLE', 'fftw_wisdom_file',
+           'load_fftw_wisdom', 'save_fftw_wisdom', 'clear_fftw_plan_cache')
+
+
+# Global cache of idle FFTW plans, shared by all callers of `pyfftw_call`.
+# Each key maps to a list of ``(plan, input_array, output_array)`` tuples,
+# which are checked out for the duration of a call, such that concurrent
+# calls with the same key use different plans. The plans own their
+# (internal) arrays, hence the total number of cached plans is bounded,
+# and the least recently used ones are evicted first. The lock only
+# protects the dictionary and the flags below.
+_FFTW_PLAN_CACHE = OrderedDict()
+_FFTW_PLAN_CACHE_SIZE = 32
+_FFTW_PLAN_CACHE_LOCK = threading.Lock()
+_FFTW_WISDOM_LOADED = False
+_FFTW_WISDOM_SAVE_AT_EXIT = False
+
+
+def fftw_wisdom_file():
+    """Return the default file for storing FFTW wisdom.
+
+    The file is ``fftw_wisdom.pkl`` in the ODL home directory, given by
+    the ``ODL_HOME`` environment variable and defaulting to ``~/.odl``.
+    """
+    base_odl_dir = os.environ.get('ODL_HOME',
+                                  os.path.expanduser(os.path.join('~',
+                                                                  '.odl')))
+    return os.path.join(base_odl_dir, 'fftw_wisdom.pkl')
+
+
+def load_fftw_wisdom(fname=None):
+    """Import FFTW wisdom from a file.
+
+    Parameters
+    ----------
+    fname : str, optional
+        File to load the wisdom from. ``None`` means `fftw_wisdom_file`.
+
+    Returns
+    -------
+    success : bool
+        ``True`` if wisdom was imported, ``False`` if the file does not
+        exist or cannot be read.
+    """
+    import pickle
+
+    if fname is None:
+        fname = fftw_wisdom_file()
+
+    try:
+        with open(fname, 'rb') as wfile:
+            wisdom = pickle.load(wfile)
+    except (IOError, OSError, EOFError, pickle.UnpicklingError):
+        return False
+
+    return any(pyfftw.import_wisdom(wisdom))
+
+
+def save_fftw_wisdom(fname=None):
+    """Export the accumulated FFTW wisdom to a file.
+
+    The file is replaced atomically, such that concurrent processes
+    never read a partially written file.
+
+    Parameters
+    ----------
+    fname : str, optional
+        File to store the wisdom in. ``None`` means `fftw_wisdom_file`.
+        Missing parent directories are created.
+    """
+    import pickle
+    import tempfile
+
+    if fname is None:
+        fname = fftw_wisdom_file()
+
+    dirname = os.path.dirname(os.path.abspath(fname))
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+
+    fd, tmp_fname = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as wfile:
+            pickle.dump(pyfftw.export_wisdom(), wfile)
+        os.rename(tmp_fname, fname)
+    except Exception:
+        os.remove(tmp_fname)
+        raise
+
+
+def clear_fftw_plan_cache():
+    """Remove all plans from the global FFTW plan cache."""
+    with _FFTW_PLAN_CACHE_LOCK:
+        _FFTW_PLAN_CACHE.clear()
+
+
+def _is_simd_aligned(arr):
+    """Return ``True`` if ``arr`` is aligned for SIMD instructions."""
+    return arr.ctypes.data % pyfftw.simd_alignment == 0
+
+
+def _plan_cache_key(array_in, array_out, axes, halfcomplex, direction,
+                    threads, flags):
+    """Return the key for ``_FFTW_PLAN_CACHE``, or ``None``.
+
+    Besides the transform parameters, the key contains the alignment of
+    the arrays, since an ``pyfftw.FFTW`` object can only be reused for
+    arrays with the same memory layout. Cached plans use internal
+    C-contiguous arrays, hence ``None`` is returned for other layouts and
+    for partially overlapping arrays, which are not cached.
+    """
+    if not (array_in.flags.c_contiguous and array_out.flags.c_contiguous):
+        return None
+
+    in_place = np.may_share_memory(array_in, array_out)
+    if in_place and not (array_in.ctypes.data == array_out.ctypes.data and
+                         array_in.shape == array_out.shape and
+                         array_in.dtype == array_out.dtype):
+        return None
+
+    return (array_in.shape, array_in.dtype, _is_simd_aligned(array_in),
+            array_out.shape, array_out.dtype, _is_simd_aligned(array_out),
+            in_place, axes, halfcomplex, direction, threads, tuple(flags))
+
+
+def _checkout_cached_plan(key):
+    """Remove an idle plan entry for ``key`` from the cache and return it.
+
+    If there is no idle plan, ``None`` is returned.
+    """
+    with _FFTW_PLAN_CACHE_LOCK:
+        plans = _FFTW_PLAN_CACHE.get(key)
+        if not plans:
+            return None
+        return plans.pop()
+
+
+def _return_cached_plan(key, cache_entry):
+    """Put ``cache_entry`` back into the cache and evict old plans."""
+    with _FFTW_PLAN_CACHE_LOCK:
+        plans = _FFTW_PLAN_CACHE.pop(key, [])
+        plans.append(cache_entry)
+        _FFTW_PLAN_CACHE[key] = plans  # most recently used
+
+        num_plans = sum(len(key_plans)
+                        for key_plans in _FFTW_PLAN_CACHE.values())
+        while num_plans > _FFTW_PLAN_CACHE_SIZE:
+            oldest_key = next(iter(_FFTW_PLAN_CACHE))
+            oldest_plans = _FFTW_PLAN_CACHE[oldest_key]
+            oldest_plans.pop(0)
+            if not oldest_plans:
+                del _FFTW_PLAN_CACHE[oldest_key]
+            num_plans -= 1
 
 
 def pyfftw_call(array_in, array_out, direction='forward', axes=None,
@@ -102,6 +258,16 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
         it is ignored.
     export_wisdom : filename or file handle, optional
         File to append the accumulated FFTW wisdom to
+    use_plan_cache : bool, optional
+        If ``True``, look up plans in and add new plans to a global cache
+        shared by all calls in this process. Before the first plan is
+        created, wisdom is imported from `fftw_wisdom_file`. If a plan
+        with a planning effort other than ``'estimate'`` is created, the
+        accumulated wisdom is saved to that file when the interpreter
+        exits. This way, other operators and processes reuse tuned plans
+        without measuring again. Use `save_fftw_wisdom` to save it
+        earlier.
+        Default: ``True``
 
     Returns
     -------
@@ -128,6 +294,11 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
       use ``'estimate'``.
     * If a plan is provided via the ``fftw_plan`` parameter, no copy
       is needed internally.
+    * Cached plans are keyed by shapes, data types, memory layout, axes,
+      ``halfcomplex``, ``direction``, ``threads`` and ``planning_effort``.
+      They are created on internal arrays, hence they do not keep the
+      arrays of the caller alive. Only C-contiguous arrays use the cache.
+      Use `clear_fftw_plan_cache` to release the memory held by them.
     """
     import pickle
 
@@ -151,6 +322,7 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
     normalise_idft = kwargs.pop('normalise_idft', False)
     wimport = kwargs.pop('import_wisdom', '')
     wexport = kwargs.pop('export_wisdom', '')
+    use_plan_cache = kwargs.pop('use_plan_cache', True)
 
     # Cast input to complex if necessary
     array_in_copied = False
@@ -195,14 +367,39 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
             else:
                 threads = cpu_count()
 
-        fftw_plan = pyfftw.FFTW(
-            plan_arr_in, array_out, direction=_local_to_pyfftw(direction),
-            flags=flags, planning_timelimit=planning_timelimit,
-            threads=threads, axes=axes)
+        if use_plan_cache:
+            key = _plan_cache_key(array_in, array_out, axes, halfcomplex,
+                                  direction, threads, flags)
+        else:
+            key = None
+
+        if key is not None:
+            # Plans are stateful, hence a plan is used by only one call
+            # at a time. Concurrent calls create additional plans.
+            cache_entry = _checkout_cached_plan(key)
+            if cache_entry is None:
+                fftw_plan = _create_cached_plan(
+                    array_in, array_out, direction, flags,
+                    planning_timelimit, threads, axes, planning_effort)
+                cache_entry = (fftw_plan, fftw_plan.input_array,
+                               fftw_plan.output_array)
+            fftw_plan, plan_arr_in, plan_arr_out = cache_entry
+            try:
+                fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
+            finally:
+                # Switch back to the internal arrays, such that the cache
+                # does not keep the arrays of the caller alive
+                fftw_plan.update_arrays(plan_arr_in, plan_arr_out)
+                _return_cached_plan(key, cache_entry)
+        else:
+            fftw_plan = pyfftw.FFTW(
+                plan_arr_in, array_out, direction=_local_to_pyfftw(direction),
+                flags=flags, planning_timelimit=planning_timelimit,
+                threads=threads, axes=axes)
+            fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
     else:
         fftw_plan = fftw_plan_in
-
-    fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
+        fftw_plan(array_in, array_out, normalise_idft=normalise_idft)
 
     if wexport:
         try:
@@ -214,6 +411,55 @@ def pyfftw_call(array_in, array_out, direction='forward', axes=None,
     return fftw_plan
 
 
+def _create_cached_plan(array_in, array_out, direction, flags,
+                        planning_timelimit, threads, axes, planning_effort):
+    """Create a plan on internal arrays using the wisdom file.
+
+    The internal arrays have the same shapes, data types and alignment
+    as ``array_in`` and ``array_out``, and they are the same array if
+    ``array_in`` and ``array_out`` are.
+    """
+    global _FFTW_WISDOM_LOADED, _FFTW_WISDOM_SAVE_AT_EXIT
+
+    with _FFTW_PLAN_CACHE_LOCK:
+        if not _FFTW_WISDOM_LOADED:
+            load_fftw_wisdom()
+            _FFTW_WISDOM_LOADED = True
+
+    plan_arr_in = pyfftw.empty_aligned(array_in.shape, array_in.dtype)
+    if array_out is array_in or np.may_share_memory(array_in, array_out):
+        plan_arr_out = plan_arr_in
+    else:
+        plan_arr_out = pyfftw.empty_aligned(array_out.shape,
+                                            array_out.dtype)
+
+    # Plans for unaligned arrays must not use SIMD instructions
+    if not (_is_simd_aligned(array_in) and _is_simd_aligned(array_out)):
+        flags = list(flags) + ['FFTW_UNALIGNED']
+
+    fftw_plan = pyfftw.FFTW(
+        plan_arr_in, plan_arr_out, direction=_local_to_pyfftw(direction),
+        flags=flags, planning_timelimit=planning_timelimit,
+        threads=threads, axes=axes)
+
+    if planning_effort != 'estimate':
+        with _FFTW_PLAN_CACHE_LOCK:
+            if not _FFTW_WISDOM_SAVE_AT_EXIT:
+                atexit.register(_save_fftw_wisdom_at_exit)
+                _FFTW_WISDOM_SAVE_AT_EXIT = True
+
+    return fftw_plan
+
+
+def _save_fftw_wisdom_at_exit():
+    """Save the accumulated FFTW wisdom, warning on failure."""
+    try:
+        save_fftw_wisdom()
+    except (IOError, OSError) as err:
+        warnings.warn('failed to save FFTW wisdom: {}'.format(err),
+                      RuntimeWarning)
+
+
 def _pyfftw_to_local(flag):
     return flag.lstrip('FFTW_').lower()
 
@@ -0,0 +1,139 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Bindings to the ``scipy.fft`` back-end for Fourier transforms.
+
+The `scipy.fft
+<https://docs.scipy.org/doc/scipy/reference/fft.html>`_ module (SciPy
+1.6 and later) provides multithreaded FFTs via its ``workers`` parameter
+and supports all normalization conventions needed in ODL.
+"""
+
+from __future__ import print_function, division, absolute_import
+from packaging.version import parse as parse_version
+
+try:
+    import scipy
+    if parse_version(scipy.__version__) < parse_version('1.6.0'):
+        # Older versions lack `scipy.fft` or its `norm='forward'` option
+        raise ImportError
+    import scipy.fft
+    SCIPY_FFT_AVAILABLE = True
+except ImportError:
+    SCIPY_FFT_AVAILABLE = False
+
+from odl.trafos.backends.pyfftw_bindings import _pyfftw_check_args
+from odl.util import is_real_dtype, complex_dtype, normalized_axes_tuple
+
+__all__ = ('scipy_fft_call', 'SCIPY_FFT_AVAILABLE')
+
+
+def scipy_fft_call(array_in, array_out, direction='forward', axes=None,
+                   halfcomplex=False, **kwargs):
+    """Calculate the DFT with ``scipy.fft``.
+
+    The transform computes the same sums as `pyfftw_call`, i.e., the
+    backward transform is not normalized unless ``normalise_idft=True``
+    is given.
+
+    Parameters
+    ----------
+    array_in : `numpy.ndarray`
+        Array to be transformed
+    array_out : `numpy.ndarray`
+        Output array storing the transformed values, may be aliased
+        with ``array_in``.
+    direction : {'forward', 'backward'}, optional
+        Direction of the transform
+    axes : int or sequence of ints, optional
+        Dimensions along which to take the transform. ``None`` means
+        using all axes and is equivalent to ``np.arange(ndim)``.
+    halfcomplex : bool, optional
+        If ``True``, calculate only the negative frequency part along the
+        last axis. If ``False``, calculate the full complex FFT.
+        This option can only be used with real input data.
+
+    Other Parameters
+    ----------------
+    workers : int, optional
+        Number of threads to use. Negative values count from the number
+        of CPUs, i.e., ``-1`` means all CPUs.
+        Default: All CPUs if the number of data points is larger
+        than 4096, else 1.
+    normalise_idft : bool, optional
+        If ``True``, the result of the backward transform is divided by
+        ``1 / N``, where ``N`` is the total number of points in
+        ``array_in[axes]``.
+        Default: ``False``
+    overwrite_input : bool, optional
+        If ``True``, the contents of ``array_in`` may be destroyed,
+        which can save a copy internally.
+        Default: ``False``
+
+    Returns
+    -------
+    array_out : `numpy.ndarray`
+        The transformed array, a reference to the given ``array_out``.
+
+    See Also
+    --------
+    odl.trafos.backends.pyfftw_bindings.pyfftw_call
+    """
+    if axes is None:
+        axes = tuple(range(array_in.ndim))
+    axes = normalized_axes_tuple(axes, array_in.ndim)
+
+    workers = kwargs.pop('workers', None)
+    normalise_idft = kwargs.pop('normalise_idft', False)
+    overwrite_input = kwargs.pop('overwrite_input', False)
+    if kwargs:
+        raise TypeError('got unexpected keyword arguments: {}'
+                        ''.format(kwargs))
+
+    if workers is None:
+        workers = 1 if array_in.size <= 4096 else -1
+
+    if direction not in ('forward', 'backward'):
+        raise ValueError("`direction` '{}' not understood"
+                         "".format(direction))
+
+    # Cast input to complex if necessary, the copy can be overwritten
+    if is_real_dtype(array_in.dtype) and not halfcomplex:
+        array_in = array_in.astype(complex_dtype(array_in.dtype))
+        overwrite_input = True
+
+    _pyfftw_check_args(array_in, array_out, axes, halfcomplex, direction)
+
+    if direction == 'forward':
+        if halfcomplex:
+            result = scipy.fft.rfftn(array_in, axes=axes, workers=workers,
+                                     overwrite_x=overwrite_input)
+        else:
+            result = scipy.fft.fftn(array_in, axes=axes, workers=workers,
+                                    overwrite_x=overwrite_input)
+    else:
+        # `norm='forward'` puts the scaling into the forward transform,
+        # i.e., the backward transform is unnormalized
+        norm = 'backward' if normalise_idft else 'forward'
+        if halfcomplex:
+            s = [array_out.shape[i] for i in axes]
+            result = scipy.fft.irfftn(array_in, s=s, axes=axes, norm=norm,
+                                      workers=workers,
+                                      overwrite_x=overwrite_input)
+        else:
+            result = scipy.fft.ifftn(array_in, axes=axes, norm=norm,
+                                     workers=workers,
+                                     overwrite_x=overwrite_input)
+
+    array_out[:] = result
+    return array_out
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests(skip_if=not SCIPY_FFT_AVAILABLE)
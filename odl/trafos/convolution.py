@@ -0,0 +1,447 @@
+# Copyright 2014-2018 The ODL contributors
+#
+# This file is part of ODL.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Discrete convolution with automatic choice of the algorithm."""
+
+from __future__ import print_function, division, absolute_import
+from itertools import product
+import numpy as np
+import scipy.ndimage
+
+from odl.discr import DiscreteLp
+from odl.operator import Operator
+from odl.space.weighting import ConstWeighting
+from odl.trafos.backends.scipy_fft_bindings import SCIPY_FFT_AVAILABLE
+from odl.util import (
+    is_real_dtype, is_complex_floating_dtype, array_str, signature_string,
+    indent)
+from odl.util.numerics import resize_array, _SUPPORTED_RESIZE_PAD_MODES
+
+if SCIPY_FFT_AVAILABLE:
+    import scipy.fft as _fft_backend
+    from scipy.fft import next_fast_len
+else:
+    _fft_backend = np.fft
+    from scipy.fftpack import next_fast_len
+
+__all__ = ('Convolution',)
+
+
+_SUPPORTED_CONV_METHODS = ('direct', 'fft', 'overlap_add')
+
+
+def _separable_factors(kernel):
+    """Return 1d factors of ``kernel`` if it is separable, else ``None``.
+
+    The factors are taken as the lines through the entry with largest
+    magnitude and scaled such that their outer product is ``kernel``.
+    """
+    if kernel.ndim < 2:
+        return None
+
+    peak = np.unravel_index(np.argmax(np.abs(kernel)), kernel.shape)
+    peak_val = kernel[peak]
+    if peak_val == 0:
+        return None
+
+    factors = []
+    for axis in range(kernel.ndim):
+        slc = list(peak)
+        slc[axis] = slice(None)
+        factors.append(kernel[tuple(slc)] / peak_val)
+    factors[0] = factors[0] * peak_val
+
+    outer = factors[0]
+    for factor in factors[1:]:
+        outer = np.multiply.outer(outer, factor)
+    if np.allclose(outer, kernel, rtol=0,
+                   atol=1e-6 * np.abs(peak_val)):
+        return factors
+    else:
+        return None
+
+
+def _fft_cost(size):
+    """Rough flop count of an FFT of the given total size."""
+    return 2.5 * size * np.log2(max(size, 2))
+
+
+def _overlap_add_block_shape(data_shape, kernel_shape):
+    """Return the FFT block shape used in overlap-add."""
+    return tuple(min(next_fast_len(max(4 * k, 64)),
+                     next_fast_len(n + k - 1))
+                 for n, k in zip(data_shape, kernel_shape))
+
+
+def _convolution_costs(data_shape, kernel_shape, separable):
+    """Return estimated flop counts of all convolution methods.
+
+    Parameters
+    ----------
+    data_shape : sequence of ints
+        Shape of the (padded) input to the valid convolution.
+    kernel_shape : sequence of ints
+        Shape of the convolution kernel.
+    separable : bool
+        Whether the kernel is separable.
+
+    Returns
+    -------
+    costs : dict
+        Estimated cost per method in `_SUPPORTED_CONV_METHODS`.
+    """
+    out_shape = [n - k + 1 for n, k in zip(data_shape, kernel_shape)]
+    out_size = np.prod(out_shape)
+
+    if separable:
+        direct = 2.0 * out_size * np.sum(kernel_shape)
+    else:
+        direct = 2.0 * out_size * np.prod(kernel_shape)
+
+    # The kernel spectrum is cached, only one forward and one inverse
+    # transform plus the pointwise product are needed
+    fft_size = np.prod([next_fast_len(n) for n in data_shape])
+    fft = 2 * _fft_cost(fft_size) + 6.0 * fft_size
+
+    block_shape = _overlap_add_block_shape(data_shape, kernel_shape)
+    block_size = np.prod(block_shape)
+    num_blocks = np.prod([int(np.ceil(n / (b - k + 1)))
+                          for n, b, k in zip(data_shape, block_shape,
+                                             kernel_shape)])
+    # Account for the Python loop overhead per block
+    overlap_add = num_blocks * (2 * _fft_cost(block_size) +
+                                8.0 * block_size + 1e4)
+
+    return {'direct': direct, 'fft': fft, 'overlap_add': overlap_add}
+
+
+def _correlate_valid(arr, weights, axis=None):
+    """Return the 'valid' part of the correlation of ``arr`` and ``weights``.
+
+    If ``axis`` is given, ``weights`` is one-dimensional and applied
+    along that axis. Complex arrays are split into real and imaginary
+    parts since `scipy.ndimage` only supports real data.
+    """
+    if is_complex_floating_dtype(arr.dtype):
+        return (_correlate_valid(arr.real, weights, axis) +
+                1j * _correlate_valid(arr.imag, weights, axis))
+    if is_complex_floating_dtype(weights.dtype):
+        return (_correlate_valid(arr, weights.real, axis) +
+                1j * _correlate_valid(arr, weights.imag, axis))
+
+    # The results are centered at `k // 2`, the boundary mode does not
+    # affect the valid part
+    if axis is None:
+        result = scipy.ndimage.correlate(arr, weights, mode='constant')
+        return result[tuple(slice(k // 2, k // 2 + n - k + 1)
+                            for n, k in zip(arr.shape, weights.shape))]
+    else:
+        n, k = arr.shape[axis], len(weights)
+        result = scipy.ndimage.correlate1d(arr, weights, axis=axis,
+                                           mode='constant')
+        slc = [slice(None)] * arr.ndim
+        slc[axis] = slice(k // 2, k // 2 + n - k + 1)
+        return result[tuple(slc)]
+
+
+def _convolve_valid(arr, kernel, method, spectra, factors=None):
+    """Return the 'valid' part of the convolution of ``arr`` and ``kernel``.
+
+    Parameters
+    ----------
+    arr : `numpy.ndarray`
+        Array to be convolved, at least as large as ``kernel`` in each
+        axis.
+    kernel : `numpy.ndarray`
+        Convolution kernel.
+    method : str
+        Method from `_SUPPORTED_CONV_METHODS`.
+    spectra : dict
+        Cache for kernel spectra, indexed by FFT shape.
+    factors : sequence of `numpy.ndarray`, optional
+        One-dimensional factors of a separable ``kernel``, used by the
+        ``'direct'`` method.
+
+    Returns
+    -------
+    result : `numpy.ndarray`
+        Array of shape ``arr.shape - kernel.shape + 1``.
+    """
+    out_shape = tuple(n - k + 1 for n, k in zip(arr.shape, kernel.shape))
+    real = is_real_dtype(arr.dtype) and is_real_dtype(kernel.dtype)
+    fftn = _fft_backend.rfftn if real else _fft_backend.fftn
+
+    def kernel_spectrum(shape):
+        if shape not in spectra:
+            spectra[shape] = fftn(kernel, shape)
+        return spectra[shape]
+
+    def ifftn(spectrum, shape):
+        if real:
+            return _fft_backend.irfftn(spectrum, shape)
+        else:
+            return _fft_backend.ifftn(spectrum, shape)
+
+    if method == 'direct':
+        if factors is None:
+            flip = (slice(None, None, -1),) * kernel.ndim
+            return _correlate_valid(arr, kernel[flip])
+        result = arr
+        for axis, factor in enumerate(factors):
+            result = _correlate_valid(result, factor[::-1], axis)
+        return result
+
+    elif method == 'fft':
+        # Circular convolution of at least the input size leaves the
+        # valid part unaffected by wrap-around
+        shape = tuple(next_fast_len(n) for n in arr.shape)
+        result = ifftn(fftn(arr, shape) * kernel_spectrum(shape), shape)
+        return result[tuple(slice(k - 1, n)
+                            for k, n in zip(kernel.shape, arr.shape))]
+
+    elif method == 'overlap_add':
+        block_shape = _overlap_add_block_shape(arr.shape, kernel.shape)
+        step = tuple(b - k + 1 for b, k in zip(block_shape, kernel.shape))
+        spectrum = kernel_spectrum(block_shape)
+        result = np.zeros(out_shape, dtype=np.result_type(arr, kernel))
+
+        for start in product(*[range(0, n, s)
+                               for n, s in zip(arr.shape, step)]):
+            block = arr[tuple(slice(i, i + s) for i, s in zip(start, step))]
+            conv = ifftn(fftn(block, block_shape) * spectrum, block_shape)
+
+            # The full convolution of the block covers the global
+            # indices `start + m`, of which those in the valid part
+            # `[k - 1, n)` are kept, shifted to `start + m - (k - 1)`.
+            src, dst = [], []
+            for i, b, k, n in zip(start, block.shape, kernel.shape,
+                                  arr.shape):
+                lo = max(i, k - 1)
+                hi = min(i + b + k - 1, n)
+                src.append(slice(lo - i, hi - i))
+                dst.append(slice(lo - (k - 1), hi - (k - 1)))
+            result[tuple(dst)] += conv[tuple(src)]
+
+        return result
+
+    else:
+        raise ValueError('`method` {!r} not understood'.format(method))
+
+
+class Convolution(Operator):
+
+    """Discrete convolution with a fixed kernel.
+
+    For a kernel ``k`` with ``K_i`` entries in axis ``i``, this operator
+    computes ::
+
+        out[n] = sum_j k[j] * x[n - j + c]
+
+    with center ``c = (K - 1) // 2``, i.e., the output has the same
+    shape as the input and is aligned as for ``mode='same'`` in
+    `scipy.signal.convolve`, also for kernels of even size. Values
+    outside of the domain are extended according to ``pad_mode``.
+
+    The operator chooses the fastest of three algorithms based on a cost
+    model:
+
+    - ``'direct'``: Direct summation, applied as a sequence of 1d
+      convolutions if the kernel is separable,
+    - ``'fft'``: Multiplication in frequency space using one FFT of the
+      padded input,
+    - ``'overlap_add'``: Block-wise FFT convolution, favorable for small
+      kernels on large inputs.
+
+    Kernel spectra are computed once and cached.
+
+    Notes
+    -----
+    The convolution is defined on the level of arrays, i.e., it is the
+    sum over the kernel entries without a cell volume factor. To
+    approximate the continuous convolution ``(k * f)(x)``, scale the
+    kernel by ``domain.cell_volume``.
+    """
+
+    def __init__(self, domain, kernel, pad_mode='constant', method=None):
+        """Initialize a new instance.
+
+        Parameters
+        ----------
+        domain : `DiscreteLp`
+            Uniformly discretized space of functions to convolve.
+        kernel : `DiscreteLpElement` or `array-like`
+            Convolution kernel with the same number of dimensions as
+            ``domain``, at most as large as ``domain`` in each axis.
+        pad_mode : str, optional
+            How values outside the domain are extended, see
+            `ResizingOperator` for the options. The ``'constant'`` mode
+            pads with zeros.
+        method : {'direct', 'fft', 'overlap_add'}, optional
+            Algorithm used for the convolution. ``None`` selects the
+            method with the lowest estimated cost.
+
+        Examples
+        --------
+        Blur with a small kernel, using the nearest boundary values
+        outside of the domain:
+
+        >>> space = odl.uniform_discr(0, 5, 5)
+        >>> conv = odl.trafos.Convolution(space, [1, 2, 1],
+        ...                               pad_mode='order0')
+        >>> print(conv([0, 0, 1, 0, 4]))
+        [  0.,   1.,   2.,   5.,  12.]
+
+        For such a small kernel, direct summation is cheapest:
+
+        >>> conv.method
+        'direct'
+        """
+        if not isinstance(domain, DiscreteLp):
+            raise TypeError('`domain` {!r} is not a `DiscreteLp` instance'
+                            ''.format(domain))
+        if not domain.is_uniform:
+            raise ValueError('`domain` {!r} is not uniformly discretized'
+                             ''.format(domain))
+
+        kernel = np.array(kernel, copy=True, ndmin=1)
+        if kernel.ndim != domain.ndim:
+            raise ValueError('`kernel` has {} dimensions, expected {}'
+                             ''.format(kernel.ndim, domain.ndim))
+        if any(k > n for k, n in zip(kernel.shape, domain.shape)):
+            raise ValueError('`kernel` shape {} is larger than `domain` '
+                             'shape {}'.format(kernel.shape, domain.shape))
+        if (is_complex_floating_dtype(kernel.dtype) and
+                is_real_dtype(domain.dtype)):
+            raise ValueError('complex `kernel` cannot be used with real '
+                             '`domain` {!r}'.format(domain))
+        kernel = kernel.astype(domain.dtype)
+
+        pad_mode, pad_mode_in = str(pad_mode).lower(), pad_mode
+        if pad_mode not in _SUPPORTED_RESIZE_PAD_MODES:
+            raise ValueError("`pad_mode` '{}' not understood"
+                             "".format(pad_mode_in))
+
+        if method is not None:
+            method, method_in = str(method).lower(), method
+            if method not in _SUPPORTED_CONV_METHODS:
+                raise ValueError('`method` {!r} not understood'
+                                 ''.format(method_in))
+
+        super(Convolution, self).__init__(domain, domain, linear=True)
+        self.__kernel = kernel
+        self.__pad_mode = pad_mode
+        self.__factors = _separable_factors(kernel)
+        self.__padded_shape = tuple(
+            n + k - 1 for n, k in zip(domain.shape, kernel.shape))
+        # Padding to the left, such that the kernel center (k - 1) // 2 is
+        # aligned, i.e., k - 1 - (k - 1) // 2 = k // 2
+        self.__pad_offset = tuple(k // 2 for k in kernel.shape)
+
+        if method is None:
+            costs = _convolution_costs(self.__padded_shape, kernel.shape,
+                                       self.__factors is not None)
+            method = min(_SUPPORTED_CONV_METHODS, key=costs.get)
+        self.__method = method
+        self.__spectra = {}
+
+    @property
+    def kernel(self):
+        """The convolution kernel as array."""
+        return self.__kernel
+
+    @property
+    def pad_mode(self):
+        """How values outside the domain are extended."""
+        return self.__pad_mode
+
+    @property
+    def method(self):
+        """Algorithm used to compute the convolution."""
+        return self.__method
+
+    @property
+    def is_separable(self):
+        """``True`` if the kernel is an outer product of 1d kernels."""
+        return self.__factors is not None
+
+    def _call(self, x, out):
+        """Convolve ``x`` with the kernel and write to ``out``."""
+        padded = resize_array(x.asarray(), self.__padded_shape,
+                              offset=self.__pad_offset,
+                              pad_mode=self.pad_mode)
+        out[:] = _convolve_valid(padded, self.kernel, self.method,
+                                 self.__spectra, self.__factors)
+
+    @property
+    def adjoint(self):
+        """Adjoint of this operator, the correlation with the kernel.
+
+        Returns
+        -------
+        adjoint : `Operator`
+            Full convolution with the flipped and conjugated kernel,
+            followed by the adjoint of the padding.
+
+        Raises
+        ------
+        NotImplementedError
+            If the domain is not weighted by a constant.
+        """
+        if not isinstance(self.domain.weighting, ConstWeighting):
+            raise NotImplementedError('adjoint only implemented for '
+                                      'constant weighting')
+
+        op = self
+        flip = (slice(None, None, -1),) * self.domain.ndim
+        kernel_adj = self.kernel[flip].conj()
+        if self.__factors is None:
+            factors_adj = None
+        else:
+            factors_adj = [f[::-1].conj() for f in self.__factors]
+        zero_pad_shape = tuple(n + 2 * (k - 1) for n, k in
+                               zip(self.domain.shape, self.kernel.shape))
+        zero_pad_offset = tuple(k - 1 for k in self.kernel.shape)
+        pad_offset = self.__pad_offset
+        spectra_adj = {}
+
+        class ConvolutionAdjoint(Operator):
+
+            """Adjoint of the convolution operator."""
+
+            def _call(self, y, out):
+                """Correlate ``y`` with the kernel and write to ``out``."""
+                padded = resize_array(y.asarray(), zero_pad_shape,
+                                      offset=zero_pad_offset)
+                full = _convolve_valid(padded, kernel_adj, op.method,
+                                       spectra_adj, factors_adj)
+                out[:] = resize_array(full, op.domain.shape,
+                                      offset=pad_offset,
+                                      pad_mode=op.pad_mode,
+                                      direction='adjoint')
+
+            @property
+            def adjoint(self):
+                """Adjoint of this operator."""
+                return op
+
+        return ConvolutionAdjoint(self.range, self.domain, linear=True)
+
+    def __repr__(self):
+        """Return ``repr(self)``."""
+        posargs = [self.domain, self.kernel]
+        optargs = [('pad_mode', self.pad_mode, 'constant'),
+                   ('method', self.method, None)]
+        inner_str = signature_string(posargs, optargs, sep=',\n',
+                                     mod=[['!r', array_str], '!r'])
+        return '{}(\n{}\n)'.format(self.__class__.__name__,
+                                   indent(inner_str))
+
+
+if __name__ == '__main__':
+    from odl.util.testutils import run_doctests
+    run_doctests()
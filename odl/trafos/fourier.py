@@ -16,9 +16,12 @@ from odl.operator import Operator
 from odl.set import RealNumbers, ComplexNumbers
 from odl.trafos.backends.pyfftw_bindings import (
     pyfftw_call, PYFFTW_AVAILABLE, _pyfftw_to_local)
-from odl.trafos.util import (
-    reciprocal_grid, reciprocal_space,
-    dft_preprocess_data, dft_postprocess_data)
+from odl.trafos.backends.scipy_fft_bindings import (
+    scipy_fft_call, SCIPY_FFT_AVAILABLE)
+from odl.trafos.util import reciprocal_grid, reciprocal_space
+from odl.trafos.util.ft_utils import (
+    _dft_preprocess_factors, _dft_postprocess_factors, _broadcast_factors,
+    _multiply_factors)
 from odl.util import (is_real_dtype, is_complex_floating_dtype,
                       dtype_repr, conj_exponent, complex_dtype,
                       normalized_scalar_param_list, normalized_axes_tuple)
@@ -33,6 +36,24 @@ _DEFAULT_FOURIER_IMPL = 'numpy'
 if PYFFTW_AVAILABLE:
     _SUPPORTED_FOURIER_IMPLS += ('pyfftw',)
     _DEFAULT_FOURIER_IMPL = 'pyfftw'
+if SCIPY_FFT_AVAILABLE:
+    _SUPPORTED_FOURIER_IMPLS += ('scipy',)
+    _DEFAULT_FOURIER_IMPL = 'scipy'
+
+
+def _scipy_fft_kwargs(kwargs):
+    """Return the keyword arguments for `scipy_fft_call` from ``kwargs``.
+
+    Planning options meant for the ``'pyfftw'`` backend are ignored, and
+    ``threads`` is accepted as an alias for ``workers``.
+    """
+    for key in ('fftw_plan', 'flags', 'planning_effort',
+                'planning_timelimit', 'import_wisdom', 'export_wisdom',
+                'use_plan_cache'):
+        kwargs.pop(key, None)
+    if 'threads' in kwargs:
+        kwargs.setdefault('workers', kwargs.pop('threads'))
+    return kwargs
 
 
 class DiscreteFourierTransformBase(Operator):
@@ -74,9 +95,10 @@ class DiscreteFourierTransformBase(Operator):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw', ``None``}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'pyfftw', 'scipy', ``None``}, optional
+            Backend for the FFT implementation. The 'pyfftw' and 'scipy'
+            backends are faster and multithreaded but require the
+            ``pyfftw`` package or SciPy 1.6 or later, respectively.
             ``None`` selects the fastest available backend.
         """
         if not isinstance(domain, DiscreteLp):
@@ -155,18 +177,22 @@ class DiscreteFourierTransformBase(Operator):
 
         Notes
         -----
-        See the ``pyfftw_call`` function for ``**kwargs`` options.
-        The parameters ``axes`` and ``halfcomplex`` cannot be
-        overridden.
+        See the ``pyfftw_call`` and ``scipy_fft_call`` functions for
+        ``**kwargs`` options. The parameters ``axes`` and ``halfcomplex``
+        cannot be overridden.
 
         See Also
         --------
         odl.trafos.backends.pyfftw_bindings.pyfftw_call :
             Call pyfftw backend directly
+        odl.trafos.backends.scipy_fft_bindings.scipy_fft_call :
+            Call scipy.fft backend directly
         """
         # TODO: Implement zero padding
         if self.impl == 'numpy':
             out[:] = self._call_numpy(x.asarray())
+        elif self.impl == 'scipy':
+            out[:] = self._call_scipy(x.asarray(), out.asarray(), **kwargs)
         else:
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
 
@@ -280,13 +306,34 @@ class DiscreteFourierTransformBase(Operator):
         effort = flags[0] if flags else 'measure'
 
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        # The returned plan is not stored since it may come from the
+        # global plan cache, where it is handed out to one call at a time
+        pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
             fftw_plan=self._fftw_plan, normalise_idft=False)
 
         return out
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x, out[, **kwargs])`` using scipy.fft.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Input array to be transformed
+        out : `numpy.ndarray`
+            Output array storing the result
+        workers : int, optional
+            Number of threads to use, see ``scipy_fft_call``.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transform, a reference to ``out``.
+        """
+        raise NotImplementedError('abstract method')
+
     def init_fftw_plan(self, planning_effort='measure', **kwargs):
         """Initialize the FFTW plan for this transform for later use.
 
@@ -314,7 +361,11 @@ class DiscreteFourierTransformBase(Operator):
         Notes
         -----
         To save memory, clear the plan when the transform is no longer
-        used (the plan stores 2 arrays).
+        used (the plan stores 2 arrays). The plan is owned by this
+        transform and not added to the global plan cache, hence it must
+        not be used by concurrent calls. Without an initialized plan,
+        calls use plans from the global cache, see
+        `odl.trafos.backends.pyfftw_bindings.clear_fftw_plan_cache`.
 
         See Also
         --------
@@ -327,6 +378,9 @@ class DiscreteFourierTransformBase(Operator):
         y = self.range.element()
         kwargs.pop('planning_timelimit', None)
 
+        # Create a private plan, a plan from the global cache may be in
+        # use by other calls
+        kwargs['use_plan_cache'] = False
         direction = 'forward' if self.sign == '-' else 'backward'
         self._fftw_plan = pyfftw_call(
             x.asarray(), y.asarray(), direction=direction,
@@ -407,9 +461,10 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
             arrays.
             Otherwise, calculate the full complex FFT. If ``dom_dtype``
             is a complex type, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The ``'pyfftw'`` backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'pyfftw', 'scipy'}, optional
+            Backend for the FFT implementation. The ``'pyfftw'`` and
+            ``'scipy'`` backends are faster and multithreaded but require
+            the ``pyfftw`` package or SciPy 1.6 or later, respectively.
             ``None`` selects the fastest available backend.
 
         Examples
@@ -485,13 +540,32 @@ class DiscreteFourierTransform(DiscreteFourierTransformBase):
         effort = flags[0] if flags else 'measure'
 
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        # The returned plan is not stored since it may come from the
+        # global plan cache, where it is handed out to one call at a time
+        pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
             fftw_plan=self._fftw_plan, normalise_idft=False)
 
         return out
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x, out[, **kwargs])`` using scipy.fft.
+
+        See Also
+        --------
+        DiscreteFourierTransformBase._call_scipy
+        """
+        kwargs.pop('axes', None)
+        kwargs.pop('halfcomplex', None)
+        kwargs.pop('normalise_idft', None)  # Using `False` here
+
+        direction = 'forward' if self.sign == '-' else 'backward'
+        return scipy_fft_call(
+            x, out, direction=direction, axes=self.axes,
+            halfcomplex=self.halfcomplex, normalise_idft=False,
+            **_scipy_fft_kwargs(kwargs))
+
     @property
     def inverse(self):
         """Inverse Fourier transform."""
@@ -558,9 +632,10 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
             ``floor(N[i]/2) + 1`` in this axis ``i``.
             Otherwise, domain and range have the same shape. If
             ``range`` is a complex space, this option has no effect.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'pyfftw', 'scipy'}, optional
+            Backend for the FFT implementation. The 'pyfftw' and 'scipy'
+            backends are faster and multithreaded but require the
+            ``pyfftw`` package or SciPy 1.6 or later, respectively.
             ``None`` selects the fastest available backend.
 
         Examples
@@ -662,7 +737,9 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
         effort = flags[0] if flags else 'measure'
 
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        # The returned plan is not stored since it may come from the
+        # global plan cache, where it is handed out to one call at a time
+        pyfftw_call(
             x, out, direction=direction, axes=self.axes,
             halfcomplex=self.halfcomplex, planning_effort=effort,
             fftw_plan=self._fftw_plan, normalise_idft=True)
@@ -673,6 +750,29 @@ class DiscreteFourierTransformInverse(DiscreteFourierTransformBase):
 
         return out
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x, out[, **kwargs])`` using scipy.fft.
+
+        See Also
+        --------
+        DiscreteFourierTransformBase._call_scipy
+        """
+        kwargs.pop('axes', None)
+        kwargs.pop('halfcomplex', None)
+        kwargs.pop('normalise_idft', None)  # Using `True` here
+
+        direction = 'forward' if self.sign == '-' else 'backward'
+        scipy_fft_call(
+            x, out, direction=direction, axes=self.axes,
+            halfcomplex=self.halfcomplex, normalise_idft=True,
+            **_scipy_fft_kwargs(kwargs))
+
+        # Need to normalize for 'forward'
+        if self.sign == '-':
+            out /= np.prod(np.take(self.domain.shape, self.axes))
+
+        return out
+
     @property
     def inverse(self):
         """Inverse Fourier transform."""
@@ -728,9 +828,10 @@ class FourierTransformBase(Operator):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'pyfftw', 'scipy'}, optional
+            Backend for the FFT implementation. The 'pyfftw' and 'scipy'
+            backends are faster and multithreaded but require the
+            ``pyfftw`` package or SciPy 1.6 or later, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -749,7 +850,7 @@ class FourierTransformBase(Operator):
             is applied separately to each axis.
             If a sequence is provided, it must have the same length as
             ``axes`` if supplied. Note that this must be set to ``True``
-            in the halved axis in half-complex transforms.
+            in all axes in half-complex transforms.
             Default: ``True``
 
         Other Parameters
@@ -835,10 +936,12 @@ class FourierTransformBase(Operator):
 
         # Need to filter out this situation since the pre-processing step
         # casts to complex otherwise, and then no half-complex transform
-        # is possible.
-        if self.halfcomplex and not self.shifts[-1]:
-            raise ValueError('`shift` must be `True` in the halved (last) '
-                             'axis in half-complex transforms')
+        # is possible. This concerns all axes, not only the halved one,
+        # since the pre-processing factors of unshifted axes are complex.
+        if self.halfcomplex and not all(self.shifts):
+            raise ValueError('`shift` must be `True` in all axes in '
+                             'half-complex transforms, got {}'
+                             ''.format(self.shifts))
 
         # Storing temporaries directly as arrays
         tmp_r = kwargs.pop('tmp_r', None)
@@ -872,6 +975,10 @@ class FourierTransformBase(Operator):
         self._tmp_r = tmp_r
         self._tmp_f = tmp_f
 
+        # Pre- and post-processing factors, computed when first needed
+        self._preproc_factors = None
+        self._postproc_factors = None
+
     def _call(self, x, out, **kwargs):
         """Implement ``self(x, out[, **kwargs])``.
 
@@ -884,18 +991,23 @@ class FourierTransformBase(Operator):
 
         Notes
         -----
-        See the ``pyfftw_call`` function for ``**kwargs`` options.
-        The parameters ``axes`` and ``halfcomplex`` cannot be
-        overridden.
+        See the ``pyfftw_call`` and ``scipy_fft_call`` functions for
+        ``**kwargs`` options. The parameters ``axes`` and ``halfcomplex``
+        cannot be overridden.
 
         See Also
         --------
         odl.trafos.backends.pyfftw_bindings.pyfftw_call :
             Call pyfftw backend directly
+        odl.trafos.backends.scipy_fft_bindings.scipy_fft_call :
+            Call scipy.fft backend directly
         """
         # TODO: Implement zero padding
         if self.impl == 'numpy':
             out[:] = self._call_numpy(x.asarray())
+        elif self.impl == 'scipy':
+            # 0-overhead assignment if asarray() does not copy
+            out[:] = self._call_scipy(x.asarray(), out.asarray(), **kwargs)
         else:
             # 0-overhead assignment if asarray() does not copy
             out[:] = self._call_pyfftw(x.asarray(), out.asarray(), **kwargs)
@@ -942,6 +1054,26 @@ class FourierTransformBase(Operator):
         """
         raise NotImplementedError('abstract method')
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x, out[, **kwargs])`` for scipy.fft back-end.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`
+            Array representing the function to be transformed
+        out : `numpy.ndarray`
+            Array to which the output is written
+        workers : int, optional
+            Number of threads to use, see ``scipy_fft_call``.
+
+        Returns
+        -------
+        out : `numpy.ndarray`
+            Result of the transform. The returned object is a reference
+            to the input parameter ``out``.
+        """
+        raise NotImplementedError('abstract method')
+
     @property
     def impl(self):
         """Backend for the FFT implementation."""
@@ -1064,7 +1196,11 @@ class FourierTransformBase(Operator):
         Notes
         -----
         To save memory, clear the plan when the transform is no longer
-        used (the plan stores 2 arrays).
+        used (the plan stores 2 arrays). The plan is owned by this
+        transform and not added to the global plan cache, hence it must
+        not be used by concurrent calls. Without an initialized plan,
+        calls use plans from the global cache, see
+        `odl.trafos.backends.pyfftw_bindings.clear_fftw_plan_cache`.
 
         See Also
         --------
@@ -1117,6 +1253,9 @@ class FourierTransformBase(Operator):
 
         kwargs.pop('planning_timelimit', None)
 
+        # Create a private plan, a plan from the global cache may be in
+        # use by other calls
+        kwargs['use_plan_cache'] = False
         direction = 'forward' if self.sign == '-' else 'backward'
         self._fftw_plan = pyfftw_call(
             arr_in, arr_out, direction=direction,
@@ -1181,9 +1320,10 @@ class FourierTransform(FourierTransformBase):
             is determined from ``domain`` and the other parameters. The
             exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'pyfftw', 'scipy'}, optional
+            Backend for the FFT implementation. The 'pyfftw' and 'scipy'
+            backends are faster and multithreaded but require the
+            ``pyfftw`` package or SciPy 1.6 or later, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1202,7 +1342,7 @@ class FourierTransform(FourierTransformBase):
             is applied separately to each axis.
             If a sequence is provided, it must have the same length as
             ``axes`` if supplied. Note that this must be set to ``True``
-            in the halved axis in half-complex transforms.
+            in all axes in half-complex transforms.
             Default: ``True``
 
         Other Parameters
@@ -1256,6 +1396,17 @@ class FourierTransform(FourierTransformBase):
         The result is stored in ``out`` if given, otherwise in
         a temporary or a new array.
         """
+        if self._preproc_factors is None:
+            # Real factors (-1)^k if all axes are shifted, else complex
+            if all(self.shifts):
+                dtype = self.domain.real_dtype
+            else:
+                dtype = self.range.dtype
+            onedim_arrs = _dft_preprocess_factors(
+                self.domain.shape, self.shifts, self.axes, self.sign, dtype)
+            self._preproc_factors = _broadcast_factors(
+                onedim_arrs, self.axes, self.domain.ndim)
+
         if out is None:
             if self.domain.field == ComplexNumbers():
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
@@ -1263,9 +1414,10 @@ class FourierTransform(FourierTransformBase):
                 out = self._tmp_f
             else:
                 out = self._tmp_r
-        return dft_preprocess_data(
-            x, shift=self.shifts, axes=self.axes, sign=self.sign,
-            out=out)
+        if out is None:
+            dtype = np.result_type(x, *self._preproc_factors)
+            out = np.empty(x.shape, dtype=dtype)
+        return _multiply_factors(x, self._preproc_factors, out=out)
 
     def _postprocess(self, x, out=None):
         """Return the post-processed version of ``x``.
@@ -1277,15 +1429,21 @@ class FourierTransform(FourierTransformBase):
         The result is stored in ``out`` if given, otherwise in
         a temporary or a new array.
         """
+        if self._postproc_factors is None:
+            onedim_arrs = _dft_postprocess_factors(
+                self.domain.grid, self.range.grid, self.shifts, self.axes,
+                self.domain.interp, self.sign, 'multiply', self.range.dtype)
+            self._postproc_factors = _broadcast_factors(
+                onedim_arrs, self.axes, self.range.ndim)
+
         if out is None:
             if self.domain.field == ComplexNumbers():
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
             else:
                 out = self._tmp_f
-        return dft_postprocess_data(
-            out, real_grid=self.domain.grid, recip_grid=self.range.grid,
-            shift=self.shifts, axes=self.axes, sign=self.sign,
-            interp=self.domain.interp, op='multiply', out=out)
+        if out is None:
+            out = np.empty(x.shape, dtype=self.range.dtype)
+        return _multiply_factors(x, self._postproc_factors, out=out)
 
     def _call_numpy(self, x):
         """Return ``self(x)`` for numpy back-end.
@@ -1363,11 +1521,11 @@ class FourierTransform(FourierTransformBase):
             preproc = self._preprocess(x, out=out)
             assert is_complex_floating_dtype(preproc.dtype)
 
-        # The actual call to the FFT library. We store the plan for re-use.
+        # The actual call to the FFT library, using the global plan cache.
         # The FFT is calculated in-place, except if the range is real and
         # we don't use halfcomplex.
         direction = 'forward' if self.sign == '-' else 'backward'
-        self._fftw_plan = pyfftw_call(
+        pyfftw_call(
             preproc, out, direction=direction, halfcomplex=self.halfcomplex,
             axes=self.axes, normalise_idft=False, **kwargs)
 
@@ -1378,6 +1536,34 @@ class FourierTransform(FourierTransformBase):
         assert is_complex_floating_dtype(out.dtype)
         return out
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x, out[, **kwargs])`` for scipy.fft back-end.
+
+        See Also
+        --------
+        FourierTransformBase._call_scipy
+        """
+        kwargs.pop('axes', None)
+        kwargs.pop('halfcomplex', None)
+        kwargs.pop('normalise_idft', None)  # We use `False`
+
+        # Pre-processing, in-place for C2C and R2C
+        if self.halfcomplex:
+            preproc = self._preprocess(x)
+        else:
+            preproc = self._preprocess(x, out=out)
+
+        # The pre-processed array is never `x` itself, hence the FFT may
+        # use it as work array
+        direction = 'forward' if self.sign == '-' else 'backward'
+        scipy_fft_call(
+            preproc, out, direction=direction, halfcomplex=self.halfcomplex,
+            axes=self.axes, normalise_idft=False, overwrite_input=True,
+            **_scipy_fft_kwargs(kwargs))
+
+        # Post-processing accounting for shift, scaling and interpolation
+        return self._postprocess(out, out=out)
+
     @property
     def inverse(self):
         """The inverse Fourier transform."""
@@ -1417,9 +1603,10 @@ class FourierTransformInverse(FourierTransformBase):
             domain is determined from ``range`` and the other parameters.
             The exponent is chosen to be the conjugate ``p / (p - 1)``,
             which reads as 'inf' for p=1 and 1 for p='inf'.
-        impl : {'numpy', 'pyfftw'}, optional
-            Backend for the FFT implementation. The 'pyfftw' backend
-            is faster but requires the ``pyfftw`` package.
+        impl : {'numpy', 'pyfftw', 'scipy'}, optional
+            Backend for the FFT implementation. The 'pyfftw' and 'scipy'
+            backends are faster and multithreaded but require the
+            ``pyfftw`` package or SciPy 1.6 or later, respectively.
             ``None`` selects the fastest available backend.
         axes : int or sequence of ints, optional
             Dimensions along which to take the transform.
@@ -1438,7 +1625,7 @@ class FourierTransformInverse(FourierTransformBase):
             is applied separately to each axis.
             If a sequence is provided, it must have the same length as
             ``axes`` if supplied. Note that this must be set to ``True``
-            in the halved axis in half-complex transforms.
+            in all axes in half-complex transforms.
             Default: ``True``
 
         Other Parameters
@@ -1496,15 +1683,21 @@ class FourierTransformInverse(FourierTransformBase):
         The result is stored in ``out`` if given, otherwise in
         a temporary or a new array.
         """
+        if self._preproc_factors is None:
+            onedim_arrs = _dft_postprocess_factors(
+                self.range.grid, self.domain.grid, self.shifts, self.axes,
+                self.range.interp, self.sign, 'divide', self.domain.dtype)
+            self._preproc_factors = _broadcast_factors(
+                onedim_arrs, self.axes, self.domain.ndim)
+
         if out is None:
             if self.range.field == ComplexNumbers():
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
             else:
                 out = self._tmp_f
-        return dft_postprocess_data(
-            x, real_grid=self.range.grid, recip_grid=self.domain.grid,
-            shift=self.shifts, axes=self.axes, sign=self.sign,
-            interp=self.domain.interp, op='divide', out=out)
+        if out is None:
+            out = np.empty(x.shape, dtype=self.domain.dtype)
+        return _multiply_factors(x, self._preproc_factors, out=out)
 
     def _postprocess(self, x, out=None):
         """Return the post-processed version of ``x``.
@@ -1514,8 +1707,20 @@ class FourierTransformInverse(FourierTransformBase):
         HALFC: use ``tmp_r`` (R2R operation)
 
         The result is stored in ``out`` if given, otherwise in
-        a temporary or a new array.
+        a temporary or a new array. If ``x`` is complex and ``out`` is
+        real (C2R), ``x`` is overwritten with intermediate results.
         """
+        if self._postproc_factors is None:
+            # Real factors (-1)^k if all axes are shifted, else complex
+            if all(self.shifts):
+                dtype = self.range.real_dtype
+            else:
+                dtype = self.domain.dtype
+            onedim_arrs = _dft_preprocess_factors(
+                self.range.shape, self.shifts, self.axes, self.sign, dtype)
+            self._postproc_factors = _broadcast_factors(
+                onedim_arrs, self.axes, self.range.ndim)
+
         if out is None:
             if self.range.field == ComplexNumbers():
                 out = self._tmp_r if self._tmp_r is not None else self._tmp_f
@@ -1523,8 +1728,17 @@ class FourierTransformInverse(FourierTransformBase):
                 out = self._tmp_f
             else:  # halfcomplex
                 out = self._tmp_r
-        return dft_preprocess_data(
-            x, shift=self.shifts, axes=self.axes, sign=self.sign, out=out)
+        if out is None:
+            dtype = np.result_type(x, *self._postproc_factors)
+            out = np.empty(x.shape, dtype=dtype)
+
+        if is_real_dtype(out.dtype) and not is_real_dtype(x.dtype):
+            # Multiply in complex arithmetic, then discard the imaginary part
+            _multiply_factors(x, self._postproc_factors, out=x)
+            out[:] = x.real
+            return out
+        else:
+            return _multiply_factors(x, self._postproc_factors, out=out)
 
     def _call_numpy(self, x):
         """Return ``self(x)`` for numpy back-end.
@@ -1606,19 +1820,19 @@ class FourierTransformInverse(FourierTransformBase):
         else:
             preproc = self._preprocess(x)
 
-        # The actual call to the FFT library. We store the plan for re-use.
+        # The actual call to the FFT library, using the global plan cache.
         direction = 'forward' if self.sign == '-' else 'backward'
         if self.range.field == RealNumbers() and not self.halfcomplex:
             # Need to use a complex array as out if we do C2R since the
             # FFT has to be C2C
-            self._fftw_plan = pyfftw_call(
+            pyfftw_call(
                 preproc, preproc, direction=direction,
                 halfcomplex=self.halfcomplex, axes=self.axes,
                 normalise_idft=True, **kwargs)
             fft_arr = preproc
         else:
             # Only here we can use out directly
-            self._fftw_plan = pyfftw_call(
+            pyfftw_call(
                 preproc, out, direction=direction,
                 halfcomplex=self.halfcomplex, axes=self.axes,
                 normalise_idft=True, **kwargs)
@@ -1635,6 +1849,45 @@ class FourierTransformInverse(FourierTransformBase):
         self._postprocess(fft_arr, out=out)
         return out
 
+    def _call_scipy(self, x, out, **kwargs):
+        """Implement ``self(x, out[, **kwargs])`` for scipy.fft back-end.
+
+        See Also
+        --------
+        FourierTransformBase._call_scipy
+        """
+        kwargs.pop('axes', None)
+        kwargs.pop('halfcomplex', None)
+        kwargs.pop('normalise_idft', None)  # We use `True`
+        kwargs = _scipy_fft_kwargs(kwargs)
+
+        # Pre-processing in IFT = post-processing in FT, in-place for C2C
+        if self.range.field == ComplexNumbers():
+            preproc = self._preprocess(x, out=out)
+        else:
+            preproc = self._preprocess(x)
+
+        # For C2R, the FFT has to be C2C, so it is computed in-place in
+        # the complex array
+        if self.range.field == RealNumbers() and not self.halfcomplex:
+            fft_arr = preproc
+        else:
+            fft_arr = out
+
+        direction = 'forward' if self.sign == '-' else 'backward'
+        scipy_fft_call(
+            preproc, fft_arr, direction=direction,
+            halfcomplex=self.halfcomplex, axes=self.axes,
+            normalise_idft=True, overwrite_input=True, **kwargs)
+
+        # Normalization is only done for 'backward'
+        if self.sign == '-':
+            fft_arr /= np.prod(np.take(self.domain.shape, self.axes))
+
+        # Post-processing in IFT = pre-processing in FT
+        self._postprocess(fft_arr, out=out)
+        return out
+
     @property
     def inverse(self):
         """Inverse of the inverse, the forward FT."""
@@ -327,6 +327,34 @@ def dft_preprocess_data(arr, shift=True, axes=None, sign='-', out=None):
         raise ValueError('cannot pre-process real input in-place without '
                          'shift')
 
+    onedim_arrs = _dft_preprocess_factors(shape, shift_list, axes, sign,
+                                          out.dtype)
+    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
+    return out
+
+
+def _dft_preprocess_factors(shape, shift_list, axes, sign, dtype):
+    """Return the 1d factors used in `dft_preprocess_data`.
+
+    Parameters
+    ----------
+    shape : sequence of ints
+        Shape of the array to be pre-processed.
+    shift_list : sequence of bools
+        Shift per axis in ``axes``.
+    axes : sequence of ints
+        Dimensions in which the transform is calculated.
+    sign : {'-', '+'}
+        Sign of the complex exponent.
+    dtype :
+        Data type of the factors. For real data types, all entries
+        of ``shift_list`` must be ``True``.
+
+    Returns
+    -------
+    onedim_arrs : list of `numpy.ndarray`
+        One factor per axis in ``axes``.
+    """
     if sign == '-':
         imag = -1j
     elif sign == '+':
@@ -337,21 +365,16 @@ def dft_preprocess_data(arr, shift=True, axes=None, sign='-', out=None):
     def _onedim_arr(length, shift):
         if shift:
             # (-1)^indices
-            factor = np.ones(length, dtype=out.dtype)
+            factor = np.ones(length, dtype=dtype)
             factor[1::2] = -1
         else:
-            factor = np.arange(length, dtype=out.dtype)
+            factor = np.arange(length, dtype=dtype)
             factor *= -imag * np.pi * (1 - 1.0 / length)
             np.exp(factor, out=factor)
-        return factor.astype(out.dtype, copy=False)
-
-    onedim_arrs = []
-    for axis, shift in zip(axes, shift_list):
-        length = shape[axis]
-        onedim_arrs.append(_onedim_arr(length, shift))
+        return factor.astype(dtype, copy=False)
 
-    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
-    return out
+    return [_onedim_arr(shape[axis], shift)
+            for axis, shift in zip(axes, shift_list)]
 
 
 def _interp_kernel_ft(norm_freqs, interp):
@@ -482,6 +505,41 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
     shift_list = normalized_scalar_param_list(shift, length=len(axes),
                                               param_conv=bool)
 
+    onedim_arrs = _dft_postprocess_factors(real_grid, recip_grid, shift_list,
+                                           axes, interp, sign, op, out.dtype)
+    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
+    return out
+
+
+def _dft_postprocess_factors(real_grid, recip_grid, shift_list, axes,
+                             interp, sign, op, dtype):
+    """Return the 1d factors used in `dft_postprocess_data`.
+
+    Parameters
+    ----------
+    real_grid : uniform `RectGrid`
+        Real space grid in the transform.
+    recip_grid : uniform `RectGrid`
+        Reciprocal grid in the transform.
+    shift_list : sequence of bools
+        Shift per axis in ``axes``.
+    axes : sequence of ints
+        Dimensions along which to take the transform.
+    interp : string or sequence of strings
+        Interpolation scheme used in the real-space.
+    sign : {'-', '+'}
+        Sign of the complex exponent.
+    op : {'multiply', 'divide'}
+        Operation to perform with the stride times the interpolation
+        kernel FT.
+    dtype :
+        Complex data type of the factors.
+
+    Returns
+    -------
+    onedim_arrs : list of `numpy.ndarray`
+        One factor per axis in ``axes``.
+    """
     if sign == '-':
         imag = -1j
     elif sign == '+':
@@ -495,7 +553,7 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
 
     # Make a list from interp if that's not the case already
     if is_string(interp):
-        interp = [str(interp).lower()] * arr.ndim
+        interp = [str(interp).lower()] * real_grid.ndim
 
     onedim_arrs = []
     for ax, shift, intp in zip(axes, shift_list, interp):
@@ -541,9 +599,70 @@ def dft_postprocess_data(arr, real_grid, recip_grid, shift, axes,
         else:
             onedim_arr /= interp_kernel
 
-        onedim_arrs.append(onedim_arr.astype(out.dtype, copy=False))
+        onedim_arrs.append(onedim_arr.astype(dtype, copy=False))
 
-    fast_1d_tensor_mult(out, onedim_arrs, axes=axes, out=out)
+    return onedim_arrs
+
+
+def _broadcast_factors(onedim_arrs, axes, ndim):
+    """Return few broadcastable factors equivalent to ``onedim_arrs``.
+
+    The 1d arrays in all ``axes`` except the first one are combined
+    into a single factor of reduced dimension, and the remaining 1d
+    array is reshaped for broadcasting. For large arrays, this allows
+    multiplying with the outer product of ``onedim_arrs`` in two passes
+    without building a full-size factor, see `_multiply_factors`.
+
+    Parameters
+    ----------
+    onedim_arrs : sequence of `numpy.ndarray`
+        One-dimensional factors, one per axis in ``axes``.
+    axes : sequence of ints
+        Axes corresponding to ``onedim_arrs``.
+    ndim : int
+        Number of dimensions of the arrays to be multiplied.
+
+    Returns
+    -------
+    factors : list of `numpy.ndarray`
+        At most two arrays that can be broadcast against arrays
+        with ``ndim`` dimensions.
+    """
+    axes = [int(ax) + ndim if ax < 0 else int(ax) for ax in axes]
+
+    def _bcast(arr, ax):
+        slc = [None] * ndim
+        slc[ax] = slice(None)
+        return arr[tuple(slc)]
+
+    # Spare the outermost axis (largest stride in C order)
+    i_outer = int(np.argmin(axes))
+    factors = []
+    if len(axes) > 1:
+        factor = np.array(1.0, dtype=onedim_arrs[0].dtype)
+        for i, (ax, arr) in enumerate(zip(axes, onedim_arrs)):
+            if i != i_outer:
+                factor = factor * _bcast(arr, ax)
+        factors.append(factor)
+
+    factors.append(_bcast(onedim_arrs[i_outer], axes[i_outer]))
+    return factors
+
+
+def _multiply_factors(arr, factors, out):
+    """Write ``arr`` times the product of ``factors`` to ``out``.
+
+    This is a single pass over ``arr`` and ``out`` per factor, without
+    additional copies or temporary arrays. ``out`` may be ``arr``.
+    Complex factors cannot be written to a real ``out``.
+    """
+    if is_real_dtype(out.dtype) and not all(is_real_dtype(factor.dtype)
+                                            for factor in factors):
+        raise TypeError('cannot multiply with complex factors in real '
+                        'output array of dtype {}'.format(out.dtype))
+    np.multiply(arr, factors[0], out=out)
+    for factor in factors[1:]:
+        out *= factor
     return out
 
 
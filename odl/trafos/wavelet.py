@@ -9,6 +9,9 @@
 """Discrete wavelet transformation on L2 spaces."""
 
 from __future__ import print_function, division, absolute_import
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from threading import Lock
 
 import numpy as np
 from odl.discr import DiscreteLp
@@ -16,6 +19,7 @@ from odl.operator import Operator
 from odl.trafos.backends.pywt_bindings import (
     PYWT_AVAILABLE,
     pywt_pad_mode, pywt_wavelet, precompute_raveled_slices)
+from odl.util import normalized_axes_tuple, writable_array
 
 __all__ = ('WaveletTransform', 'WaveletTransformInverse')
 
@@ -26,6 +30,23 @@ if PYWT_AVAILABLE:
     import pywt
 
 
+# Minimum number of data points for which the batch transform is
+# distributed to several threads by default
+_MIN_SIZE_FOR_THREADS = 2 ** 16
+
+_THREAD_POOL = None
+_THREAD_POOL_LOCK = Lock()
+
+
+def _thread_pool():
+    """Return a thread pool shared by all wavelet transforms."""
+    global _THREAD_POOL
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None:
+            _THREAD_POOL = ThreadPool(cpu_count())
+    return _THREAD_POOL
+
+
 class WaveletTransformBase(Operator):
 
     """Base class for discrete wavelet transforms.
@@ -35,7 +56,7 @@ class WaveletTransformBase(Operator):
     """
 
     def __init__(self, space, wavelet, nlevels, variant, pad_mode='constant',
-                 pad_const=0, impl='pywt', axes=None):
+                 pad_const=0, impl='pywt', axes=None, threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -133,6 +154,10 @@ class WaveletTransformBase(Operator):
             ``len(axes)`` dimensions looped over the non-transformed axes. In
             orther words, filtering and decimation does not occur along any
             axes not in ``axes``.
+        threads : positive int, optional
+            Number of threads used to transform slices along the first
+            axis not in ``axes`` in parallel. ``None`` means using all
+            CPUs for large inputs and 1 otherwise.
 
         References
         ----------
@@ -170,6 +195,31 @@ class WaveletTransformBase(Operator):
         self.__pad_mode = str(pad_mode).lower()
         self.__pad_const = space.field.element(pad_const)
 
+        ndim = space.ndim
+        batch_axes = [i for i in range(ndim)
+                      if i not in normalized_axes_tuple(self.axes, ndim)]
+        if threads is None:
+            threads = cpu_count() if space.size >= _MIN_SIZE_FOR_THREADS else 1
+        self.__threads, threads_in = int(threads), threads
+        if self.threads != threads_in or self.threads < 1:
+            raise ValueError('`threads` must be a positive integer, got {}'
+                             ''.format(threads_in))
+
+        # Slices of the image along the first non-transformed axis, which
+        # are transformed independently
+        if batch_axes and self.threads > 1:
+            batch_ax = batch_axes[0]
+            bounds = np.linspace(0, space.shape[batch_ax],
+                                 min(self.threads, space.shape[batch_ax]) + 1)
+            bounds = bounds.astype(int)
+            self._batch_slices = []
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                slc = [slice(None)] * ndim
+                slc[batch_ax] = slice(start, stop)
+                self._batch_slices.append(tuple(slc))
+        else:
+            self._batch_slices = [(slice(None),) * ndim]
+
         if self.impl == 'pywt':
             self.pywt_pad_mode = pywt_pad_mode(pad_mode, pad_const)
             self.pywt_wavelet = pywt_wavelet(self.wavelet)
@@ -222,6 +272,49 @@ class WaveletTransformBase(Operator):
         """Value for extension used in ``'constant'`` padding mode."""
         return self.__pad_const
 
+    @property
+    def threads(self):
+        """Number of threads used for batch transforms."""
+        return self.__threads
+
+    def _coeff_views(self, coeff_arr, slc):
+        """Return views of the subbands in ``coeff_arr`` as `pywt` list.
+
+        Parameters
+        ----------
+        coeff_arr : `numpy.ndarray`
+            One-dimensional array of raveled coefficients.
+        slc : tuple of slices
+            Part of the image to which the coefficients should belong.
+
+        Returns
+        -------
+        coeffs : list
+            Approximation coefficients followed by one dictionary of
+            detail coefficients per level, in the format of
+            `pywt.wavedecn`.
+        """
+        def view(flat_slc, shape):
+            return coeff_arr[flat_slc].reshape(shape)[slc]
+
+        coeffs = [view(self._coeff_slices[0], self._coeff_shapes[0])]
+        for slices, shapes in zip(self._coeff_slices[1:],
+                                  self._coeff_shapes[1:]):
+            coeffs.append({key: view(slices[key], shapes[key])
+                           for key in slices})
+        return coeffs
+
+    def _map_batches(self, func):
+        """Apply ``func`` to all `_batch_slices`, using threads if needed.
+
+        PyWavelets releases the GIL in its filter routines, hence the
+        slices are processed in parallel.
+        """
+        if len(self._batch_slices) == 1:
+            func(self._batch_slices[0])
+        else:
+            _thread_pool().map(func, self._batch_slices)
+
     @property
     def is_orthogonal(self):
         """Whether or not the wavelet basis is orthogonal."""
@@ -267,7 +360,7 @@ class WaveletTransform(WaveletTransformBase):
     """Discrete wavelet transform between discretized Lp spaces."""
 
     def __init__(self, domain, wavelet, nlevels=None, pad_mode='constant',
-                 pad_const=0, impl='pywt', axes=None):
+                 pad_const=0, impl='pywt', axes=None, threads=None):
         """Initialize a new instance.
 
         Parameters
@@ -361,6 +454,10 @@ class WaveletTransform(WaveletTransformBase):
             ``len(axes)`` dimensions looped over the non-transformed axes. In
             orther words, filtering and decimation does not occur along any
             axes not in ``axes``.
+        threads : positive int, optional
+            Number of threads used to transform slices along the first
+            axis not in ``axes`` in parallel. ``None`` means using all
+            CPUs for large inputs and 1 otherwise.
 
         Examples
         --------
@@ -419,15 +516,31 @@ class WaveletTransform(WaveletTransformBase):
         """
         super(WaveletTransform, self).__init__(
             space=domain, wavelet=wavelet, nlevels=nlevels, variant='forward',
-            pad_mode=pad_mode, pad_const=pad_const, impl=impl, axes=axes)
+            pad_mode=pad_mode, pad_const=pad_const, impl=impl, axes=axes,
+            threads=threads)
+
+    def _call(self, x, out):
+        """Compute the wavelet transform of ``x`` and write it to ``out``.
 
-    def _call(self, x):
-        """Return wavelet transform of ``x``."""
+        The subbands are written directly into their precomputed slices
+        of ``out``.
+        """
         if self.impl == 'pywt':
-            coeffs = pywt.wavedecn(
-                x, wavelet=self.pywt_wavelet, level=self.nlevels,
-                mode=self.pywt_pad_mode, axes=self.axes)
-            return pywt.ravel_coeffs(coeffs, axes=self.axes)[0]
+            x_arr = x.asarray()
+            with writable_array(out) as out_arr:
+
+                def transform(slc):
+                    coeffs = pywt.wavedecn(
+                        x_arr[slc], wavelet=self.pywt_wavelet,
+                        level=self.nlevels, mode=self.pywt_pad_mode,
+                        axes=self.axes)
+                    views = self._coeff_views(out_arr, slc)
+                    views[0][:] = coeffs[0]
+                    for coeff_dict, view_dict in zip(coeffs[1:], views[1:]):
+                        for key in coeff_dict:
+                            view_dict[key][:] = coeff_dict[key]
+
+                self._map_batches(transform)
         else:
             raise RuntimeError("bad `impl` '{}'".format(self.impl))
 
@@ -467,7 +580,7 @@ class WaveletTransform(WaveletTransformBase):
         return WaveletTransformInverse(
             range=self.domain, wavelet=self.pywt_wavelet, nlevels=self.nlevels,
             pad_mode=self.pad_mode, pad_const=self.pad_const, impl=self.impl,
-            axes=self.axes)
+            axes=self.axes, threads=self.threads)
 
 
 class WaveletTransformInverse(WaveletTransformBase):
@@ -480,7 +593,7 @@ class WaveletTransformInverse(WaveletTransformBase):
     """
 
     def __init__(self, range, wavelet, nlevels=None, pad_mode='constant',
-                 pad_const=0, impl='pywt', axes=None):
+                 pad_const=0, impl='pywt', axes=None, threads=None):
         """Initialize a new instance.
 
          Parameters
@@ -575,6 +688,10 @@ class WaveletTransformInverse(WaveletTransformBase):
             ``len(axes)`` dimensions looped over the non-transformed axes. In
             orther words, filtering and decimation does not occur along any
             axes not in ``axes``.
+        threads : positive int, optional
+            Number of threads used to transform slices along the first
+            axis not in ``axes`` in parallel. ``None`` means using all
+            CPUs for large inputs and 1 otherwise.
 
         Examples
         --------
@@ -600,44 +717,45 @@ class WaveletTransformInverse(WaveletTransformBase):
         """
         super(WaveletTransformInverse, self).__init__(
             space=range, wavelet=wavelet, variant='inverse', nlevels=nlevels,
-            pad_mode=pad_mode, pad_const=pad_const, impl=impl, axes=axes)
+            pad_mode=pad_mode, pad_const=pad_const, impl=impl, axes=axes,
+            threads=threads)
+
+    def _call(self, coeffs, out):
+        """Compute the inverse wavelet transform and write it to ``out``.
 
-    def _call(self, coeffs):
-        """Return the inverse wavelet transform of ``coeffs``."""
+        The subbands are read as views of ``coeffs`` without copying.
+        """
         if self.impl == 'pywt':
-            coeffs = pywt.unravel_coeffs(coeffs,
-                                         coeff_slices=self._coeff_slices,
-                                         coeff_shapes=self._coeff_shapes,
-                                         output_format='wavedecn')
-            recon = pywt.waverecn(
-                coeffs, wavelet=self.pywt_wavelet, mode=self.pywt_pad_mode,
-                axes=self.axes)
-            recon_shape = self.range.shape
-            if recon.shape != recon_shape:
-                # If the original shape was odd along any transformed axes it
-                # will have been rounded up to the next even size after the
-                # reconstruction. The extra sample should be discarded.
-                # The underlying reason is decimation by two in reconstruction
-                # must keep ceil(N/2) samples in each band for perfect
-                # reconstruction. Reconstruction then upsamples by two.
-                # When N is odd, (2 * np.ceil(N/2)) != N.
-                recon_slc = []
-                for i, (n_recon, n_intended) in enumerate(zip(recon.shape,
-                                                              recon_shape)):
-                    if n_recon == n_intended + 1:
-                        # Upsampling added one entry too much in this axis,
-                        # drop last one
-                        recon_slc.append(slice(-1))
-                    elif n_recon == n_intended:
-                        recon_slc.append(slice(None))
-                    else:
-                        raise ValueError(
-                            'in axis {}: expected size {} or {} in '
-                            '`recon_shape`, got {}'
-                            ''.format(i, n_recon - 1, n_recon,
-                                      n_intended))
-                recon = recon[tuple(recon_slc)]
-            return recon
+            coeff_arr = coeffs.asarray()
+            with writable_array(out) as out_arr:
+
+                def reconstruct(slc):
+                    recon = pywt.waverecn(
+                        self._coeff_views(coeff_arr, slc),
+                        wavelet=self.pywt_wavelet, mode=self.pywt_pad_mode,
+                        axes=self.axes)
+                    out_part = out_arr[slc]
+                    # If the original shape was odd along any transformed
+                    # axes it will have been rounded up to the next even
+                    # size after the reconstruction. The extra sample
+                    # should be discarded.
+                    # The underlying reason is decimation by two in
+                    # reconstruction must keep ceil(N/2) samples in each
+                    # band for perfect reconstruction. Reconstruction then
+                    # upsamples by two. When N is odd,
+                    # (2 * np.ceil(N/2)) != N.
+                    for i, (n_recon, n_intended) in enumerate(
+                            zip(recon.shape, out_part.shape)):
+                        if n_recon not in (n_intended, n_intended + 1):
+                            raise ValueError(
+                                'in axis {}: expected size {} or {} in '
+                                '`recon_shape`, got {}'
+                                ''.format(i, n_recon - 1, n_recon,
+                                          n_intended))
+                    out_part[:] = recon[tuple(slice(n)
+                                              for n in out_part.shape)]
+
+                self._map_batches(reconstruct)
         else:
             raise RuntimeError("bad `impl` '{}'".format(self.impl))
 
@@ -681,7 +799,7 @@ class WaveletTransformInverse(WaveletTransformBase):
         return WaveletTransform(
             domain=self.range, wavelet=self.pywt_wavelet, nlevels=self.nlevels,
             pad_mode=self.pad_mode, pad_const=self.pad_const, impl=self.impl,
-            axes=self.axes)
+            axes=self.axes, threads=self.threads)
 
 
 if __name__ == '__main__':
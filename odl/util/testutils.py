@@ -23,8 +23,8 @@ from odl.util.utility import run_from_ipython, is_string
 
 __all__ = (
     'all_equal', 'all_almost_equal', 'dtype_ndigits', 'dtype_tol',
-    'never_skip', 'skip_if_no_pywavelets',
-    'skip_if_no_pyfftw', 'skip_if_no_largescale', 'noise_array',
+    'never_skip', 'skip_if_no_pywavelets', 'skip_if_no_pyfftw',
+    'skip_if_no_scipy_fft', 'skip_if_no_largescale', 'noise_array',
     'noise_element', 'noise_elements', 'Timer', 'timeit', 'ProgressBar',
     'ProgressRange', 'test', 'run_doctests', 'test_file'
 )
@@ -194,6 +194,7 @@ except ImportError:
     never_skip = _pass
     skip_if_no_pywavelets = _pass
     skip_if_no_pyfftw = _pass
+    skip_if_no_scipy_fft = _pass
     skip_if_no_largescale = _pass
     skip_if_no_benchmark = _pass
 else:
@@ -212,6 +213,10 @@ else:
         "not odl.trafos.PYFFTW_AVAILABLE",
         reason='pyFFTW not available')
 
+    skip_if_no_scipy_fft = pytest.mark.skipif(
+        "not odl.trafos.SCIPY_FFT_AVAILABLE",
+        reason='scipy.fft not available')
+
     skip_if_no_largescale = pytest.mark.skipif(
         "not pytest.config.getoption('--largescale')",
         reason='Need --largescale option to run'